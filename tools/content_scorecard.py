@@ -29,6 +29,12 @@ import re
 import sys
 from datetime import datetime
 
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from tools.scripture import find_refs, label
+
 try:
     import textstat
 except ImportError:
@@ -38,26 +44,12 @@ except ImportError:
 # -------------------------------------------------------------------
 # Configuration
 # -------------------------------------------------------------------
-OUTPUT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "output")
+OUTPUT_DIR = os.path.join(PROJECT_ROOT, "output")
 SCORECARD_PATH = os.path.join(OUTPUT_DIR, "SCORECARD.md")
 
 FK_TARGET_MIN = 16
 FK_TARGET_MAX = 18
 
-# Scripture detection pattern (handles 1/2/3 Book format)
-SCRIPTURE_RE = re.compile(
-    r'(?:1\s+|2\s+|3\s+)?'
-    r'(?:Genesis|Exodus|Leviticus|Numbers|Deuteronomy|Joshua|Judges|Ruth|'
-    r'Samuel|Kings|Chronicles|Ezra|Nehemiah|Esther|Job|Psalms?|Proverbs|'
-    r'Ecclesiastes|Song|Isaiah|Jeremiah|Lamentations|Ezekiel|Daniel|'
-    r'Hosea|Joel|Amos|Obadiah|Jonah|Micah|Nahum|Habakkuk|Zephaniah|'
-    r'Haggai|Zechariah|Malachi|Matthew|Mark|Luke|John|Acts|Romans|'
-    r'Corinthians|Galatians|Ephesians|Philippians|Colossians|'
-    r'Thessalonians|Timothy|Titus|Philemon|Hebrews|James|Peter|'
-    r'Jude|Revelation)\s+\d+[:\d\-]+',
-    re.IGNORECASE
-)
-
 # CWV metadata tag pattern: <!-- CWV: 4 -->
 CWV_TAG_RE = re.compile(r'<!--\s*CWV:\s*(\d+)\s*-->')
 
@@ -193,27 +185,14 @@ def analyze_file(filepath):
         fk_grade = 0.0
         fk_ease = 0.0
 
-    # Scripture references (search full text)
-    scripture_full = re.findall(
-        r'(?:1\s+|2\s+|3\s+)?'
-        r'(?:Genesis|Exodus|Leviticus|Numbers|Deuteronomy|Joshua|Judges|Ruth|'
-        r'Samuel|Kings|Chronicles|Ezra|Nehemiah|Esther|Job|Psalms?|Proverbs|'
-        r'Ecclesiastes|Song|Isaiah|Jeremiah|Lamentations|Ezekiel|Daniel|'
-        r'Hosea|Joel|Amos|Obadiah|Jonah|Micah|Nahum|Habakkuk|Zephaniah|'
-        r'Haggai|Zechariah|Malachi|Matthew|Mark|Luke|John|Acts|Romans|'
-        r'Corinthians|Galatians|Ephesians|Philippians|Colossians|'
-        r'Thessalonians|Timothy|Titus|Philemon|Hebrews|James|Peter|'
-        r'Jude|Revelation)\s+\d+[:\d\-]+',
-        full_text, re.IGNORECASE
-    )
-    # Deduplicate within file
+    # Scripture references (search full text), deduplicated within file
     seen = set()
     unique_scriptures = []
-    for s in scripture_full:
-        s_clean = s.strip()
-        if s_clean not in seen:
-            seen.add(s_clean)
-            unique_scriptures.append(s_clean)
+    for ref in find_refs(full_text):
+        citation = label(ref)
+        if citation not in seen:
+            seen.add(citation)
+            unique_scriptures.append(citation)
 
     # CWV level — explicit tag or estimated
     cwv_explicit = get_cwv_explicit(full_text)
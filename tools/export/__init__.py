@@ -0,0 +1 @@
+# Document Export Package
@@ -0,0 +1,130 @@
+"""
+Build Catalogue
+================
+One indexed view of tools/graphics/data/manifest.yaml for everything that
+assembles documents: insert_figures.py and both exporters.
+
+The manifest holds three sections:
+
+    chapters      course chapter export order: topic and Markdown file
+    tool_guides   tool guide export order: file, title-page name, figure ID
+    figures       every figure; chapter figures carry a 'placement'
+
+load_catalogue() parses it once per process and indexes it, so lookups by
+figure ID, figure number, topic or file are dict hits. Chapters and guides
+keep manifest order, and select_chapters()/select_guides() return subsets
+in that order.
+"""
+
+import os
+from collections import namedtuple
+
+from tools.graphics.manifest import load_manifest_document
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+MANIFEST_PATH = os.path.join(PROJECT_ROOT, 'tools', 'graphics', 'data', 'manifest.yaml')
+
+# figures: the topic's manifest entries that have a placement, in manifest order
+Chapter = namedtuple('Chapter', ['topic', 'file', 'figures'])
+# figure: the worked-example figure's manifest entry
+Guide = namedtuple('Guide', ['file', 'name', 'figure'])
+
+# Loaded catalogues: abs manifest path -> (mtime_ns, Catalogue)
+_catalogues = {}
+
+
+def topic_key(topic):
+    """Normalise a topic (1, '1', 'TG', 'tg') for lookups."""
+    return str(topic).strip().upper()
+
+
+def guide_key(name):
+    """Normalise a guide filename or stem ('EFE-Matrix.md', 'efe-matrix') for lookups."""
+    name = name.strip()
+    if name.lower().endswith('.md'):
+        name = name[:-3]
+    return name.lower()
+
+
+def figure_dir(figure):
+    """Graphics subdirectory for a figure entry (topic-N or tool-guides)."""
+    topic = topic_key(figure['topic'])
+    return 'tool-guides' if topic == 'TG' else f'topic-{topic}'
+
+
+class Catalogue:
+    """Indexed chapters, tool guides and figures from the manifest."""
+
+    def __init__(self, document):
+        self.figures = document.get('figures', [])
+        self._figures_by_id = {f['id']: f for f in self.figures}
+        self._figures_by_number = {str(f['figure_number']): f for f in self.figures}
+
+        placed = {}
+        for figure in self.figures:
+            if 'placement' in figure:
+                placed.setdefault(topic_key(figure['topic']), []).append(figure)
+
+        self.chapters = [
+            Chapter(topic_key(c['topic']), c['file'], tuple(placed.get(topic_key(c['topic']), ())))
+            for c in document.get('chapters', [])
+        ]
+        self._chapters_by_topic = {c.topic: c for c in self.chapters}
+        self._chapters_by_file = {c.file: c for c in self.chapters}
+
+        self.guides = []
+        for g in document.get('tool_guides', []):
+            if g['figure'] not in self._figures_by_id:
+                raise ValueError(f"Tool guide '{g['file']}' references unknown figure '{g['figure']}'")
+            self.guides.append(Guide(g['file'], g['name'], self._figures_by_id[g['figure']]))
+        self._guides_by_file = {guide_key(g.file): g for g in self.guides}
+
+    def figure(self, figure_id):
+        """Manifest entry for a figure ID, or None."""
+        return self._figures_by_id.get(figure_id)
+
+    def figure_by_number(self, figure_number):
+        """Manifest entry for a display number such as '3.4' or 'TG.2', or None."""
+        return self._figures_by_number.get(str(figure_number))
+
+    def chapter(self, topic):
+        """Chapter for a topic, or None."""
+        return self._chapters_by_topic.get(topic_key(topic))
+
+    def chapter_for_file(self, filename):
+        """Chapter for a Markdown filename, or None."""
+        return self._chapters_by_file.get(filename)
+
+    def guide(self, name):
+        """Tool guide for a Markdown filename or stem (any case), or None."""
+        return self._guides_by_file.get(guide_key(name))
+
+    def select_chapters(self, topics=None):
+        """Chapters for the given topics (all when None), in export order."""
+        if topics is None:
+            return list(self.chapters)
+        wanted = {topic_key(t) for t in topics}
+        return [c for c in self.chapters if c.topic in wanted]
+
+    def select_guides(self, names=None):
+        """Tool guides for the given filenames or stems (all when None), in export order."""
+        if names is None:
+            return list(self.guides)
+        wanted = {guide_key(n) for n in names}
+        return [g for g in self.guides if guide_key(g.file) in wanted]
+
+
+def load_catalogue(manifest_path=MANIFEST_PATH):
+    """
+    The catalogue for a manifest, parsed once per process.
+
+    Re-read only when the manifest's modification time changes. Callers
+    must treat the returned entries as read-only.
+    """
+    key = os.path.abspath(manifest_path)
+    mtime = os.stat(key).st_mtime_ns
+    cached = _catalogues.get(key)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, Catalogue(load_manifest_document(key)))
+        _catalogues[key] = cached
+    return cached[1]
@@ -0,0 +1,128 @@
+"""
+Fragment Cache
+===============
+Built chapter fragments kept between exports, so an edit→export loop only
+rebuilds the chapters that changed.
+
+Each chapter is stored as one zip in output/.export-cache/fragments/:
+
+    meta.json     cache key, figure count, console output, and the rIds /
+                  style ids in the order of the entries below
+    body.xml      Fragment.body_xml
+    media/N       embedded image blobs
+    styles/N.xml  serialized w:style elements
+
+The key covers the chapter source, the content hash of every figure it
+references (or the fact that it is missing), the image embedding settings
+(figure DPI from tools/graphics/config.py, palette size) and the source of
+the modules that shape the output. A hit is spliced in with append_fragment() without
+reading or tokenizing the Markdown again.
+"""
+
+import hashlib
+import json
+import os
+import zipfile
+
+from tools.export.fragments import Fragment
+from tools.export.images import embed_settings, source_sha
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+CACHE_DIR = os.path.join(PROJECT_ROOT, 'output', '.export-cache', 'fragments')
+CACHE_VERSION = 1
+
+EXPORT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Package modules whose source affects a built fragment; callers add their own
+EXPORT_SOURCES = [
+    os.path.join(EXPORT_DIR, 'markdown.py'),
+    os.path.join(EXPORT_DIR, 'images.py'),
+    os.path.join(EXPORT_DIR, 'fragments.py'),
+    os.path.join(EXPORT_DIR, 'inline.py'),
+    os.path.join(EXPORT_DIR, 'styles.py'),
+    os.path.join(EXPORT_DIR, 'tables.py'),
+]
+
+
+def _cache_path(name):
+    return os.path.join(CACHE_DIR, os.path.splitext(name)[0] + '.zip')
+
+
+def fragment_key(source, image_paths, source_paths):
+    """
+    Hash everything that determines a chapter's fragment.
+
+    Args:
+        source: the chapter's Markdown text
+        image_paths: absolute paths of the figures it references
+        source_paths: module files whose source affects the output
+
+    Returns:
+        hex digest string
+    """
+    h = hashlib.sha256(f'v{CACHE_VERSION}\0'.encode())
+    h.update(hashlib.sha256(source.encode('utf-8')).digest())
+    h.update(embed_settings().encode())
+    for path in image_paths:
+        h.update(path.encode('utf-8'))
+        h.update(source_sha(path).encode() if os.path.exists(path) else b'missing')
+    for path in source_paths:
+        with open(path, 'rb') as f:
+            h.update(hashlib.sha256(f.read()).digest())
+    return h.hexdigest()
+
+
+def _read_meta(zf, key):
+    """An entry's metadata if it matches key, else None."""
+    meta = json.loads(zf.read('meta.json'))
+    if meta.get('version') != CACHE_VERSION or meta.get('key') != key:
+        return None
+    return meta
+
+
+def has_fragment(name, key):
+    """Whether a chapter is cached under key (reads only the metadata)."""
+    try:
+        with zipfile.ZipFile(_cache_path(name)) as zf:
+            return _read_meta(zf, key) is not None
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+        return False
+
+
+def load_fragment(name, key):
+    """Cached (figures, fragment, output) for a chapter, or None on a miss."""
+    try:
+        with zipfile.ZipFile(_cache_path(name)) as zf:
+            meta = _read_meta(zf, key)
+            if meta is None:
+                return None
+            images = {rid: zf.read(f'media/{i}') for i, rid in enumerate(meta['images'])}
+            styles = {sid: zf.read(f'styles/{i}.xml') for i, sid in enumerate(meta['styles'])}
+            fragment = Fragment(zf.read('body.xml'), images, styles)
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+        return None
+    return meta['figures'], fragment, meta['output']
+
+
+def save_fragment(name, key, figures, fragment, output):
+    """Store a built chapter, replacing any previous entry atomically."""
+    meta = {
+        'version': CACHE_VERSION,
+        'key': key,
+        'figures': figures,
+        'output': output,
+        'images': list(fragment.images),
+        'styles': list(fragment.styles),
+    }
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    path = _cache_path(name)
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    # Media is already-compressed PNG; only the XML is worth deflating
+    with zipfile.ZipFile(tmp_path, 'w') as zf:
+        zf.writestr('meta.json', json.dumps(meta, indent=1), zipfile.ZIP_DEFLATED)
+        zf.writestr('body.xml', fragment.body_xml, zipfile.ZIP_DEFLATED)
+        for i, blob in enumerate(fragment.images.values()):
+            zf.writestr(f'media/{i}', blob, zipfile.ZIP_STORED)
+        for i, style_xml in enumerate(fragment.styles.values()):
+            zf.writestr(f'styles/{i}.xml', style_xml, zipfile.ZIP_DEFLATED)
+    os.replace(tmp_path, path)
@@ -0,0 +1,90 @@
+"""
+Document Fragments
+===================
+Build parts of a Word document separately (e.g. one chapter per worker
+process) and splice them into a single python-docx Document.
+
+A fragment is built in its own Document created by the same
+create_document(), so style ids and the list numbering definitions they
+reference are identical on both sides. The merge therefore only has to:
+
+    - copy any style the fragment uses that the target lacks
+    - re-add embedded images to the target and repoint r:embed ids
+    - renumber drawing ids (wp:docPr) so they stay unique
+
+Fragments are plain bytes/dicts so they can cross process boundaries.
+"""
+
+import io
+from collections import namedtuple
+
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, qn
+from lxml import etree
+
+# body_xml: serialized body children; images: {rId: blob} in document order;
+# styles: {style_id: serialized w:style}
+Fragment = namedtuple('Fragment', ['body_xml', 'images', 'styles'])
+
+_STYLE_REFS = (qn('w:pStyle'), qn('w:rStyle'), qn('w:tblStyle'))
+
+
+def extract_fragment(doc):
+    """Serialize a Document's body content, images and used styles."""
+    body = doc.element.body
+    elements = [el for el in body if el.tag != qn('w:sectPr')]
+
+    images = {}
+    style_ids = set()
+    for el in elements:
+        for blip in el.iter(qn('a:blip')):
+            rid = blip.get(qn('r:embed'))
+            if rid not in images:
+                images[rid] = doc.part.related_parts[rid].blob
+        for ref in el.iter(*_STYLE_REFS):
+            style_ids.add(ref.get(qn('w:val')))
+
+    styles = {}
+    for style_id in sorted(style_ids):
+        style = doc.styles.element.get_by_id(style_id)
+        if style is not None:
+            styles[style_id] = etree.tostring(style)
+
+    body_xml = b''.join(etree.tostring(el) for el in elements)
+    return Fragment(body_xml, images, styles)
+
+
+def append_fragment(doc, fragment):
+    """Append a fragment's content to the end of doc's body."""
+    styles = doc.styles.element
+    for style_id, style_xml in fragment.styles.items():
+        if styles.get_by_id(style_id) is None:
+            styles.append(parse_xml(style_xml))
+
+    container = parse_xml(f'<w:body {nsdecls("w")}>'.encode() + fragment.body_xml + b'</w:body>')
+
+    # Add images in document order so rIds and media names come out the
+    # same as a sequential build
+    new_rids = {}
+    for blip in container.iter(qn('a:blip')):
+        old_rid = blip.get(qn('r:embed'))
+        if old_rid not in new_rids:
+            new_rids[old_rid], _ = doc.part.get_or_add_image(io.BytesIO(fragment.images[old_rid]))
+        blip.set(qn('r:embed'), new_rids[old_rid])
+
+    body = doc.element.body
+    sect_pr = body.find(qn('w:sectPr'))
+    for el in list(container):
+        if sect_pr is not None:
+            sect_pr.addprevious(el)
+        else:
+            body.append(el)
+
+
+def renumber_drawings(doc):
+    """Give every drawing a unique, sequential wp:docPr id after merging."""
+    for shape_id, doc_pr in enumerate(doc.element.body.iter(qn('wp:docPr')), start=1):
+        doc_pr.set('id', str(shape_id))
+        # python-docx names pictures after their id
+        if doc_pr.get('name', '').startswith('Picture '):
+            doc_pr.set('name', f'Picture {shape_id}')
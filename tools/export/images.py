@@ -0,0 +1,247 @@
+"""
+Export Image Cache
+===================
+Right-sized figure copies for embedding in exported documents.
+
+Figures are rendered at 200 DPI on a page up to 10" wide, but the exporters
+scale them into a 5.8" x 7" box. Embedding the original puts ~3x the pixels
+needed into every DOCX. fit_image() returns a derivative area-averaged
+(BOX) down to the display size at the figure design DPI, plus its display
+dimensions. BOX rather than LANCZOS: the figures are flat colour and text,
+and LANCZOS ringing leaves the resized PNG deflating worse than the larger
+original. Opaque figures drop their alpha channel before resizing, which
+is both cheaper and smaller. A derivative is only used when it adds fewer
+bytes to the DOCX zip than the original would; otherwise the original is
+embedded.
+
+Palette quantization is opt-in: set EXPORT_EMBED_COLORS=256 (any 2-256) in
+the environment to reduce derivatives to that many colours (median cut, no
+dithering). That roughly halves the DOCX, but it is lossy and can band
+antialiased text and gradients.
+
+Derivatives are keyed by the source file's content hash and the target box,
+and live in output/.export-cache/images/ with an index that remembers each
+source's hash (by path, mtime and size) and each derivative's dimensions.
+Repeat exports therefore neither hash nor open unchanged figures.
+"""
+
+import hashlib
+import json
+import os
+import time
+import zlib
+from collections import namedtuple
+
+from PIL import Image
+
+from tools.graphics.config import FIGURE
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+CACHE_DIR = os.path.join(PROJECT_ROOT, 'output', '.export-cache', 'images')
+INDEX_PATH = os.path.join(CACHE_DIR, 'index.json')
+LOCK_PATH = f'{INDEX_PATH}.lock'
+INDEX_VERSION = 1
+
+# A lock older than this was left by a killed process (seconds)
+LOCK_STALE_AFTER = 30
+
+# Page box the exporters fit figures into (inches)
+MAX_WIDTH_IN = 5.8
+MAX_HEIGHT_IN = 7.0
+
+# Embedded resolution at display size; figures are designed at this DPI
+EMBED_DPI = FIGURE['dpi']
+
+# Palette size for embedded copies, or None for lossless derivatives.
+# Read from the environment so --jobs worker processes inherit it.
+_colors = os.environ.get('EXPORT_EMBED_COLORS', '').strip()
+EMBED_COLORS = min(256, max(2, int(_colors))) if _colors else None
+
+# Derivative file name suffix; changes whenever the encoding does
+EMBED_ENCODING = f'box-p{EMBED_COLORS}' if EMBED_COLORS else 'box'
+
+FittedImage = namedtuple('FittedImage', ['path', 'width_in', 'height_in'])
+
+# Loaded lazily: {abs source path: {'mtime_ns', 'size', 'sha', 'fits': {box: [...]}}}
+_index = None
+
+
+def embed_settings():
+    """Settings that change derivative pixels, for callers' cache keys."""
+    return f'dpi={EMBED_DPI};encoding={EMBED_ENCODING}'
+
+
+def _read_index():
+    try:
+        with open(INDEX_PATH, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return data['sources'] if data.get('version') == INDEX_VERSION else {}
+    except (OSError, ValueError, KeyError):
+        return {}
+
+
+def _load_index():
+    global _index
+    if _index is None:
+        _index = _read_index()
+    return _index
+
+
+def _acquire_lock():
+    """Create the index lock file, waiting while another process holds it."""
+    while True:
+        try:
+            os.close(os.open(LOCK_PATH, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            return
+        except FileExistsError:
+            try:
+                if time.time() - os.path.getmtime(LOCK_PATH) > LOCK_STALE_AFTER:
+                    os.remove(LOCK_PATH)
+                    continue
+            except OSError:
+                continue
+            time.sleep(0.01)
+
+
+def _save_index():
+    """
+    Merge this process's entries into the index on disk, then write it.
+
+    Exporter worker processes each hold their own copy of the index, so the
+    file is re-read under a lock and merged before the atomic replace;
+    otherwise concurrent writers would drop each other's entries.
+    """
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    _acquire_lock()
+    try:
+        for src_path, disk_entry in _read_index().items():
+            entry = _index.get(src_path)
+            if entry is None:
+                _index[src_path] = disk_entry
+            elif entry['sha'] == disk_entry['sha']:
+                entry['fits'] = {**disk_entry['fits'], **entry['fits']}
+        tmp_path = f'{INDEX_PATH}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': INDEX_VERSION, 'sources': _index}, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, INDEX_PATH)
+    finally:
+        os.remove(LOCK_PATH)
+
+
+def _file_sha(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _display_size(w_px, h_px, dpi, max_w, max_h):
+    """Native size in inches, scaled down to fit the box (never up)."""
+    dpi_x, dpi_y = dpi if isinstance(dpi, tuple) else (dpi, dpi)
+    w_inches = w_px / dpi_x
+    h_inches = h_px / dpi_y
+    if w_inches > max_w:
+        scale = max_w / w_inches
+        w_inches *= scale
+        h_inches *= scale
+    if h_inches > max_h:
+        scale = max_h / h_inches
+        w_inches *= scale
+        h_inches *= scale
+    return w_inches, h_inches
+
+
+def _zipped_size(path):
+    """Bytes a file takes deflated, as python-docx stores it in the DOCX."""
+    with open(path, 'rb') as f:
+        return len(zlib.compress(f.read()))
+
+
+def _make_derivative(src_path, sha, box_key, max_w, max_h):
+    """Build (or reuse) the derivative for one source and box. Returns [file, w_in, h_in]."""
+    with Image.open(src_path) as img:
+        w_px, h_px = img.size
+        dpi = img.info.get('dpi', (FIGURE['dpi'], FIGURE['dpi']))
+        w_in, h_in = _display_size(w_px, h_px, dpi, max_w, max_h)
+
+        target = (max(1, round(w_in * EMBED_DPI)), max(1, round(h_in * EMBED_DPI)))
+        if img.format != 'PNG' or target[0] >= w_px:
+            # Already at or below the embed resolution: use the original
+            return [None, w_in, h_in]
+
+        name = f'{sha[:20]}-{box_key}.png'
+        out_path = os.path.join(CACHE_DIR, name)
+        if not os.path.exists(out_path):
+            if img.mode not in ('RGB', 'RGBA'):
+                img = img.convert('RGBA')
+            if img.mode == 'RGBA' and img.getchannel('A').getextrema()[0] == 255:
+                img = img.convert('RGB')
+            resized = img.resize(target, Image.BOX)
+            if EMBED_COLORS and resized.mode == 'RGB':
+                resized = resized.quantize(EMBED_COLORS, method=Image.Quantize.MEDIANCUT,
+                                           dither=Image.Dither.NONE)
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            tmp_path = f'{out_path}.{os.getpid()}.tmp'
+            # Default zlib level: level 9 or optimize=True cost 30-50% more
+            # encode time for 2% smaller files
+            resized.save(tmp_path, format='PNG', dpi=(EMBED_DPI, EMBED_DPI))
+            os.replace(tmp_path, out_path)
+
+    if _zipped_size(out_path) >= _zipped_size(src_path):
+        return [None, w_in, h_in]
+    return [name, w_in, h_in]
+
+
+def _index_entry(src_path):
+    """Index entry for an absolute source path, re-hashed if the file changed.
+
+    Returns (entry, changed).
+    """
+    st = os.stat(src_path)
+    index = _load_index()
+    entry = index.get(src_path)
+    if entry and entry['mtime_ns'] == st.st_mtime_ns and entry['size'] == st.st_size:
+        return entry, False
+
+    # Only re-hash when the file looks different; touched-but-identical
+    # sources keep their derivatives
+    sha = _file_sha(src_path)
+    if not entry or entry['sha'] != sha:
+        entry = {'sha': sha, 'fits': {}}
+    entry.update(mtime_ns=st.st_mtime_ns, size=st.st_size)
+    index[src_path] = entry
+    return entry, True
+
+
+def source_sha(src_path):
+    """SHA-256 of an image file, served from the index when it is unchanged."""
+    entry, changed = _index_entry(os.path.abspath(src_path))
+    if changed:
+        _save_index()
+    return entry['sha']
+
+
+def fit_image(src_path, max_w=MAX_WIDTH_IN, max_h=MAX_HEIGHT_IN):
+    """
+    Right-sized image for embedding within a max_w x max_h inch box.
+
+    Returns:
+        FittedImage(path, width_in, height_in): path is the cached derivative,
+        or src_path itself when the original is already small enough.
+    """
+    src_path = os.path.abspath(src_path)
+    entry, dirty = _index_entry(src_path)
+
+    box_key = f'{max_w:g}x{max_h:g}@{EMBED_DPI}-{EMBED_ENCODING}'
+    fit = entry['fits'].get(box_key)
+    if fit is None or (fit[0] and not os.path.exists(os.path.join(CACHE_DIR, fit[0]))):
+        fit = _make_derivative(src_path, entry['sha'], box_key, max_w, max_h)
+        entry['fits'][box_key] = fit
+        dirty = True
+    if dirty:
+        _save_index()
+
+    name, w_in, h_in = fit
+    path = os.path.join(CACHE_DIR, name) if name else src_path
+    return FittedImage(path, w_in, h_in)
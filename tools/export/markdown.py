@@ -0,0 +1,164 @@
+"""
+Markdown Block Tokenizer
+=========================
+Splits a chapter or tool guide into a typed stream of blocks for the
+document exporters.
+
+Every line is classified once by a single compiled pattern, then lines are
+grouped into blocks in one forward pass. Block types:
+
+    Heading(level, text)          # ... #### headings, '*' markers removed
+    Paragraph(text)               consecutive text lines joined with spaces
+    ListItem(ordered, text)       '- ' / '* ' bullets and '1. ' items
+    Table(lines)                  consecutive '|' rows (stripped)
+    Figure(number, title, image)  **Figure X.Y.** *Title* caption, with the
+                                  Image on the next non-blank line (or None)
+    Image(alt, src)               ![alt](src) on its own
+
+HTML comments, '---' rules and blank lines produce no blocks. A Table's
+lines are split into cells with parse_table_row(); is_separator_row()
+spots the |---|:--:| line under the header.
+"""
+
+import re
+from collections import namedtuple
+
+Heading = namedtuple('Heading', ['level', 'text'])
+Paragraph = namedtuple('Paragraph', ['text'])
+ListItem = namedtuple('ListItem', ['ordered', 'text'])
+Table = namedtuple('Table', ['lines'])
+Figure = namedtuple('Figure', ['number', 'title', 'image'])
+Image = namedtuple('Image', ['alt', 'src'])
+
+# Alternatives are tried in order, so earlier kinds win (a '#' line that is
+# not a valid heading is still not a list item or table). Matched against
+# the stripped line; no match means plain text.
+_LINE_RE = re.compile(r'''
+      (?P<comment> <!-- )
+    | (?P<hr> ---$ )
+    | (?P<heading> (?P<hashes>\#{1,4}) \s+ (?P<heading_text>.+)$ )
+    | (?P<hash> \# )
+    | (?P<figure> \*\*Figure \s+ (?P<fig_number>[\d.TG]+) \.\*\* \s+ \*(?P<fig_title>.+?)\* \s*$ )
+    | (?P<figure_like> \*\*Figure )
+    | (?P<image> !\[ (?P<alt>.+?) \] \( (?P<src>.+?) \) )
+    | (?P<image_like> !\[ )
+    | (?P<bullet> [-*]\ (?P<bullet_text>.*) )
+    | (?P<number> \d+\. \s+ (?P<number_text>.+)$ )
+    | (?P<table> \| )
+''', re.VERBOSE)
+
+_HEADING_MARKUP_RE = re.compile(r'\*+')
+
+_IMAGE_REF_RE = re.compile(r'!\[.+?\]\((.+?)\)')
+
+_SEPARATOR_RE = re.compile(r'^\|?[-:|]+(\|[-:|]+)+\|?$')
+
+# Line kinds that only exist when figures are parsed (chapters); tool guides
+# treat these lines as ordinary paragraph text
+_FIGURE_KINDS = frozenset(['figure', 'figure_like', 'image', 'image_like'])
+
+
+def _classify(stripped, figures):
+    """Return (kind, match) for a stripped line."""
+    if not stripped:
+        return 'blank', None
+    m = _LINE_RE.match(stripped)
+    if m is None:
+        return 'text', None
+    kind = m.lastgroup
+    if not figures and kind in _FIGURE_KINDS:
+        return 'text', None
+    return kind, m
+
+
+def tokenize(text, figures=True):
+    """
+    Yield blocks for Markdown source text.
+
+    Args:
+        text: full file contents
+        figures: parse figure captions and images (chapters). When False
+            (tool guides) such lines are ordinary paragraph text.
+    """
+    stripped_lines = [line.strip() for line in text.split('\n')]
+    classified = [_classify(s, figures) for s in stripped_lines]
+    n = len(stripped_lines)
+
+    i = 0
+    while i < n:
+        kind, m = classified[i]
+
+        if kind in ('blank', 'comment', 'hr'):
+            i += 1
+
+        elif kind == 'heading':
+            title = _HEADING_MARKUP_RE.sub('', m.group('heading_text').strip())
+            yield Heading(len(m.group('hashes')), title)
+            i += 1
+
+        elif kind == 'figure':
+            # The image belongs to the caption if it is the next non-blank line
+            j = i + 1
+            while j < n and classified[j][0] == 'blank':
+                j += 1
+            image = None
+            if j < n and classified[j][0] == 'image':
+                img = classified[j][1]
+                image = Image(img.group('alt'), img.group('src'))
+                i = j + 1
+            else:
+                i += 1
+            yield Figure(m.group('fig_number'), m.group('fig_title'), image)
+
+        elif kind == 'image':
+            yield Image(m.group('alt'), m.group('src'))
+            i += 1
+
+        elif kind == 'bullet':
+            yield ListItem(False, m.group('bullet_text'))
+            i += 1
+
+        elif kind == 'number':
+            yield ListItem(True, m.group('number_text'))
+            i += 1
+
+        elif kind == 'table':
+            j = i
+            while j < n and classified[j][0] == 'table':
+                j += 1
+            yield Table(stripped_lines[i:j])
+            i = j
+
+        else:
+            # Paragraph: text (or a malformed heading/caption/image line)
+            # followed by text lines up to the next blank or block start
+            j = i + 1
+            while j < n and classified[j][0] == 'text':
+                j += 1
+            yield Paragraph(' '.join(stripped_lines[i:j]))
+            i = j
+
+
+def image_refs(text):
+    """
+    Image sources referenced anywhere in text, in order.
+
+    A plain scan without tokenizing, for cache keys. It may report an image
+    that tokenize() would treat as text, never the other way round.
+    """
+    return _IMAGE_REF_RE.findall(text)
+
+
+def parse_table_row(line):
+    """Parse a Markdown table row into a list of cell strings."""
+    stripped = line.strip()
+    if stripped.startswith('|'):
+        stripped = stripped[1:]
+    if stripped.endswith('|'):
+        stripped = stripped[:-1]
+    return [cell.strip() for cell in stripped.split('|')]
+
+
+def is_separator_row(line):
+    """Check if a line is a Markdown table separator (|---|---|)."""
+    return bool(_SEPARATOR_RE.match(line.strip().replace(' ', '')))
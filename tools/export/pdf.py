@@ -0,0 +1,390 @@
+"""
+Native PDF Backend
+===================
+Renders the Markdown block stream from tools/export/markdown.py straight to
+PDF with fpdf2, so exports don't need Microsoft Word (COM / PowerShell).
+
+Output mirrors the Word documents: the same page size and margins, heading
+sizes and colours, figure captions, navy table headers with zebra rows,
+and a Table of Contents (levels 1-3) with page numbers and links that is
+filled in once the whole document has been laid out.
+
+Fonts: Segoe UI when installed (Windows), otherwise DejaVu Sans from the
+matplotlib install the graphics pipeline already uses, otherwise the core
+Helvetica font with typographic punctuation folded to Latin-1.
+"""
+
+import math
+import os
+
+from fpdf import FPDF, FontFace
+from fpdf.enums import TableCellFillMode
+
+from tools.export.images import fit_image
+from tools.export import inline, markdown as md
+
+# ── Design Constants (match the Word exporters) ─────────────────────────
+
+NAVY = (0x1B, 0x2A, 0x4A)
+STEEL = (0x3D, 0x5A, 0x80)
+TEXT_COLOR = (0x21, 0x25, 0x29)
+TEXT_SECONDARY = (0x49, 0x50, 0x57)
+ERROR_RED = (0xC1, 0x29, 0x2E)
+WHITE = (0xFF, 0xFF, 0xFF)
+ZEBRA = (0xF0, 0xF4, 0xF8)
+
+BODY_SIZE = 11
+TABLE_SIZE = 9
+CAPTION_SIZE = 10
+LINE_SPACING = 1.15
+# level: (size pt, colour, space before pt)
+HEADING_STYLES = {
+    1: (22, NAVY, 18),
+    2: (16, NAVY, 18),
+    3: (13, STEEL, 12),
+    4: (11.5, STEEL, 12),
+}
+TOC_LEVELS = 3
+TOC_TITLE_HEIGHT = 38
+TOC_LINE_HEIGHT = 17.6
+
+_FONT_CANDIDATES = [
+    ('SegoeUI', os.path.join(os.environ.get('WINDIR', r'C:\Windows'), 'Fonts'),
+     {'': 'segoeui.ttf', 'B': 'segoeuib.ttf', 'I': 'segoeuii.ttf', 'BI': 'segoeuiz.ttf'}),
+    ('DejaVu', None,
+     {'': 'DejaVuSans.ttf', 'B': 'DejaVuSans-Bold.ttf',
+      'I': 'DejaVuSans-Oblique.ttf', 'BI': 'DejaVuSans-BoldOblique.ttf'}),
+]
+
+# fpdf style for each inline span kind (code spans and links are special)
+_SPAN_STYLES = {
+    inline.PLAIN: '',
+    inline.BOLD: 'B',
+    inline.ITALIC: 'I',
+    inline.BOLD_ITALIC: 'BI',
+}
+
+# Core font for code spans (no TTF needed; text is folded to Latin-1)
+CODE_FAMILY = 'Courier'
+
+# Core-font fallback: characters outside Latin-1 that appear in the content
+_LATIN1_FOLD = str.maketrans({
+    '\u2018': "'", '\u2019': "'", '\u201c': '"', '\u201d': '"',
+    '\u2013': '-', '\u2014': '--', '\u2026': '...', '\u2022': '-',
+    '\u2192': '->', '\u2190': '<-', '\u2264': '<=', '\u2265': '>=',
+    '\u00a0': ' ', '\u2212': '-',
+})
+
+
+def _matplotlib_font_dir():
+    try:
+        import matplotlib
+    except ImportError:
+        return None
+    return os.path.join(matplotlib.get_data_path(), 'fonts', 'ttf')
+
+
+def _fold_latin1(text):
+    """Text restricted to Latin-1, for the core fonts."""
+    return text.translate(_LATIN1_FOLD).encode('latin-1', 'replace').decode('latin-1')
+
+
+class DocumentPDF(FPDF):
+    """Letter-size PDF with the course design system and a real TOC."""
+
+    def __init__(self, title=''):
+        super().__init__(orientation='portrait', unit='pt', format='letter')
+        self.set_margins(72, 72, 72)
+        self.set_auto_page_break(auto=True, margin=72)
+        self.set_title(title)
+        self.family, self.unicode = self._register_fonts()
+        self._list_number = 0
+
+    def _register_fonts(self):
+        """Register the first complete TTF family found; else core Helvetica."""
+        for family, directory, files in _FONT_CANDIDATES:
+            directory = directory or _matplotlib_font_dir()
+            if not directory:
+                continue
+            paths = {style: os.path.join(directory, name) for style, name in files.items()}
+            if all(os.path.isfile(p) for p in paths.values()):
+                for style, path in paths.items():
+                    self.add_font(family, style, path)
+                return family, True
+        return 'Helvetica', False
+
+    def _text(self, text):
+        """Make text encodable by the active font."""
+        if self.unicode:
+            return text
+        return _fold_latin1(text)
+
+    def _font(self, style='', size=BODY_SIZE, color=TEXT_COLOR):
+        self.set_font(self.family, style, size)
+        self.set_text_color(*color)
+
+    def footer(self):
+        if self.page_no() == 1:
+            return
+        self.set_y(-48)
+        self._font('', 8, TEXT_SECONDARY)
+        self.cell(0, 12, str(self.page_no()), align='C')
+
+    # ── Front Matter ─────────────────────────────────────────────────────
+
+    def add_title_page(self, title, subtitle, info_lines=(), list_heading=None, list_items=(),
+                       title_size=36, subtitle_size=20):
+        """Centered title page, like the Word exporters' add_title_page()."""
+        self.add_page()
+        self.set_y(200)
+        self._font('B', title_size, NAVY)
+        self.multi_cell(0, title_size * 1.3, self._text(title), align='C',
+                        new_x='LMARGIN', new_y='NEXT')
+        self._font('I', subtitle_size, STEEL)
+        self.multi_cell(0, subtitle_size * 1.3, self._text(subtitle), align='C',
+                        new_x='LMARGIN', new_y='NEXT')
+        self.ln(60)
+        self._font('', 14, TEXT_SECONDARY)
+        for line in info_lines:
+            self.cell(0, 20, self._text(line), align='C', new_x='LMARGIN', new_y='NEXT')
+        if list_heading:
+            self.ln(50)
+            self._font('B', 11, TEXT_SECONDARY)
+            self.cell(0, 16, self._text(list_heading), align='C', new_x='LMARGIN', new_y='NEXT')
+            self._font('', 10, TEXT_SECONDARY)
+            for item in list_items:
+                self.cell(0, 14, self._text(item), align='C', new_x='LMARGIN', new_y='NEXT')
+
+    def add_toc(self, levels):
+        """Reserve pages for a Table of Contents of headings at `levels`.
+
+        The TOC is rendered once layout is done, but fpdf2 needs its page
+        count now. The estimate allows for a partly wasted line per page,
+        so it never falls short; _render_toc() pads any spare reserved
+        page. Page numbers and links therefore stay correct.
+        """
+        self.add_page()
+        height = TOC_TITLE_HEIGHT + sum(_toc_line_height(level - 1) for level in levels)
+        self.toc_pages = max(1, math.ceil(height / (self.eph - TOC_LINE_HEIGHT)))
+        self.insert_toc_placeholder(_render_toc, pages=self.toc_pages)
+
+    # ── Blocks ───────────────────────────────────────────────────────────
+
+    def add_blocks(self, blocks, resolve_image=None):
+        """
+        Render a block stream from tools.export.markdown.tokenize().
+
+        resolve_image maps a Markdown image src to a file path (default:
+        used as-is).
+        """
+        resolve_image = resolve_image or (lambda src: src)
+        for block in blocks:
+            kind = type(block)
+            if kind is not md.ListItem:
+                self._list_number = 0
+
+            if kind is md.Heading:
+                self.add_heading(block.text, block.level)
+            elif kind is md.Figure:
+                self.add_caption(block.number, block.title)
+                if block.image is not None:
+                    self.add_image(resolve_image(block.image.src), block.image.alt)
+            elif kind is md.Image:
+                self.add_image(resolve_image(block.src), block.alt)
+            elif kind is md.ListItem:
+                self.add_list_item(block.text, block.ordered)
+            elif kind is md.Table:
+                self.add_table(block.lines)
+            else:
+                self.add_paragraph(block.text)
+
+    def add_heading(self, text, level):
+        size, color, space_before = HEADING_STYLES[min(level, 4)]
+        line_h = size * 1.25
+        # Keep with next: don't strand a heading at the bottom of a page
+        if self.will_page_break(space_before + line_h + 3 * BODY_SIZE * LINE_SPACING):
+            self.add_page()
+        elif self.get_y() > self.t_margin:
+            self.ln(space_before)
+        if level <= TOC_LEVELS:
+            self.start_section(self._text(text), level - 1, strict=False)
+        self._font('B', size, color)
+        self.multi_cell(0, line_h, self._text(text), new_x='LMARGIN', new_y='NEXT')
+        self.ln(6)
+
+    def _write_inline(self, text, size=BODY_SIZE):
+        """Write text with inline Markdown spans, wrapping at the margins."""
+        line_h = size * LINE_SPACING * 1.2
+        for span in inline.parse_inline(text):
+            if span.kind == inline.CODE:
+                self.set_font(CODE_FAMILY, '', size)
+                self.set_text_color(*TEXT_COLOR)
+                self.write(line_h, _fold_latin1(span.text))
+            elif span.kind == inline.LINK:
+                self._font('U', size, STEEL)
+                self.write(line_h, self._text(span.text), link=span.url)
+            else:
+                self._font(_SPAN_STYLES[span.kind], size)
+                self.write(line_h, self._text(span.text))
+        self.ln(line_h)
+
+    def add_paragraph(self, text):
+        self._write_inline(text)
+        self.ln(6)
+
+    def add_list_item(self, text, ordered):
+        indent = 18
+        if ordered:
+            self._list_number += 1
+            marker = f'{self._list_number}.'
+        else:
+            marker = '\u2022' if self.unicode else '-'
+        left = self.l_margin
+        self._font('', BODY_SIZE)
+        self.set_x(left + 4)
+        self.cell(indent - 4, BODY_SIZE * LINE_SPACING * 1.2, marker)
+        self.set_left_margin(left + indent)
+        try:
+            self._write_inline(text)
+        finally:
+            self.set_left_margin(left)
+        self.ln(3)
+
+    def add_table(self, table_lines):
+        """Markdown table lines -> table with navy header and zebra rows."""
+        rows = [md.parse_table_row(line) for line in table_lines
+                if not md.is_separator_row(line)]
+        if len(rows) < 2:
+            return
+        num_cols = len(rows[0])
+        rows = [(cells + [''] * num_cols)[:num_cols] for cells in rows]
+
+        self._font('', TABLE_SIZE)
+        self.set_draw_color(0xBF, 0xBF, 0xBF)
+        with self.table(
+            headings_style=FontFace(emphasis='BOLD', color=WHITE, fill_color=NAVY),
+            cell_fill_color=ZEBRA,
+            cell_fill_mode=TableCellFillMode.EVEN_ROWS,
+            line_height=TABLE_SIZE * 1.4,
+            text_align='LEFT',
+            padding=(2, 4),
+            width=self.epw,
+        ) as table:
+            for r, cells in enumerate(rows):
+                row = table.row()
+                for cell_text in cells:
+                    text, emphasis = _cell_emphasis(cell_text)
+                    style = FontFace(emphasis=emphasis) if r and emphasis else None
+                    row.cell(self._text(text), style=style)
+        self.ln(6)
+
+    def add_caption(self, number, title):
+        """'Figure X.Y.' in bold followed by the italic title, centered."""
+        label = self._text(f'Figure {number}. ')
+        title = self._text(title)
+        self.ln(12)
+        self._font('B', CAPTION_SIZE)
+        label_w = self.get_string_width(label)
+        self._font('I', CAPTION_SIZE, TEXT_SECONDARY)
+        title_w = self.get_string_width(title)
+        line_h = CAPTION_SIZE * 1.4
+        if self.will_page_break(line_h + 120):
+            self.add_page()
+        if label_w + title_w <= self.epw:
+            self.set_x(self.l_margin + (self.epw - label_w - title_w) / 2)
+            self._font('B', CAPTION_SIZE)
+            self.cell(label_w, line_h, label)
+            self._font('I', CAPTION_SIZE, TEXT_SECONDARY)
+            self.cell(title_w, line_h, title, new_x='LMARGIN', new_y='NEXT')
+        else:
+            self._font('B', CAPTION_SIZE)
+            self.multi_cell(0, line_h, label + title, align='C', new_x='LMARGIN', new_y='NEXT')
+        self.ln(2)
+
+    def add_image(self, img_path, alt_text=''):
+        """Centered figure scaled into the 5.8" x 7" box, or an error note."""
+        if not os.path.exists(img_path):
+            self._font('I', BODY_SIZE, ERROR_RED)
+            self.multi_cell(0, 16, self._text(f'[Image not found: {os.path.basename(img_path)}]'),
+                            new_x='LMARGIN', new_y='NEXT')
+            return
+        fitted = fit_image(img_path)
+        w, h = fitted.width_in * 72, fitted.height_in * 72
+        if self.will_page_break(h):
+            self.add_page()
+        self.image(fitted.path, x=self.l_margin + (self.epw - w) / 2, w=w, h=h,
+                   alt_text=self._text(alt_text))
+        self.ln(12)
+
+
+# ── Helpers ─────────────────────────────────────────────────────────────
+
+def _cell_emphasis(text):
+    """Whole-cell **bold** / *italic*, as the Word table cells handle it."""
+    clean = text.strip()
+    if clean.startswith('**') and clean.endswith('**') and len(clean) > 4:
+        return clean[2:-2], 'BOLD'
+    if clean.startswith('*') and clean.endswith('*') and len(clean) > 2:
+        return clean[1:-1], 'ITALICS'
+    return clean, None
+
+
+def _toc_line_height(outline_level):
+    return TOC_LINE_HEIGHT if outline_level == 0 else 16
+
+
+def _render_toc(pdf, outline):
+    """insert_toc_placeholder() callback: headings with dotted leaders."""
+    last_page = pdf.page + pdf.toc_pages - 1
+    pdf.set_x(pdf.l_margin)
+    pdf._font('B', HEADING_STYLES[1][0], NAVY)
+    pdf.cell(0, 30, 'Table of Contents', new_x='LMARGIN', new_y='NEXT')
+    pdf.ln(TOC_TITLE_HEIGHT - 30)
+    for section in outline:
+        indent = 14 * section.level
+        size = 11 if section.level == 0 else 10
+        line_h = _toc_line_height(section.level)
+        pdf._font('B' if section.level == 0 else '', size,
+                  TEXT_COLOR if section.level == 0 else TEXT_SECONDARY)
+        link = pdf.add_link(page=section.page_number)
+        page = str(section.page_number)
+        name = section.name
+        avail = pdf.epw - indent - pdf.get_string_width(page) - 12
+        while pdf.get_string_width(name) > avail and len(name) > 4:
+            name = name[:-4] + '...'
+        dots_w = avail - pdf.get_string_width(name)
+        dots = '.' * max(int(dots_w / max(pdf.get_string_width('.'), 0.1)) - 2, 0)
+        pdf.set_x(pdf.l_margin + indent)
+        pdf.cell(pdf.get_string_width(name) + 4, line_h, name, link=link)
+        pdf.cell(dots_w, line_h, dots, align='R', link=link)
+        pdf.cell(0, line_h, page, align='R', link=link, new_x='LMARGIN', new_y='NEXT')
+    while pdf.page < last_page:
+        pdf.add_page()
+
+
+def write_pdf(output_path, title, front_matter, parts):
+    """
+    Build a PDF from block streams.
+
+    Args:
+        output_path: file to write
+        title: document metadata title
+        front_matter: callable(pdf) adding the title page
+        parts: iterable of (blocks, resolve_image); each starts a new page
+    """
+    # Materialize the streams so the TOC can be sized before layout
+    parts = [(list(blocks), resolve_image) for blocks, resolve_image in parts]
+    toc_levels = [block.level for blocks, _ in parts for block in blocks
+                  if type(block) is md.Heading and block.level <= TOC_LEVELS]
+
+    pdf = DocumentPDF(title)
+    front_matter(pdf)
+    pdf.add_toc(toc_levels)
+    first = True
+    for blocks, resolve_image in parts:
+        if not first:
+            pdf.add_page()
+        first = False
+        pdf.add_blocks(blocks, resolve_image)
+    pdf.output(output_path)
+    return output_path
@@ -0,0 +1,196 @@
+"""
+Streaming DOCX Writer
+======================
+Write a Word document chapter by chapter with bounded memory.
+
+doc.save() needs the whole document tree, and every embedded image blob,
+in memory at once. StreamingDocxWriter keeps only a small skeleton
+Document in memory: the styles, numbering and front matter that
+create_document() and the title/TOC builders produce. Chapter fragments
+(see fragments.py) are written out as they arrive:
+
+    - body XML is appended to a temporary file on disk, with rIds and
+      drawing ids rewritten for the final document
+    - media parts go straight into the output zip and are then dropped
+
+close() writes the skeleton's parts, then document.xml (front matter +
+the spooled body + sectPr), its relationships and [Content_Types].xml.
+The zip is built in a temporary file beside the output and only replaces
+it once complete, so a failed export leaves the previous .docx in place.
+Peak memory is the skeleton plus the largest single fragment, however many
+chapters and figures are compiled.
+
+    with StreamingDocxWriter(path, skeleton_doc) as writer:
+        writer.append_fragment(fragment)
+"""
+
+import hashlib
+import io
+import os
+import re
+import shutil
+import tempfile
+import zipfile
+
+from docx.image.image import Image
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.oxml import parse_xml
+from docx.oxml.ns import qn
+from lxml import etree
+
+DOCUMENT_PART = 'word/document.xml'
+DOCUMENT_RELS = 'word/_rels/document.xml.rels'
+CONTENT_TYPES = '[Content_Types].xml'
+
+_PKG_RELS_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+_CONTENT_TYPES_NS = 'http://schemas.openxmlformats.org/package/2006/content-types'
+
+_XML_DECLARATION = b"<?xml version='1.0' encoding='UTF-8' standalone='yes'?>\n"
+
+
+class StreamingDocxWriter:
+    """Write a .docx whose body is appended one fragment at a time."""
+
+    def __init__(self, path, skeleton):
+        """
+        Args:
+            path: output .docx path
+            skeleton: python-docx Document holding the styles and front
+                matter; fragments are appended after its body content
+        """
+        self.skeleton = skeleton
+        self._path = path
+        self._tmp_path = f'{path}.{os.getpid()}.tmp'
+        self._zip = zipfile.ZipFile(self._tmp_path, 'w', zipfile.ZIP_DEFLATED)
+        self._body = tempfile.TemporaryFile()
+
+        root = skeleton.element
+        self._nsmap = dict(root.nsmap)
+        # Fragments are parsed inside a w:body carrying the document's
+        # namespaces, so their XML serializes without per-element xmlns
+        decls = ' '.join(f'xmlns:{prefix}="{uri}"' for prefix, uri in self._nsmap.items())
+        self._open_body = f'<w:body {decls}>'.encode()
+
+        rels = skeleton.part.rels
+        self._next_rid = 1 + max((int(m.group(1)) for rid in rels
+                                  for m in [re.match(r'rId(\d+)$', rid)] if m), default=0)
+        self._next_image = 1 + sum(1 for rel in rels.values() if rel.reltype == RT.IMAGE)
+        self._next_shape = 1 + sum(1 for _ in root.body.iter(qn('wp:docPr')))
+
+        # sha1 of blob -> rId, so a figure used twice is stored once
+        self._media = {}
+        # new rId -> media target, and extension -> content type
+        self._image_rels = {}
+        self._extensions = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self._discard()
+
+    def _discard(self):
+        """Drop the partial output; the previous file at path is untouched."""
+        try:
+            self._body.close()
+            self._zip.close()
+        finally:
+            os.remove(self._tmp_path)
+
+    def _add_media(self, blob):
+        """Write an image part to the zip (once per distinct blob); return its rId."""
+        sha = hashlib.sha1(blob).hexdigest()
+        rid = self._media.get(sha)
+        if rid is None:
+            image = Image.from_blob(blob)
+            target = f'media/image{self._next_image}.{image.ext}'
+            self._next_image += 1
+            self._zip.writestr(f'word/{target}', blob)
+            self._extensions[image.ext] = image.content_type
+            rid = f'rId{self._next_rid}'
+            self._next_rid += 1
+            self._media[sha] = rid
+            self._image_rels[rid] = target
+        return rid
+
+    def append_fragment(self, fragment):
+        """Append a fragment's body; its images go straight to the zip."""
+        styles = self.skeleton.styles.element
+        for style_id, style_xml in fragment.styles.items():
+            if styles.get_by_id(style_id) is None:
+                styles.append(parse_xml(style_xml))
+
+        container = etree.fromstring(self._open_body + fragment.body_xml + b'</w:body>')
+        new_rids = {}
+        for blip in container.iter(qn('a:blip')):
+            old_rid = blip.get(qn('r:embed'))
+            if old_rid not in new_rids:
+                new_rids[old_rid] = self._add_media(fragment.images[old_rid])
+            blip.set(qn('r:embed'), new_rids[old_rid])
+        for doc_pr in container.iter(qn('wp:docPr')):
+            doc_pr.set('id', str(self._next_shape))
+            # python-docx names pictures after their id
+            if doc_pr.get('name', '').startswith('Picture '):
+                doc_pr.set('name', f'Picture {self._next_shape}')
+            self._next_shape += 1
+
+        etree.cleanup_namespaces(container, top_nsmap=self._nsmap)
+        xml = etree.tostring(container)
+        # Keep only the children: drop the container's start and end tags
+        self._body.write(xml[xml.index(b'>') + 1:xml.rindex(b'</w:body>')])
+
+    def _document_rels(self, rels_xml):
+        rels = etree.fromstring(rels_xml)
+        for rid, target in self._image_rels.items():
+            etree.SubElement(rels, f'{{{_PKG_RELS_NS}}}Relationship',
+                             Id=rid, Type=RT.IMAGE, Target=target)
+        return _XML_DECLARATION + etree.tostring(rels)
+
+    def _content_types(self, types_xml):
+        types = etree.fromstring(types_xml)
+        known = {el.get('Extension') for el in types.iter(f'{{{_CONTENT_TYPES_NS}}}Default')}
+        for ext, content_type in sorted(self._extensions.items()):
+            if ext not in known:
+                # Defaults must precede Overrides
+                types.insert(0, etree.Element(f'{{{_CONTENT_TYPES_NS}}}Default',
+                                              Extension=ext, ContentType=content_type))
+        return _XML_DECLARATION + etree.tostring(types)
+
+    def close(self):
+        """Write the skeleton parts and the assembled document.xml, then move the file into place."""
+        try:
+            self._finish()
+        except BaseException:
+            self._discard()
+            raise
+        os.replace(self._tmp_path, self._path)
+
+    def _finish(self):
+        skeleton = io.BytesIO()
+        self.skeleton.save(skeleton)
+
+        with zipfile.ZipFile(skeleton) as src:
+            for info in src.infolist():
+                if info.filename == DOCUMENT_RELS:
+                    self._zip.writestr(DOCUMENT_RELS, self._document_rels(src.read(info)))
+                elif info.filename == CONTENT_TYPES:
+                    self._zip.writestr(CONTENT_TYPES, self._content_types(src.read(info)))
+                elif info.filename != DOCUMENT_PART:
+                    self._zip.writestr(info.filename, src.read(info))
+            document = src.read(DOCUMENT_PART)
+
+        # Splice the spooled body in before the final sectPr (or </w:body>)
+        split = document.rfind(b'<w:sectPr')
+        if split < 0:
+            split = document.rindex(b'</w:body>')
+        self._body.seek(0)
+        with self._zip.open(DOCUMENT_PART, 'w') as out:
+            out.write(document[:split])
+            shutil.copyfileobj(self._body, out)
+            out.write(document[split:])
+
+        self._body.close()
+        self._zip.close()
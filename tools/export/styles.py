@@ -0,0 +1,100 @@
+"""
+Character Styles
+=================
+Run-level styles shared by the Word exporters.
+
+Body text and table cells used to carry font name, size and colour as
+direct formatting on every run, each one its own w:rPr subtree. The
+exporters now define these character styles once per document and give
+each run a single w:rStyle reference:
+
+    Body           body text font, size and colour
+    Body Bold      Body + bold
+    Body Italic    Body + italic
+    Body Code      Body in a monospaced face, for `code` spans
+    Body Link      Body + underlined link colour, for [text](url) spans
+    Table Cell     table text size
+    Table Header   Table Cell + bold, white (on the navy header fill)
+
+The constants below are the style ids runs refer to.
+"""
+
+from docx.enum.style import WD_STYLE_TYPE
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+from docx.shared import Pt, RGBColor
+
+BODY = 'Body'
+BODY_BOLD = 'BodyBold'
+BODY_ITALIC = 'BodyItalic'
+BODY_CODE = 'BodyCode'
+BODY_LINK = 'BodyLink'
+TABLE_CELL = 'TableCell'
+TABLE_HEADER = 'TableHeader'
+
+TABLE_FONT_SIZE = Pt(9)
+WHITE = RGBColor(0xFF, 0xFF, 0xFF)
+CODE_FONT = 'Consolas'
+LINK_COLOR = RGBColor(0x3D, 0x5A, 0x80)
+
+
+def _add_style(doc, name, base=None):
+    style = doc.styles.add_style(name, WD_STYLE_TYPE.CHARACTER)
+    if base is not None:
+        style.base_style = base
+    return style
+
+
+def add_character_styles(doc, font_family, font_size, color):
+    """
+    Define the exporters' character styles in doc.
+
+    Args:
+        doc: python-docx Document
+        font_family: typeface for every style
+        font_size: body text size (tables use TABLE_FONT_SIZE)
+        color: body and table text colour
+    """
+    body = _add_style(doc, 'Body')
+    body.font.name = font_family
+    body.font.size = font_size
+    body.font.color.rgb = color
+    _add_style(doc, 'Body Bold', body).font.bold = True
+    _add_style(doc, 'Body Italic', body).font.italic = True
+    _add_style(doc, 'Body Code', body).font.name = CODE_FONT
+    link = _add_style(doc, 'Body Link', body)
+    link.font.color.rgb = LINK_COLOR
+    link.font.underline = True
+
+    cell = _add_style(doc, 'Table Cell')
+    cell.font.name = font_family
+    cell.font.size = TABLE_FONT_SIZE
+    cell.font.color.rgb = color
+    header = _add_style(doc, 'Table Header', cell)
+    header.font.bold = True
+    header.font.color.rgb = WHITE
+
+
+def add_styled_run(paragraph, text, style_id):
+    """Add a run that references a character style by id."""
+    run = paragraph.add_run(text)
+    # Set the id directly: run.style = name looks the style up on every call
+    run._r.style = style_id
+    return run
+
+
+def add_link_run(paragraph, text, url):
+    """
+    Add a Body Link run that opens url.
+
+    The run is wrapped in a HYPERLINK field rather than a w:hyperlink, which
+    would need a relationship on the document part; a field survives being
+    moved between documents as a fragment.
+    """
+    run = add_styled_run(paragraph, text, BODY_LINK)
+    field = OxmlElement('w:fldSimple')
+    target = url.replace('"', '%22')
+    field.set(qn('w:instr'), f' HYPERLINK "{target}" ')
+    run._r.addprevious(field)
+    field.append(run._r)
+    return run
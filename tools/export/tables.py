@@ -0,0 +1,116 @@
+"""
+Table Builder
+==============
+Word tables for parsed Markdown rows, written as w:tbl XML in one pass.
+
+Building tables through python-docx (doc.add_table, then row.cells, a
+cleared paragraph, a new run and a w:shd element per cell) re-walks the
+table grid on every row.cells access, so large tool-guide matrices
+(EFE/IFE/CPM/QSPM) dominate export time. add_table() instead renders the
+whole table as one XML string and parses it once.
+
+Header shading and zebra banding come from the 'Data Table' table style
+(add_table_style), not per-cell w:shd elements:
+
+    firstRow     navy fill (text is white via the Table Header run style)
+    band2Horz    light fill on every second data row
+"""
+
+from xml.sax.saxutils import escape
+
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, qn
+from docx.shared import Emu
+
+from tools.export.styles import TABLE_CELL, TABLE_HEADER
+
+TABLE_STYLE = 'DataTable'
+
+HEADER_FILL = '1B2A4A'
+BAND_FILL = 'F0F4F8'
+
+# Space before/after cell paragraphs (twentieths of a point): 2pt
+CELL_SPACING = 40
+
+_TABLE_STYLE_XML = f'''
+<w:style {nsdecls("w")} w:type="table" w:customStyle="1" w:styleId="{TABLE_STYLE}">
+  <w:name w:val="Data Table"/>
+  <w:basedOn w:val="TableGrid"/>
+  <w:uiPriority w:val="59"/>
+  <w:tblPr><w:tblStyleRowBandSize w:val="1"/></w:tblPr>
+  <w:tblStylePr w:type="firstRow">
+    <w:tcPr><w:shd w:val="clear" w:color="auto" w:fill="{HEADER_FILL}"/></w:tcPr>
+  </w:tblStylePr>
+  <w:tblStylePr w:type="band2Horz">
+    <w:tcPr><w:shd w:val="clear" w:color="auto" w:fill="{BAND_FILL}"/></w:tcPr>
+  </w:tblStylePr>
+</w:style>'''
+
+
+def add_table_style(doc):
+    """Define the 'Data Table' style (needs the template's Table Grid)."""
+    doc.styles.element.append(parse_xml(_TABLE_STYLE_XML))
+
+
+def _cell_xml(text, width, is_header):
+    """XML for one cell: a single run, bold/italic if wrapped in markers."""
+    clean = text.strip()
+    props = ''
+    if clean.startswith('**') and clean.endswith('**'):
+        clean = clean[2:-2]
+        # Header cells are bold via their style
+        props = '' if is_header else '<w:b/>'
+    elif clean.startswith('*') and clean.endswith('*'):
+        clean = clean[1:-1]
+        props = '<w:i/>'
+
+    style = TABLE_HEADER if is_header else TABLE_CELL
+    run = ''
+    if clean:
+        run = (f'<w:r><w:rPr><w:rStyle w:val="{style}"/>{props}</w:rPr>'
+               f'<w:t xml:space="preserve">{escape(clean)}</w:t></w:r>')
+    return (f'<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{width}"/></w:tcPr>'
+            f'<w:p><w:pPr><w:spacing w:before="{CELL_SPACING}" w:after="{CELL_SPACING}"/></w:pPr>'
+            f'{run}</w:p></w:tc>')
+
+
+def add_table(doc, header_cells, data_rows):
+    """
+    Append a styled table to the end of doc's body.
+
+    Args:
+        doc: python-docx Document created with add_table_style() applied
+        header_cells: header row cell strings
+        data_rows: data rows, each padded/trimmed to len(header_cells)
+    """
+    section = doc.sections[-1]
+    block_width = section.page_width - section.left_margin - section.right_margin
+    # Same even column split as doc.add_table()
+    width = Emu(block_width // len(header_cells)).twips
+
+    parts = [
+        f'<w:tbl {nsdecls("w")}><w:tblPr>'
+        f'<w:tblStyle w:val="{TABLE_STYLE}"/><w:tblW w:type="auto" w:w="0"/>'
+        '<w:tblLayout w:type="autofit"/>'
+        '<w:tblLook w:firstColumn="0" w:firstRow="1" w:lastColumn="0" w:lastRow="0"'
+        ' w:noHBand="0" w:noVBand="1" w:val="0420"/>'
+        '</w:tblPr><w:tblGrid>',
+        f'<w:gridCol w:w="{width}"/>' * len(header_cells),
+        '</w:tblGrid><w:tr>',
+    ]
+    parts.extend(_cell_xml(text, width, True) for text in header_cells)
+    parts.append('</w:tr>')
+    for row in data_rows:
+        parts.append('<w:tr>')
+        parts.extend(_cell_xml(text, width, False) for text in row)
+        parts.append('</w:tr>')
+    parts.append('</w:tbl>')
+
+    tbl = parse_xml(''.join(parts))
+    body = doc.element.body
+    sect_pr = body.find(qn('w:sectPr'))
+    if sect_pr is not None:
+        sect_pr.addprevious(tbl)
+    else:
+        body.append(tbl)
+    return tbl
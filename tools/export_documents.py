@@ -7,17 +7,28 @@ and a single PDF file.
 Usage:
     python tools/export_documents.py              # Generate both Word and PDF
     python tools/export_documents.py --word-only   # Word only
-    python tools/export_documents.py --pdf-only    # PDF only (requires Word installed)
+    python tools/export_documents.py --pdf-only    # PDF only
+    python tools/export_documents.py --pdf-backend native  # PDF without Word (fpdf2)
+    python tools/export_documents.py --jobs 4      # Build chapters in 4 processes
+    python tools/export_documents.py --force       # Rebuild unchanged chapters too
+    python tools/export_documents.py --stream      # Bounded-memory DOCX writer
+    python tools/export_documents.py --topic 3     # One chapter only
+    python tools/export_documents.py --split       # One DOCX/PDF per chapter, in parallel
+    EXPORT_EMBED_COLORS=256 python tools/export_documents.py  # Palette-reduced figures (lossy, ~half size)
 
 Output:
     output/Strategy-Course-Complete.docx
     output/Strategy-Course-Complete.pdf
+    output/Strategy-Course-Topic-N.docx/.pdf     (--topic N, or --split)
+    output/Strategy-Course-Topics-N-M.docx/.pdf  (--topic N,M)
 """
 
 import os
-import re
 import sys
 import argparse
+import contextlib
+import io
+from concurrent.futures import ProcessPoolExecutor
 
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if PROJECT_ROOT not in sys.path:
@@ -28,24 +39,27 @@ from docx.shared import Inches, Pt, Cm, RGBColor, Emu
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.enum.section import WD_ORIENT
 from docx.oxml.ns import qn
-from PIL import Image
+
+from tools.export import inline, markdown as md
+from tools.export.catalogue import load_catalogue
+from tools.export.fragments import extract_fragment, append_fragment, renumber_drawings
+from tools.export.fragment_cache import (
+    EXPORT_SOURCES, fragment_key, has_fragment, load_fragment, save_fragment,
+)
+from tools.export.images import fit_image
+from tools.export.stream import StreamingDocxWriter
+from tools.export.styles import (
+    BODY, BODY_BOLD, BODY_CODE, BODY_ITALIC, add_character_styles, add_link_run, add_styled_run,
+)
+from tools.export.tables import add_table, add_table_style
 
 # ── Paths ───────────────────────────────────────────────────────────────
 
 CHAPTERS_DIR = os.path.join(PROJECT_ROOT, 'output', 'chapters')
 GRAPHICS_DIR = os.path.join(PROJECT_ROOT, 'output', 'graphics')
-OUTPUT_DOCX = os.path.join(PROJECT_ROOT, 'output', 'Strategy-Course-Complete.docx')
-OUTPUT_PDF = os.path.join(PROJECT_ROOT, 'output', 'Strategy-Course-Complete.pdf')
-
-# Chapter ordering
-CHAPTER_FILES = [
-    'Topic-1-Foundations-of-Strategic-Management.md',
-    'Topic-2-External-Analysis-and-International-Strategy.md',
-    'Topic-3-Internal-Analysis-and-Strategy-Types.md',
-    'Topic-4-Strategy-Analysis-and-Implementation.md',
-    'Topic-6-Strategy-Evaluation-and-Control.md',
-    'Topic-7-Finance-and-Accounting-in-Strategy-Implementation.md',
-]
+OUTPUT_DIR = os.path.join(PROJECT_ROOT, 'output')
+OUTPUT_DOCX = os.path.join(OUTPUT_DIR, 'Strategy-Course-Complete.docx')
+OUTPUT_PDF = os.path.join(OUTPUT_DIR, 'Strategy-Course-Complete.pdf')
 
 # ── Design Constants ────────────────────────────────────────────────────
 
@@ -105,6 +119,10 @@ def create_document():
         hpf.space_after = Pt(6)
         hpf.keep_with_next = True
 
+    # Character and table styles referenced by runs and tables
+    add_character_styles(doc, FONT_FAMILY, FONT_BODY_SIZE, TEXT_COLOR)
+    add_table_style(doc)
+
     return doc
 
 
@@ -214,33 +232,15 @@ def add_image_to_doc(doc, img_path, alt_text=''):
         return
 
     try:
-        with Image.open(img_path) as img:
-            w_px, h_px = img.size
-            dpi = img.info.get('dpi', (200, 200))
-            dpi_x = dpi[0] if isinstance(dpi, tuple) else dpi
-
-        # Calculate width to fit page
-        w_inches = w_px / dpi_x
-        h_inches = h_px / (dpi[1] if isinstance(dpi, tuple) else dpi)
-
-        # Scale to fit
-        max_w = 5.8  # inches
-        max_h = 7.0  # inches
-        if w_inches > max_w:
-            scale = max_w / w_inches
-            w_inches *= scale
-            h_inches *= scale
-        if h_inches > max_h:
-            scale = max_h / h_inches
-            w_inches *= scale
-            h_inches *= scale
+        # Right-sized, cached copy instead of the full-resolution original
+        fitted = fit_image(img_path)
 
         p = doc.add_paragraph()
         p.alignment = WD_ALIGN_PARAGRAPH.CENTER
         p.paragraph_format.space_before = Pt(6)
         p.paragraph_format.space_after = Pt(12)
         run = p.add_run()
-        run.add_picture(img_path, width=Inches(w_inches))
+        run.add_picture(fitted.path, width=Inches(fitted.width_in))
 
     except Exception as e:
         p = doc.add_paragraph()
@@ -249,93 +249,28 @@ def add_image_to_doc(doc, img_path, alt_text=''):
         run.italic = True
 
 
+# Character style for each inline span kind (bold italic and links are special)
+_SPAN_STYLES = {
+    inline.PLAIN: BODY,
+    inline.BOLD: BODY_BOLD,
+    inline.ITALIC: BODY_ITALIC,
+    inline.CODE: BODY_CODE,
+}
+
+
 def process_inline_formatting(paragraph, text):
     """
     Parse inline Markdown formatting and add runs to a paragraph.
-    Handles **bold**, *italic*, and ***bold italic***.
+    Handles **bold**, *italic*, ***bold italic***, `code` and [links](url).
     """
-    # Pattern for bold+italic, bold, or italic
-    pattern = re.compile(
-        r'(\*\*\*(.+?)\*\*\*)'   # ***bold italic***
-        r'|(\*\*(.+?)\*\*)'       # **bold**
-        r'|(\*(.+?)\*)'           # *italic*
-    )
-
-    last_end = 0
-    for match in pattern.finditer(text):
-        # Add plain text before this match
-        start = match.start()
-        if start > last_end:
-            run = paragraph.add_run(text[last_end:start])
-            run.font.name = FONT_FAMILY
-            run.font.size = FONT_BODY_SIZE
-            run.font.color.rgb = TEXT_COLOR
-
-        if match.group(2):  # ***bold italic***
-            run = paragraph.add_run(match.group(2))
-            run.bold = True
+    for span in inline.parse_inline(text):
+        if span.kind == inline.BOLD_ITALIC:
+            run = add_styled_run(paragraph, span.text, BODY_BOLD)
             run.italic = True
-        elif match.group(4):  # **bold**
-            run = paragraph.add_run(match.group(4))
-            run.bold = True
-        elif match.group(6):  # *italic*
-            run = paragraph.add_run(match.group(6))
-            run.italic = True
-
-        run.font.name = FONT_FAMILY
-        run.font.size = FONT_BODY_SIZE
-        run.font.color.rgb = TEXT_COLOR
-        last_end = match.end()
-
-    # Remaining text
-    if last_end < len(text):
-        run = paragraph.add_run(text[last_end:])
-        run.font.name = FONT_FAMILY
-        run.font.size = FONT_BODY_SIZE
-        run.font.color.rgb = TEXT_COLOR
-
-
-def _apply_cell_formatting(cell, text, is_header=False, font_size=Pt(9)):
-    """Apply inline formatting to a table cell."""
-    cell.text = ''  # Clear default paragraph
-    p = cell.paragraphs[0]
-    p.paragraph_format.space_before = Pt(2)
-    p.paragraph_format.space_after = Pt(2)
-
-    # Strip markdown bold/italic markers and detect formatting
-    clean = text.strip()
-    bold = is_header
-    italic = False
-
-    if clean.startswith('**') and clean.endswith('**'):
-        clean = clean[2:-2]
-        bold = True
-    elif clean.startswith('*') and clean.endswith('*'):
-        clean = clean[1:-1]
-        italic = True
-
-    run = p.add_run(clean)
-    run.font.name = FONT_FAMILY
-    run.font.size = font_size
-    run.font.color.rgb = TEXT_COLOR
-    run.bold = bold
-    run.italic = italic
-
-
-def _parse_table_row(line):
-    """Parse a Markdown table row into a list of cell strings."""
-    stripped = line.strip()
-    if stripped.startswith('|'):
-        stripped = stripped[1:]
-    if stripped.endswith('|'):
-        stripped = stripped[:-1]
-    return [cell.strip() for cell in stripped.split('|')]
-
-
-def _is_separator_row(line):
-    """Check if a line is a Markdown table separator (|---|---|)."""
-    stripped = line.strip().replace(' ', '')
-    return bool(re.match(r'^\|?[-:|]+(\|[-:|]+)+\|?$', stripped))
+        elif span.kind == inline.LINK:
+            add_link_run(paragraph, span.text, span.url)
+        else:
+            add_styled_run(paragraph, span.text, _SPAN_STYLES[span.kind])
 
 
 def add_markdown_table(doc, table_lines):
@@ -344,15 +279,15 @@ def add_markdown_table(doc, table_lines):
         return
 
     # Parse header row
-    header_cells = _parse_table_row(table_lines[0])
+    header_cells = md.parse_table_row(table_lines[0])
     num_cols = len(header_cells)
 
     # Find data rows (skip separator)
     data_rows = []
     for line in table_lines[1:]:
-        if _is_separator_row(line):
+        if md.is_separator_row(line):
             continue
-        cells = _parse_table_row(line)
+        cells = md.parse_table_row(line)
         # Pad or trim to match column count
         while len(cells) < num_cols:
             cells.append('')
@@ -363,43 +298,8 @@ def add_markdown_table(doc, table_lines):
     if total_rows < 2:
         return
 
-    # Create Word table
-    table = doc.add_table(rows=total_rows, cols=num_cols)
-    table.style = 'Table Grid'
-    table.autofit = True
-
-    # Header row
-    header_row = table.rows[0]
-    for j, cell_text in enumerate(header_cells):
-        cell = header_row.cells[j]
-        _apply_cell_formatting(cell, cell_text, is_header=True, font_size=Pt(9))
-        # Header background
-        shading = cell._element.get_or_add_tcPr()
-        shd = shading.makeelement(qn('w:shd'), {
-            qn('w:val'): 'clear',
-            qn('w:color'): 'auto',
-            qn('w:fill'): '1B2A4A',
-        })
-        shading.append(shd)
-        # White text for header
-        for run in cell.paragraphs[0].runs:
-            run.font.color.rgb = RGBColor(0xFF, 0xFF, 0xFF)
-
-    # Data rows
-    for i, row_cells in enumerate(data_rows):
-        row = table.rows[i + 1]
-        for j, cell_text in enumerate(row_cells):
-            cell = row.cells[j]
-            _apply_cell_formatting(cell, cell_text, is_header=False, font_size=Pt(9))
-            # Alternate row shading
-            if i % 2 == 1:
-                shading = cell._element.get_or_add_tcPr()
-                shd = shading.makeelement(qn('w:shd'), {
-                    qn('w:val'): 'clear',
-                    qn('w:color'): 'auto',
-                    qn('w:fill'): 'F0F4F8',
-                })
-                shading.append(shd)
+    # Build the table XML in one pass; shading comes from the table style
+    add_table(doc, header_cells, data_rows)
 
     # Add spacing after table
     p = doc.add_paragraph()
@@ -407,6 +307,24 @@ def add_markdown_table(doc, table_lines):
     p.paragraph_format.space_after = Pt(6)
 
 
+def add_figure_caption(doc, fig_num, fig_title):
+    """Add a centered 'Figure X.Y. Title' label above a figure."""
+    p = doc.add_paragraph()
+    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    p.paragraph_format.space_before = Pt(12)
+    p.paragraph_format.space_after = Pt(2)
+    run = p.add_run(f'Figure {fig_num}. ')
+    run.bold = True
+    run.font.name = FONT_FAMILY
+    run.font.size = Pt(10)
+    run.font.color.rgb = TEXT_COLOR
+    run = p.add_run(fig_title)
+    run.italic = True
+    run.font.name = FONT_FAMILY
+    run.font.size = Pt(10)
+    run.font.color.rgb = TEXT_SECONDARY
+
+
 def process_chapter(doc, chapter_file):
     """Parse a Markdown chapter and add it to the Word document."""
     filepath = os.path.join(CHAPTERS_DIR, chapter_file)
@@ -415,167 +333,166 @@ def process_chapter(doc, chapter_file):
         return 0
 
     with open(filepath, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
+        source = f.read()
 
     figures_added = 0
-    i = 0
-    in_list = False
-    list_buffer = []
+    for block in md.tokenize(source):
+        kind = type(block)
+
+        if kind is md.Heading:
+            doc.add_heading(block.text, level=min(block.level, 4))
+
+        elif kind is md.Figure:
+            add_figure_caption(doc, block.number, block.title)
+            if block.image is not None:
+                img_abs_path = resolve_image_path(block.image.src, chapter_file)
+                add_image_to_doc(doc, img_abs_path, block.image.alt)
+                figures_added += 1
+
+        elif kind is md.Image:
+            # Image line on its own (without figure label above)
+            img_abs_path = resolve_image_path(block.src, chapter_file)
+            add_image_to_doc(doc, img_abs_path, block.alt)
+            figures_added += 1
 
-    while i < len(lines):
-        line = lines[i].rstrip('\n')
-        stripped = line.strip()
+        elif kind is md.ListItem:
+            style = 'List Number' if block.ordered else 'List Bullet'
+            p = doc.add_paragraph(style=style)
+            process_inline_formatting(p, block.text)
 
-        # Skip HTML comments (CWV tags)
-        if stripped.startswith('<!--'):
-            i += 1
-            continue
+        elif kind is md.Table:
+            add_markdown_table(doc, block.lines)
 
-        # Skip horizontal rules
-        if stripped == '---':
-            i += 1
-            continue
+        else:
+            p = doc.add_paragraph()
+            process_inline_formatting(p, block.text)
 
-        # Empty line
-        if stripped == '':
-            if in_list and list_buffer:
-                in_list = False
-                list_buffer = []
-            i += 1
-            continue
+    return figures_added
 
-        # Headings
-        if stripped.startswith('#'):
-            heading_match = re.match(r'^(#{1,4})\s+(.+)$', stripped)
-            if heading_match:
-                level = len(heading_match.group(1))
-                heading_text = heading_match.group(2).strip()
-                # Strip markdown formatting from heading
-                heading_text = re.sub(r'\*+', '', heading_text)
-                doc.add_heading(heading_text, level=min(level, 4))
-                i += 1
-                continue
 
-        # Figure reference: **Figure X.Y.** *Title*
-        fig_match = re.match(r'^\*\*Figure\s+([\d.TG]+)\.\*\*\s+\*(.+?)\*\s*$', stripped)
-        if fig_match:
-            fig_num = fig_match.group(1)
-            fig_title = fig_match.group(2)
+def _build_chapter_fragment(chapter_file):
+    """Worker: build one chapter in its own document and serialize it.
 
-            # Add figure label
-            p = doc.add_paragraph()
-            p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            p.paragraph_format.space_before = Pt(12)
-            p.paragraph_format.space_after = Pt(2)
-            run = p.add_run(f'Figure {fig_num}. ')
-            run.bold = True
-            run.font.name = FONT_FAMILY
-            run.font.size = Pt(10)
-            run.font.color.rgb = TEXT_COLOR
-            run = p.add_run(fig_title)
-            run.italic = True
-            run.font.name = FONT_FAMILY
-            run.font.size = Pt(10)
-            run.font.color.rgb = TEXT_SECONDARY
-
-            # Look for the image on the next non-blank line
-            j = i + 1
-            while j < len(lines) and lines[j].strip() == '':
-                j += 1
-
-            if j < len(lines):
-                img_match = re.match(r'!\[(.+?)\]\((.+?)\)', lines[j].strip())
-                if img_match:
-                    alt_text = img_match.group(1)
-                    img_rel_path = img_match.group(2)
-                    img_abs_path = resolve_image_path(img_rel_path, chapter_file)
-                    add_image_to_doc(doc, img_abs_path, alt_text)
-                    figures_added += 1
-                    i = j + 1
-                    continue
-
-            i += 1
-            continue
+    Console output is captured and returned so the parent can print it in
+    chapter order.
+    """
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        doc = create_document()
+        figs = process_chapter(doc, chapter_file)
+        # Page break between chapters
+        doc.add_page_break()
+    return figs, extract_fragment(doc), buf.getvalue()
 
-        # Image line on its own (without figure label above)
-        img_match = re.match(r'!\[(.+?)\]\((.+?)\)', stripped)
-        if img_match:
-            alt_text = img_match.group(1)
-            img_rel_path = img_match.group(2)
-            img_abs_path = resolve_image_path(img_rel_path, chapter_file)
-            add_image_to_doc(doc, img_abs_path, alt_text)
-            figures_added += 1
-            i += 1
-            continue
 
-        # Bullet list items
-        if stripped.startswith('- ') or stripped.startswith('* '):
-            text = stripped[2:]
-            p = doc.add_paragraph(style='List Bullet')
-            process_inline_formatting(p, text)
-            i += 1
-            continue
+def _chapter_key(chapter_file):
+    """Fragment cache key for a chapter, or None if the file is missing."""
+    filepath = os.path.join(CHAPTERS_DIR, chapter_file)
+    if not os.path.exists(filepath):
+        return None
+    with open(filepath, 'r', encoding='utf-8') as f:
+        source = f.read()
+    images = [resolve_image_path(src, chapter_file) for src in md.image_refs(source)]
+    return fragment_key(source, images, EXPORT_SOURCES + [os.path.abspath(__file__)])
 
-        # Numbered list items
-        num_match = re.match(r'^(\d+)\.\s+(.+)$', stripped)
-        if num_match:
-            text = num_match.group(2)
-            p = doc.add_paragraph(style='List Number')
-            process_inline_formatting(p, text)
-            i += 1
-            continue
 
-        # Markdown table (pipe-delimited rows)
-        if stripped.startswith('|'):
-            table_lines = []
-            j = i
-            while j < len(lines):
-                tl = lines[j].rstrip('\n').strip()
-                if tl.startswith('|'):
-                    table_lines.append(tl)
-                    j += 1
-                else:
-                    break
-            if len(table_lines) >= 2:
-                add_markdown_table(doc, table_lines)
-            i = j
-            continue
+def add_chapters(doc, chapter_files, jobs=1, force=False, writer=None):
+    """
+    Add chapters to doc, in the given order, as fragments.
 
-        # Regular paragraph — collect continuation lines
-        para_lines = [stripped]
-        j = i + 1
-        while j < len(lines):
-            next_line = lines[j].rstrip('\n')
-            next_stripped = next_line.strip()
-            # Stop on blank line, heading, list, image, figure ref, table, or HR
-            if (next_stripped == '' or
-                next_stripped.startswith('#') or
-                next_stripped.startswith('- ') or
-                next_stripped.startswith('* ') or
-                next_stripped.startswith('|') or
-                re.match(r'^\d+\.\s', next_stripped) or
-                next_stripped.startswith('![') or
-                next_stripped.startswith('**Figure') or
-                next_stripped == '---' or
-                next_stripped.startswith('<!--')):
-                break
-            para_lines.append(next_stripped)
-            j += 1
-
-        full_text = ' '.join(para_lines)
-        p = doc.add_paragraph()
-        process_inline_formatting(p, full_text)
-        i = j
-        continue
+    Chapters whose source and figures are unchanged since the last export
+    come from the fragment cache; the rest are built (in jobs worker
+    processes when jobs > 1) and cached for next time. With a streaming
+    writer, fragments go to it instead of doc, one chapter in memory at a
+    time.
+    """
+    keys = {chapter_file: _chapter_key(chapter_file) for chapter_file in chapter_files}
+    cached = set()
+    if not force:
+        cached = {f for f, key in keys.items() if key and has_fragment(f, key)}
+    stale = [f for f in chapter_files if f not in cached]
+
+    total_figures = 0
+    with contextlib.ExitStack() as stack:
+        if jobs > 1 and len(stale) > 1:
+            pool = stack.enter_context(ProcessPoolExecutor(max_workers=min(jobs, len(stale))))
+            # map() yields in submission order, so chapters merge in order
+            fresh = pool.map(_build_chapter_fragment, stale)
+        else:
+            fresh = map(_build_chapter_fragment, stale)
+
+        for chapter_file in chapter_files:
+            if chapter_file in cached:
+                print(f"  Processing: {chapter_file} (cached)")
+                # Loaded only now, so at most one cached chapter is in memory
+                result = load_fragment(chapter_file, keys[chapter_file])
+                if result is None:
+                    result = _build_chapter_fragment(chapter_file)
+            else:
+                print(f"  Processing: {chapter_file}")
+                result = next(fresh)
+                if keys[chapter_file]:
+                    save_fragment(chapter_file, keys[chapter_file], *result)
+            figs, fragment, output = result
+            if output:
+                print(output, end='')
+            if writer is not None:
+                writer.append_fragment(fragment)
+            else:
+                append_fragment(doc, fragment)
+            total_figures += figs
+            print(f"    -> {figs} figures embedded")
 
-    return figures_added
+    if writer is None:
+        renumber_drawings(doc)
+    print(f"\n  Chapters: {len(stale)} built, {len(cached)} from cache")
+    return total_figures
+
+
+def report_word(output_path):
+    """Print the saved Word document's path and size."""
+    size_mb = os.path.getsize(output_path) / (1024 * 1024)
+    print(f"  Word saved: {output_path} ({size_mb:.1f} MB)")
 
 
 def generate_word(doc, output_path):
     """Save the Word document."""
     doc.save(output_path)
-    size_mb = os.path.getsize(output_path) / (1024 * 1024)
-    print(f"  Word saved: {output_path} ({size_mb:.1f} MB)")
+    report_word(output_path)
+
+
+def default_pdf_backend():
+    """Word automation on Windows, the native fpdf2 renderer elsewhere."""
+    return 'word' if os.name == 'nt' else 'native'
+
+
+def generate_pdf_native(pdf_path, chapter_files):
+    """Render the chapters straight to PDF with fpdf2 (no Word needed)."""
+    try:
+        from tools.export.pdf import write_pdf
+    except ImportError:
+        print("  ERROR: fpdf2 not installed. Run: python -m pip install fpdf2")
+        return False
+
+    def front_matter(pdf):
+        pdf.add_title_page('Strategic Management', 'Concepts and Applications',
+                           ['MBA Strategy Course', 'Grand Canyon University'])
+
+    def parts():
+        for chapter_file in chapter_files:
+            filepath = os.path.join(CHAPTERS_DIR, chapter_file)
+            if not os.path.exists(filepath):
+                print(f"  SKIP: {chapter_file} not found")
+                continue
+            with open(filepath, 'r', encoding='utf-8') as f:
+                source = f.read()
+            yield md.tokenize(source), lambda src, ch=chapter_file: resolve_image_path(src, ch)
+
+    write_pdf(pdf_path, 'Strategic Management: Concepts and Applications',
+              front_matter, parts())
+    size_mb = os.path.getsize(pdf_path) / (1024 * 1024)
+    print(f"  PDF saved: {pdf_path} ({size_mb:.1f} MB)")
+    return True
 
 
 def generate_pdf(docx_path, pdf_path):
@@ -640,52 +557,174 @@ $word.Quit()
         return False
 
 
+# ── Export Targets ──────────────────────────────────────────────────────
+
+def target_paths(topics=None):
+    """DOCX and PDF paths for the whole course, or for a subset of topics."""
+    if not topics:
+        return OUTPUT_DOCX, OUTPUT_PDF
+    label = f'Topic-{topics[0]}' if len(topics) == 1 else 'Topics-' + '-'.join(topics)
+    base = os.path.join(OUTPUT_DIR, f'Strategy-Course-{label}')
+    return f'{base}.docx', f'{base}.pdf'
+
+
+def export_word(chapter_files, docx_path, jobs=1, force=False, stream=False):
+    """Build the title page, TOC and chapters and save them as one DOCX."""
+    doc = create_document()
+    add_title_page(doc)
+    add_toc_placeholder(doc)
+
+    if stream:
+        with StreamingDocxWriter(docx_path, doc) as writer:
+            total_figures = add_chapters(doc, chapter_files, jobs, force, writer)
+        print(f"\n  Total figures embedded: {total_figures}")
+        report_word(docx_path)
+    else:
+        total_figures = add_chapters(doc, chapter_files, jobs, force)
+        print(f"\n  Total figures embedded: {total_figures}")
+        generate_word(doc, docx_path)
+
+
+def export_pdf(chapter_files, docx_path, pdf_path, backend):
+    """Render the chapters natively, or convert the DOCX with Word."""
+    if backend == 'native':
+        print(f"\n  Rendering PDF (native)...")
+        generate_pdf_native(pdf_path, chapter_files)
+    else:
+        if not os.path.exists(docx_path):
+            print("  ERROR: Word file must be generated first for PDF conversion")
+            sys.exit(1)
+
+        print(f"\n  Converting to PDF...")
+        generate_pdf(docx_path, pdf_path)
+
+
+def _export_split_target(task):
+    """Worker: export one chapter's own DOCX (and native PDF).
+
+    Console output is captured and returned so the parent can print it in
+    chapter order.
+    """
+    chapter_file, docx_path, pdf_path, options = task
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        if options['word']:
+            export_word([chapter_file], docx_path, force=options['force'],
+                        stream=options['stream'])
+        if options['pdf'] == 'native':
+            export_pdf([chapter_file], docx_path, pdf_path, 'native')
+    return buf.getvalue()
+
+
+def export_split(chapters, jobs, options):
+    """
+    Export one DOCX/PDF per chapter, up to jobs documents at a time.
+
+    Word automation cannot be driven from several processes at once, so
+    with the Word backend the PDFs are converted one by one afterwards.
+
+    Returns [(docx_path, pdf_path)] in chapter order.
+    """
+    tasks = [(c.file, *target_paths([c.topic]), options) for c in chapters]
+    with contextlib.ExitStack() as stack:
+        if jobs > 1 and len(tasks) > 1:
+            pool = stack.enter_context(ProcessPoolExecutor(max_workers=min(jobs, len(tasks))))
+            outputs = pool.map(_export_split_target, tasks)
+        else:
+            outputs = map(_export_split_target, tasks)
+        for (chapter_file, _, _, _), output in zip(tasks, outputs):
+            print(f"  ── {chapter_file}")
+            print(output, end='')
+
+    if options['pdf'] == 'word':
+        for chapter_file, docx_path, pdf_path, _ in tasks:
+            export_pdf([chapter_file], docx_path, pdf_path, 'word')
+    return [(docx_path, pdf_path) for _, docx_path, pdf_path, _ in tasks]
+
+
+def _parse_topics(value, catalogue, parser):
+    """Topics from a comma-separated --topic value, checked against the catalogue."""
+    topics = []
+    for topic in (t.strip() for t in value.split(',') if t.strip()):
+        chapter = catalogue.chapter(topic)
+        if chapter is None:
+            known = ', '.join(c.topic for c in catalogue.chapters)
+            parser.error(f"unknown topic '{topic}' (chapters: {known})")
+        topics.append(chapter.topic)
+    return topics
+
+
 # ── Main ────────────────────────────────────────────────────────────────
 
 def main():
     parser = argparse.ArgumentParser(description='Export course to Word/PDF')
     parser.add_argument('--word-only', action='store_true', help='Only generate Word')
     parser.add_argument('--pdf-only', action='store_true', help='Only generate PDF')
+    parser.add_argument('--pdf-backend', choices=['auto', 'word', 'native'], default='auto',
+                        help='PDF via Word automation or the native fpdf2 renderer '
+                             '(auto: Word on Windows, native elsewhere)')
+    parser.add_argument('--topic', type=str, default=None,
+                        help='Export only these topics, comma-separated (e.g. 3 or 3,4)')
+    parser.add_argument('--split', action='store_true',
+                        help='Write one DOCX/PDF per chapter, several at a time')
+    parser.add_argument('--jobs', '-j', type=int, default=None,
+                        help='Build chapters in N worker processes, then merge; with '
+                             '--split, export N chapters at once (0 = one per CPU core; '
+                             'default 1, or one per core with --split)')
+    parser.add_argument('--force', action='store_true',
+                        help='Rebuild every chapter even if unchanged since the last export')
+    parser.add_argument('--stream', action='store_true',
+                        help='Write the DOCX chapter by chapter with bounded memory')
     args = parser.parse_args()
 
+    cpus = os.cpu_count() or 1
+    if args.jobs is None:
+        jobs = cpus if args.split else 1
+    else:
+        jobs = args.jobs if args.jobs > 0 else cpus
+
+    catalogue = load_catalogue()
+    topics = _parse_topics(args.topic, catalogue, parser) if args.topic else None
+    chapters = catalogue.select_chapters(topics)
+    if topics:
+        # Name outputs and report topics in export order
+        topics = [chapter.topic for chapter in chapters]
+    chapter_files = [chapter.file for chapter in chapters]
+    backend = default_pdf_backend() if args.pdf_backend == 'auto' else args.pdf_backend
+
     print(f"\n{'='*60}")
     print(f"  DOCUMENT EXPORT TOOL")
     print(f"  Source: output/chapters-with-figures/")
+    if topics:
+        print(f"  Topics: {', '.join(topics)}")
     print(f"{'='*60}\n")
 
-    # Build Word document
-    if not args.pdf_only:
-        doc = create_document()
-        add_title_page(doc)
-        add_toc_placeholder(doc)
-
-        total_figures = 0
-        for chapter_file in CHAPTER_FILES:
-            print(f"  Processing: {chapter_file}")
-            figs = process_chapter(doc, chapter_file)
-            total_figures += figs
-            print(f"    -> {figs} figures embedded")
-
-            # Page break between chapters
-            doc.add_page_break()
-
-        print(f"\n  Total figures embedded: {total_figures}")
-        generate_word(doc, OUTPUT_DOCX)
-
-    # Generate PDF
-    if not args.word_only:
-        if not os.path.exists(OUTPUT_DOCX):
-            print("  ERROR: Word file must be generated first for PDF conversion")
-            sys.exit(1)
-
-        print(f"\n  Converting to PDF...")
-        generate_pdf(OUTPUT_DOCX, OUTPUT_PDF)
+    if args.split:
+        options = {
+            'word': not args.pdf_only,
+            'pdf': None if args.word_only else backend,
+            'force': args.force,
+            'stream': args.stream,
+        }
+        targets = export_split(chapters, jobs, options)
+    else:
+        docx_path, pdf_path = target_paths(topics)
+        targets = [(docx_path, pdf_path)]
+
+        # Build Word document
+        if not args.pdf_only:
+            export_word(chapter_files, docx_path, jobs, args.force, args.stream)
+
+        # Generate PDF
+        if not args.word_only:
+            export_pdf(chapter_files, docx_path, pdf_path, backend)
 
     print(f"\n{'='*60}")
     print(f"  EXPORT COMPLETE")
-    print(f"  Word: {OUTPUT_DOCX}")
-    if not args.word_only:
-        print(f"  PDF:  {OUTPUT_PDF}")
+    for docx_path, pdf_path in targets:
+        print(f"  Word: {docx_path}")
+        if not args.word_only:
+            print(f"  PDF:  {pdf_path}")
     print(f"{'='*60}\n")
 
 
@@ -7,18 +7,26 @@ Each tool guide starts on a fresh page.
 Usage:
     python tools/export_tool_guides.py              # Generate both Word and PDF
     python tools/export_tool_guides.py --word-only   # Word only
-    python tools/export_tool_guides.py --pdf-only    # PDF only (requires Word)
+    python tools/export_tool_guides.py --pdf-only    # PDF only
+    python tools/export_tool_guides.py --pdf-backend native  # PDF without Word (fpdf2)
+    python tools/export_tool_guides.py --stream      # Bounded-memory DOCX writer
+    python tools/export_tool_guides.py --guide CPM   # One guide only
+    python tools/export_tool_guides.py --split       # One DOCX/PDF per guide, in parallel
 
 Output:
     output/Strategy-Tool-Guides-Complete.docx
     output/Strategy-Tool-Guides-Complete.pdf
+    output/Strategy-Tool-Guide-<name>.docx/.pdf     (--guide <name>, or --split)
+    output/Strategy-Tool-Guides-<a>-<b>.docx/.pdf   (--guide <a>,<b>)
 """
 
 import os
-import re
 import sys
 import subprocess
 import argparse
+import contextlib
+import io
+from concurrent.futures import ProcessPoolExecutor
 
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if PROJECT_ROOT not in sys.path:
@@ -28,89 +36,24 @@ from docx import Document
 from docx.shared import Inches, Pt, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.oxml.ns import qn
-from PIL import Image
+
+from tools.export import inline, markdown as md
+from tools.export.catalogue import load_catalogue
+from tools.export.fragments import extract_fragment
+from tools.export.images import fit_image
+from tools.export.stream import StreamingDocxWriter
+from tools.export.styles import (
+    BODY, BODY_BOLD, BODY_CODE, BODY_ITALIC, add_character_styles, add_link_run, add_styled_run,
+)
+from tools.export.tables import add_table, add_table_style
 
 # ── Paths ───────────────────────────────────────────────────────────────
 
 GUIDES_DIR = os.path.join(PROJECT_ROOT, 'output', 'tool-guides')
 GRAPHICS_DIR = os.path.join(PROJECT_ROOT, 'output', 'graphics', 'tool-guides')
-OUTPUT_DOCX = os.path.join(PROJECT_ROOT, 'output', 'Strategy-Tool-Guides-Complete.docx')
-OUTPUT_PDF = os.path.join(PROJECT_ROOT, 'output', 'Strategy-Tool-Guides-Complete.pdf')
-
-# Guide ordering and figure mapping
-# (filename, figure_png, figure_number, figure_title, alt_text)
-GUIDE_ORDER = [
-    {
-        'file': 'EFE-Matrix.md',
-        'figure': 'fig-tg-2-efe-example.png',
-        'figure_number': 'TG.2',
-        'figure_title': 'EFE Matrix Construction Example',
-        'alt_text': 'Table showing completed EFE Matrix example with opportunities, threats, weights, ratings, and weighted scores',
-    },
-    {
-        'file': 'IFE-Matrix.md',
-        'figure': 'fig-tg-3-ife-example.png',
-        'figure_number': 'TG.3',
-        'figure_title': 'IFE Matrix Construction Example',
-        'alt_text': 'Table showing completed IFE Matrix example with strengths, weaknesses, weights, ratings, and weighted scores',
-    },
-    {
-        'file': 'CPM.md',
-        'figure': 'fig-tg-4-cpm-example.png',
-        'figure_number': 'TG.4',
-        'figure_title': 'Competitive Profile Matrix Example',
-        'alt_text': 'Table showing CPM example comparing three competitors across critical success factors',
-    },
-    {
-        'file': 'SWOT-Matrix.md',
-        'figure': 'fig-tg-5-swot-example.png',
-        'figure_number': 'TG.5',
-        'figure_title': 'SWOT Matrix Strategy Development Example',
-        'alt_text': 'Completed SWOT Matrix showing SO, WO, ST, and WT strategies developed from SWOT factors',
-    },
-    {
-        'file': 'SPACE-Matrix.md',
-        'figure': 'fig-tg-6-space-example.png',
-        'figure_number': 'TG.6',
-        'figure_title': 'SPACE Matrix Plotting Example',
-        'alt_text': 'SPACE Matrix example with directional vector plotted from dimension scores',
-    },
-    {
-        'file': 'BCG-Matrix.md',
-        'figure': 'fig-tg-1-bcg-example.png',
-        'figure_number': 'TG.1',
-        'figure_title': 'BCG Matrix Worked Example',
-        'alt_text': 'BCG Matrix example showing four product divisions plotted in Stars, Question Marks, Cash Cows, and Dogs quadrants',
-    },
-    {
-        'file': 'IE-Matrix.md',
-        'figure': 'fig-tg-7-ie-example.png',
-        'figure_number': 'TG.7',
-        'figure_title': 'IE Matrix Positioning Example',
-        'alt_text': 'IE Matrix example showing division positioning based on IFE and EFE total weighted scores',
-    },
-    {
-        'file': 'Grand-Strategy-Matrix.md',
-        'figure': 'fig-tg-8-grand-strategy-example.png',
-        'figure_number': 'TG.8',
-        'figure_title': 'Grand Strategy Matrix Application Example',
-        'alt_text': 'Grand Strategy Matrix example showing company positioning based on competitive position and market growth',
-    },
-    {
-        'file': 'QSPM.md',
-        'figure': 'fig-tg-9-qspm-example.png',
-        'figure_number': 'TG.9',
-        'figure_title': 'QSPM Decision Analysis Example',
-        'alt_text': 'QSPM example showing attractiveness scores for two strategy alternatives across key factors',
-    },
-    {
-        'file': 'Perceptual-Map.md',
-        'figure': 'fig-tg-10-perceptual-map-example.png',
-        'figure_number': 'TG.10',
-        'figure_title': 'Perceptual Map Construction Example',
-        'alt_text': 'Perceptual map example showing competitor positioning on two strategic dimensions',
-    },
-]
+OUTPUT_DIR = os.path.join(PROJECT_ROOT, 'output')
+OUTPUT_DOCX = os.path.join(OUTPUT_DIR, 'Strategy-Tool-Guides-Complete.docx')
+OUTPUT_PDF = os.path.join(OUTPUT_DIR, 'Strategy-Tool-Guides-Complete.pdf')
 
 # ── Design Constants ────────────────────────────────────────────────────
 
@@ -162,11 +105,14 @@ def create_document():
         hpf.space_after = Pt(6)
         hpf.keep_with_next = True
 
+    add_character_styles(doc, FONT_FAMILY, FONT_BODY_SIZE, TEXT_COLOR)
+    add_table_style(doc)
+
     return doc
 
 
-def add_title_page(doc):
-    """Add a title page for tool guides collection."""
+def add_title_page(doc, guides):
+    """Add a title page for tool guides collection, listing the guides."""
     for _ in range(6):
         p = doc.add_paragraph()
         p.paragraph_format.space_after = Pt(0)
@@ -216,16 +162,10 @@ def add_title_page(doc):
     run.font.name = FONT_FAMILY
     run.bold = True
 
-    guide_names = [
-        'EFE Matrix', 'IFE Matrix', 'Competitive Profile Matrix',
-        'SWOT Matrix', 'SPACE Matrix', 'BCG Growth-Share Matrix',
-        'IE Matrix', 'Grand Strategy Matrix', 'QSPM',
-        'Perceptual Map',
-    ]
-    for name in guide_names:
+    for guide in guides:
         p = doc.add_paragraph()
         p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        run = p.add_run(name)
+        run = p.add_run(guide.name)
         run.font.size = Pt(10)
         run.font.color.rgb = TEXT_SECONDARY
         run.font.name = FONT_FAMILY
@@ -272,31 +212,15 @@ def add_image_to_doc(doc, img_path, alt_text=''):
         return
 
     try:
-        with Image.open(img_path) as img:
-            w_px, h_px = img.size
-            dpi = img.info.get('dpi', (200, 200))
-            dpi_x = dpi[0] if isinstance(dpi, tuple) else dpi
-            dpi_y = dpi[1] if isinstance(dpi, tuple) else dpi
-
-        w_inches = w_px / dpi_x
-        h_inches = h_px / dpi_y
-
-        max_w, max_h = 5.8, 7.0
-        if w_inches > max_w:
-            scale = max_w / w_inches
-            w_inches *= scale
-            h_inches *= scale
-        if h_inches > max_h:
-            scale = max_h / h_inches
-            w_inches *= scale
-            h_inches *= scale
+        # Right-sized, cached copy instead of the full-resolution original
+        fitted = fit_image(img_path)
 
         p = doc.add_paragraph()
         p.alignment = WD_ALIGN_PARAGRAPH.CENTER
         p.paragraph_format.space_before = Pt(6)
         p.paragraph_format.space_after = Pt(12)
         run = p.add_run()
-        run.add_picture(img_path, width=Inches(w_inches))
+        run.add_picture(fitted.path, width=Inches(fitted.width_in))
 
     except Exception as e:
         p = doc.add_paragraph()
@@ -305,87 +229,25 @@ def add_image_to_doc(doc, img_path, alt_text=''):
         run.italic = True
 
 
-def process_inline_formatting(paragraph, text):
-    """Parse inline Markdown bold/italic and add runs."""
-    pattern = re.compile(
-        r'(\*\*\*(.+?)\*\*\*)'
-        r'|(\*\*(.+?)\*\*)'
-        r'|(\*(.+?)\*)'
-    )
-
-    last_end = 0
-    for match in pattern.finditer(text):
-        start = match.start()
-        if start > last_end:
-            run = paragraph.add_run(text[last_end:start])
-            run.font.name = FONT_FAMILY
-            run.font.size = FONT_BODY_SIZE
-            run.font.color.rgb = TEXT_COLOR
-
-        if match.group(2):
-            run = paragraph.add_run(match.group(2))
-            run.bold = True
-            run.italic = True
-        elif match.group(4):
-            run = paragraph.add_run(match.group(4))
-            run.bold = True
-        elif match.group(6):
-            run = paragraph.add_run(match.group(6))
-            run.italic = True
+# Character style for each inline span kind (bold italic and links are special)
+_SPAN_STYLES = {
+    inline.PLAIN: BODY,
+    inline.BOLD: BODY_BOLD,
+    inline.ITALIC: BODY_ITALIC,
+    inline.CODE: BODY_CODE,
+}
 
-        run.font.name = FONT_FAMILY
-        run.font.size = FONT_BODY_SIZE
-        run.font.color.rgb = TEXT_COLOR
-        last_end = match.end()
-
-    if last_end < len(text):
-        run = paragraph.add_run(text[last_end:])
-        run.font.name = FONT_FAMILY
-        run.font.size = FONT_BODY_SIZE
-        run.font.color.rgb = TEXT_COLOR
 
-
-def _apply_cell_formatting(cell, text, is_header=False, font_size=Pt(9)):
-    """Apply inline formatting to a table cell."""
-    cell.text = ''  # Clear default paragraph
-    p = cell.paragraphs[0]
-    p.paragraph_format.space_before = Pt(2)
-    p.paragraph_format.space_after = Pt(2)
-
-    # Strip markdown bold/italic markers and detect formatting
-    clean = text.strip()
-    bold = is_header
-    italic = False
-
-    if clean.startswith('**') and clean.endswith('**'):
-        clean = clean[2:-2]
-        bold = True
-    elif clean.startswith('*') and clean.endswith('*'):
-        clean = clean[1:-1]
-        italic = True
-
-    run = p.add_run(clean)
-    run.font.name = FONT_FAMILY
-    run.font.size = font_size
-    run.font.color.rgb = TEXT_COLOR
-    run.bold = bold
-    run.italic = italic
-
-
-def _parse_table_row(line):
-    """Parse a Markdown table row into a list of cell strings."""
-    stripped = line.strip()
-    if stripped.startswith('|'):
-        stripped = stripped[1:]
-    if stripped.endswith('|'):
-        stripped = stripped[:-1]
-    return [cell.strip() for cell in stripped.split('|')]
-
-
-def _is_separator_row(line):
-    """Check if a line is a Markdown table separator (|---|---|)."""
-    stripped = line.strip().replace(' ', '')
-    return bool(re.match(r'^\|?[-:|]+(\|[-:|]+)+\|?$', stripped))
+def process_inline_formatting(paragraph, text):
+    """Parse inline Markdown (bold, italic, code, links) and add runs."""
+    for span in inline.parse_inline(text):
+        if span.kind == inline.BOLD_ITALIC:
+            run = add_styled_run(paragraph, span.text, BODY_BOLD)
+            run.italic = True
+        elif span.kind == inline.LINK:
+            add_link_run(paragraph, span.text, span.url)
+        else:
+            add_styled_run(paragraph, span.text, _SPAN_STYLES[span.kind])
 
 
 def add_markdown_table(doc, table_lines):
@@ -394,15 +256,15 @@ def add_markdown_table(doc, table_lines):
         return
 
     # Parse header row
-    header_cells = _parse_table_row(table_lines[0])
+    header_cells = md.parse_table_row(table_lines[0])
     num_cols = len(header_cells)
 
     # Find data rows (skip separator)
     data_rows = []
     for line in table_lines[1:]:
-        if _is_separator_row(line):
+        if md.is_separator_row(line):
             continue
-        cells = _parse_table_row(line)
+        cells = md.parse_table_row(line)
         # Pad or trim to match column count
         while len(cells) < num_cols:
             cells.append('')
@@ -413,43 +275,8 @@ def add_markdown_table(doc, table_lines):
     if total_rows < 2:
         return
 
-    # Create Word table
-    table = doc.add_table(rows=total_rows, cols=num_cols)
-    table.style = 'Table Grid'
-    table.autofit = True
-
-    # Header row
-    header_row = table.rows[0]
-    for j, cell_text in enumerate(header_cells):
-        cell = header_row.cells[j]
-        _apply_cell_formatting(cell, cell_text, is_header=True, font_size=Pt(9))
-        # Header background
-        shading = cell._element.get_or_add_tcPr()
-        shd = shading.makeelement(qn('w:shd'), {
-            qn('w:val'): 'clear',
-            qn('w:color'): 'auto',
-            qn('w:fill'): '1B2A4A',
-        })
-        shading.append(shd)
-        # White text for header
-        for run in cell.paragraphs[0].runs:
-            run.font.color.rgb = RGBColor(0xFF, 0xFF, 0xFF)
-
-    # Data rows
-    for i, row_cells in enumerate(data_rows):
-        row = table.rows[i + 1]
-        for j, cell_text in enumerate(row_cells):
-            cell = row.cells[j]
-            _apply_cell_formatting(cell, cell_text, is_header=False, font_size=Pt(9))
-            # Alternate row shading
-            if i % 2 == 1:
-                shading = cell._element.get_or_add_tcPr()
-                shd = shading.makeelement(qn('w:shd'), {
-                    qn('w:val'): 'clear',
-                    qn('w:color'): 'auto',
-                    qn('w:fill'): 'F0F4F8',
-                })
-                shading.append(shd)
+    # Build the table XML in one pass; shading comes from the table style
+    add_table(doc, header_cells, data_rows)
 
     # Add spacing after table
     p = doc.add_paragraph()
@@ -457,170 +284,163 @@ def add_markdown_table(doc, table_lines):
     p.paragraph_format.space_after = Pt(6)
 
 
-def process_guide(doc, guide_entry):
-    """Parse a tool guide Markdown file and add it to the Word document."""
-    filepath = os.path.join(GUIDES_DIR, guide_entry['file'])
-    if not os.path.exists(filepath):
-        print(f"  SKIP: {guide_entry['file']} not found")
-        return False
+# Headings after which the worked-example figure is inserted (after the
+# heading's first paragraph)
+FIGURE_INSERT_HEADINGS = [
+    'worked example', 'step-by-step', 'interpretation',
+    'how to read', 'plotting the result', 'constructing the map',
+]
+
 
+def read_guide(guide):
+    """Return a guide's Markdown source, or None if the file is missing."""
+    filepath = os.path.join(GUIDES_DIR, guide.file)
+    if not os.path.exists(filepath):
+        print(f"  SKIP: {guide.file} not found")
+        return None
     with open(filepath, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
+        return f.read()
+
+
+def guide_blocks(source, guide):
+    """
+    Tokenize a guide and place its worked-example figure in the stream.
 
-    # Track whether we've inserted the figure (insert after "Step-by-Step" or
-    # "Worked Example" or "Interpretation" section heading)
+    The figure (a Figure block with an absolute image path) follows the
+    first paragraph after the first trigger heading, or comes straight
+    after the heading if no paragraph follows. Without a trigger heading
+    it goes at the end.
+    """
+    entry = guide.figure
+    figure = md.Figure(entry['figure_number'], entry['title'],
+                       md.Image(entry['alt_text'], os.path.join(GRAPHICS_DIR, entry['filename'])))
     figure_inserted = False
-    figure_insert_headings = [
-        'worked example', 'step-by-step', 'interpretation',
-        'how to read', 'plotting the result', 'constructing the map',
-    ]
-
-    i = 0
-    while i < len(lines):
-        line = lines[i].rstrip('\n')
-        stripped = line.strip()
-
-        # Skip HTML comments
-        if stripped.startswith('<!--'):
-            i += 1
-            continue
+    figure_pending = False
+
+    for block in md.tokenize(source, figures=False):
+        if figure_pending:
+            figure_pending = False
+            if type(block) is md.Paragraph:
+                yield block
+                yield figure
+                continue
+            yield figure
 
-        # Skip horizontal rules
-        if stripped == '---':
-            i += 1
-            continue
+        yield block
 
-        # Empty line
-        if stripped == '':
-            i += 1
-            continue
+        if type(block) is md.Heading and not figure_inserted:
+            heading_lower = block.text.lower()
+            if any(trigger in heading_lower for trigger in FIGURE_INSERT_HEADINGS):
+                figure_pending = True
+                figure_inserted = True
 
-        # Headings
-        if stripped.startswith('#'):
-            heading_match = re.match(r'^(#{1,4})\s+(.+)$', stripped)
-            if heading_match:
-                level = len(heading_match.group(1))
-                heading_text = heading_match.group(2).strip()
-                heading_clean = re.sub(r'\*+', '', heading_text)
-                doc.add_heading(heading_clean, level=min(level, 4))
-
-                # Check if we should insert the figure after this heading's first paragraph
-                if not figure_inserted:
-                    heading_lower = heading_clean.lower()
-                    for trigger in figure_insert_headings:
-                        if trigger in heading_lower:
-                            # Skip to end of first paragraph after heading, then insert figure
-                            i += 1
-                            # Skip blanks
-                            while i < len(lines) and lines[i].strip() == '':
-                                i += 1
-                            # Read first paragraph
-                            para_lines = []
-                            while i < len(lines):
-                                nl = lines[i].rstrip('\n').strip()
-                                if nl == '' or nl.startswith('#') or nl.startswith('- ') or nl.startswith('* '):
-                                    break
-                                para_lines.append(nl)
-                                i += 1
-
-                            if para_lines:
-                                p = doc.add_paragraph()
-                                process_inline_formatting(p, ' '.join(para_lines))
-
-                            # Now insert the figure
-                            _insert_guide_figure(doc, guide_entry)
-                            figure_inserted = True
-                            continue
-
-                i += 1
-                continue
+    if figure_pending or not figure_inserted:
+        yield figure
 
-        # Bullet list
-        if stripped.startswith('- ') or stripped.startswith('* '):
-            text = stripped[2:]
-            p = doc.add_paragraph(style='List Bullet')
-            process_inline_formatting(p, text)
-            i += 1
-            continue
 
-        # Numbered list
-        num_match = re.match(r'^(\d+)\.\s+(.+)$', stripped)
-        if num_match:
-            text = num_match.group(2)
-            p = doc.add_paragraph(style='List Number')
-            process_inline_formatting(p, text)
-            i += 1
-            continue
+def process_guide(doc, guide):
+    """Parse a tool guide Markdown file and add it to the Word document."""
+    source = read_guide(guide)
+    if source is None:
+        return False
 
-        # Markdown table (pipe-delimited rows)
-        if stripped.startswith('|'):
-            table_lines = []
-            j = i
-            while j < len(lines):
-                tl = lines[j].rstrip('\n').strip()
-                if tl.startswith('|'):
-                    table_lines.append(tl)
-                    j += 1
-                else:
-                    break
-            if len(table_lines) >= 2:
-                add_markdown_table(doc, table_lines)
-            i = j
-            continue
+    for block in guide_blocks(source, guide):
+        kind = type(block)
 
-        # Regular paragraph
-        para_lines = [stripped]
-        j = i + 1
-        while j < len(lines):
-            next_stripped = lines[j].rstrip('\n').strip()
-            if (next_stripped == '' or
-                next_stripped.startswith('#') or
-                next_stripped.startswith('- ') or
-                next_stripped.startswith('* ') or
-                next_stripped.startswith('|') or
-                re.match(r'^\d+\.\s', next_stripped) or
-                next_stripped == '---' or
-                next_stripped.startswith('<!--')):
-                break
-            para_lines.append(next_stripped)
-            j += 1
-
-        full_text = ' '.join(para_lines)
-        p = doc.add_paragraph()
-        process_inline_formatting(p, full_text)
-        i = j
-        continue
+        if kind is md.Heading:
+            doc.add_heading(block.text, level=min(block.level, 4))
+
+        elif kind is md.Figure:
+            _insert_guide_figure(doc, block)
+
+        elif kind is md.ListItem:
+            style = 'List Number' if block.ordered else 'List Bullet'
+            p = doc.add_paragraph(style=style)
+            process_inline_formatting(p, block.text)
 
-    # If figure wasn't inserted by a trigger heading, insert it at the end
-    # (before any Key Terms / References sections if we can detect them)
-    if not figure_inserted:
-        _insert_guide_figure(doc, guide_entry)
+        elif kind is md.Table:
+            add_markdown_table(doc, block.lines)
+
+        else:
+            p = doc.add_paragraph()
+            process_inline_formatting(p, block.text)
 
     return True
 
 
-def _insert_guide_figure(doc, guide_entry):
-    """Insert the tool guide's worked-example figure."""
-    fig_path = os.path.join(GRAPHICS_DIR, guide_entry['figure'])
+def add_guides(doc, guides, writer=None):
+    """
+    Add tool guides to doc, in the given order, and return how many were found.
+
+    With a streaming writer, each guide is built in its own document and
+    handed to the writer as a fragment, so only one guide is in memory.
+    """
+    guides_processed = 0
+    for guide in guides:
+        print(f"  Processing: {guide.file}")
+        target = create_document() if writer is not None else doc
+        if process_guide(target, guide):
+            guides_processed += 1
+            print(f"    -> OK (figure: {guide.figure['figure_number']})")
+
+        # Page break between guides
+        target.add_page_break()
+        if writer is not None:
+            writer.append_fragment(extract_fragment(target))
+    return guides_processed
 
+
+def _insert_guide_figure(doc, figure):
+    """Insert the tool guide's worked-example figure."""
     # Figure label
     p = doc.add_paragraph()
     p.alignment = WD_ALIGN_PARAGRAPH.CENTER
     p.paragraph_format.space_before = Pt(12)
     p.paragraph_format.space_after = Pt(2)
-    run = p.add_run(f'Figure {guide_entry["figure_number"]}. ')
+    run = p.add_run(f'Figure {figure.number}. ')
     run.bold = True
     run.font.name = FONT_FAMILY
     run.font.size = Pt(10)
     run.font.color.rgb = TEXT_COLOR
-    run = p.add_run(guide_entry['figure_title'])
+    run = p.add_run(figure.title)
     run.italic = True
     run.font.name = FONT_FAMILY
     run.font.size = Pt(10)
     run.font.color.rgb = TEXT_SECONDARY
 
     # Image
-    add_image_to_doc(doc, fig_path, guide_entry['alt_text'])
+    add_image_to_doc(doc, figure.image.src, figure.image.alt)
+
+
+def default_pdf_backend():
+    """Word automation on Windows, the native fpdf2 renderer elsewhere."""
+    return 'word' if os.name == 'nt' else 'native'
+
+
+def generate_pdf_native(pdf_path, guides):
+    """Render the tool guides straight to PDF with fpdf2 (no Word needed)."""
+    try:
+        from tools.export.pdf import write_pdf
+    except ImportError:
+        print("  ERROR: fpdf2 not installed. Run: python -m pip install fpdf2")
+        return False
+
+    def front_matter(pdf):
+        pdf.add_title_page('Strategic Management Tool Guides', 'Frameworks for Strategic Analysis',
+                           ['MBA Strategy Course', 'Grand Canyon University'],
+                           list_heading='Included Guides:', list_items=[g.name for g in guides],
+                           title_size=32, subtitle_size=18)
+
+    def parts():
+        for guide in guides:
+            source = read_guide(guide)
+            if source is not None:
+                yield guide_blocks(source, guide), None
+
+    write_pdf(pdf_path, 'Strategic Management Tool Guides', front_matter, parts())
+    size_mb = os.path.getsize(pdf_path) / (1024 * 1024)
+    print(f"  PDF saved: {pdf_path} ({size_mb:.1f} MB)")
+    return True
 
 
 def generate_pdf(docx_path, pdf_path):
@@ -657,51 +477,151 @@ $word.Quit()
         return False
 
 
+# ── Export Targets ──────────────────────────────────────────────────────
+
+def target_paths(guides=None):
+    """DOCX and PDF paths for all guides, or for a subset of them."""
+    if not guides:
+        return OUTPUT_DOCX, OUTPUT_PDF
+    stems = [os.path.splitext(g.file)[0] for g in guides]
+    label = f'Guide-{stems[0]}' if len(stems) == 1 else 'Guides-' + '-'.join(stems)
+    base = os.path.join(OUTPUT_DIR, f'Strategy-Tool-{label}')
+    return f'{base}.docx', f'{base}.pdf'
+
+
+def export_word(guides, docx_path, stream=False):
+    """Build the title page, TOC and guides and save them as one DOCX."""
+    doc = create_document()
+    add_title_page(doc, guides)
+    add_toc(doc)
+
+    if stream:
+        with StreamingDocxWriter(docx_path, doc) as writer:
+            guides_processed = add_guides(doc, guides, writer)
+    else:
+        guides_processed = add_guides(doc, guides)
+        doc.save(docx_path)
+
+    print(f"\n  {guides_processed} tool guides compiled")
+    size_mb = os.path.getsize(docx_path) / (1024 * 1024)
+    print(f"  Word saved: {docx_path} ({size_mb:.1f} MB)")
+
+
+def export_pdf(guides, docx_path, pdf_path, backend):
+    """Render the guides natively, or convert the DOCX with Word."""
+    if backend == 'native':
+        print(f"\n  Rendering PDF (native)...")
+        generate_pdf_native(pdf_path, guides)
+    else:
+        if not os.path.exists(docx_path):
+            print("  ERROR: Word file must exist for PDF conversion")
+            sys.exit(1)
+        print(f"\n  Converting to PDF...")
+        generate_pdf(docx_path, pdf_path)
+
+
+def _export_split_target(task):
+    """Worker: export one guide's own DOCX (and native PDF); return console output."""
+    guide, docx_path, pdf_path, options = task
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        if options['word']:
+            export_word([guide], docx_path, stream=options['stream'])
+        if options['pdf'] == 'native':
+            export_pdf([guide], docx_path, pdf_path, 'native')
+    return buf.getvalue()
+
+
+def export_split(guides, jobs, options):
+    """
+    Export one DOCX/PDF per guide, up to jobs documents at a time.
+
+    Word automation cannot be driven from several processes at once, so
+    with the Word backend the PDFs are converted one by one afterwards.
+
+    Returns [(docx_path, pdf_path)] in guide order.
+    """
+    tasks = [(g, *target_paths([g]), options) for g in guides]
+    with contextlib.ExitStack() as stack:
+        if jobs > 1 and len(tasks) > 1:
+            pool = stack.enter_context(ProcessPoolExecutor(max_workers=min(jobs, len(tasks))))
+            outputs = pool.map(_export_split_target, tasks)
+        else:
+            outputs = map(_export_split_target, tasks)
+        for (guide, _, _, _), output in zip(tasks, outputs):
+            print(f"  ── {guide.file}")
+            print(output, end='')
+
+    if options['pdf'] == 'word':
+        for guide, docx_path, pdf_path, _ in tasks:
+            export_pdf([guide], docx_path, pdf_path, 'word')
+    return [(docx_path, pdf_path) for _, docx_path, pdf_path, _ in tasks]
+
+
+def _parse_guides(value, catalogue, parser):
+    """Guides from a comma-separated --guide value (filenames or stems, any case)."""
+    names = [n.strip() for n in value.split(',') if n.strip()]
+    for name in names:
+        if catalogue.guide(name) is None:
+            known = ', '.join(os.path.splitext(g.file)[0] for g in catalogue.guides)
+            parser.error(f"unknown guide '{name}' (guides: {known})")
+    return catalogue.select_guides(names)
+
+
 # ── Main ────────────────────────────────────────────────────────────────
 
 def main():
     parser = argparse.ArgumentParser(description='Export tool guides to Word/PDF')
     parser.add_argument('--word-only', action='store_true')
     parser.add_argument('--pdf-only', action='store_true')
+    parser.add_argument('--pdf-backend', choices=['auto', 'word', 'native'], default='auto',
+                        help='PDF via Word automation or the native fpdf2 renderer '
+                             '(auto: Word on Windows, native elsewhere)')
+    parser.add_argument('--guide', type=str, default=None,
+                        help='Export only these guides, comma-separated file names '
+                             'or stems (e.g. EFE-Matrix,CPM)')
+    parser.add_argument('--split', action='store_true',
+                        help='Write one DOCX/PDF per guide, several at a time')
+    parser.add_argument('--jobs', '-j', type=int, default=0,
+                        help='With --split, export N guides at once (0 = one per CPU core)')
+    parser.add_argument('--stream', action='store_true',
+                        help='Write the DOCX one guide at a time with bounded memory')
     args = parser.parse_args()
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+
+    catalogue = load_catalogue()
+    selected = _parse_guides(args.guide, catalogue, parser) if args.guide else None
+    guides = selected or catalogue.guides
+    backend = default_pdf_backend() if args.pdf_backend == 'auto' else args.pdf_backend
 
     print(f"\n{'='*60}")
     print(f"  TOOL GUIDE EXPORT")
     print(f"  Source: output/tool-guides/")
     print(f"{'='*60}\n")
 
-    if not args.pdf_only:
-        doc = create_document()
-        add_title_page(doc)
-        add_toc(doc)
+    if args.split:
+        options = {
+            'word': not args.pdf_only,
+            'pdf': None if args.word_only else backend,
+            'stream': args.stream,
+        }
+        targets = export_split(guides, jobs, options)
+    else:
+        docx_path, pdf_path = target_paths(selected)
+        targets = [(docx_path, pdf_path)]
 
-        guides_processed = 0
-        for entry in GUIDE_ORDER:
-            print(f"  Processing: {entry['file']}")
-            if process_guide(doc, entry):
-                guides_processed += 1
-                print(f"    -> OK (figure: {entry['figure_number']})")
+        if not args.pdf_only:
+            export_word(guides, docx_path, args.stream)
 
-            # Page break between guides
-            doc.add_page_break()
-
-        print(f"\n  {guides_processed} tool guides compiled")
-        doc.save(OUTPUT_DOCX)
-        size_mb = os.path.getsize(OUTPUT_DOCX) / (1024 * 1024)
-        print(f"  Word saved: {OUTPUT_DOCX} ({size_mb:.1f} MB)")
-
-    if not args.word_only:
-        if not os.path.exists(OUTPUT_DOCX):
-            print("  ERROR: Word file must exist for PDF conversion")
-            sys.exit(1)
-        print(f"\n  Converting to PDF...")
-        generate_pdf(OUTPUT_DOCX, OUTPUT_PDF)
+        if not args.word_only:
+            export_pdf(guides, docx_path, pdf_path, backend)
 
     print(f"\n{'='*60}")
     print(f"  EXPORT COMPLETE")
-    print(f"  Word: {OUTPUT_DOCX}")
-    if not args.word_only:
-        print(f"  PDF:  {OUTPUT_PDF}")
+    for docx_path, pdf_path in targets:
+        print(f"  Word: {docx_path}")
+        if not args.word_only:
+            print(f"  PDF:  {pdf_path}")
     print(f"{'='*60}\n")
 
 
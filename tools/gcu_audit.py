@@ -8,37 +8,36 @@ Usage:
     python tools/gcu_audit.py                  # Audit all output files
     python tools/gcu_audit.py --file <path>    # Audit one file
     python tools/gcu_audit.py --json           # Output JSON for PDF tool
+    python tools/gcu_audit.py --jobs 4         # Audit in 4 worker processes (0 = one per core)
+    python tools/gcu_audit.py --force          # Re-audit files unchanged since the last run
+
+Results are cached in output/qr-grades/.audit-cache.json, keyed on each
+file's content hash and a version hash of the checks; an unchanged file
+reuses its stored result and is reported with "cached": true.
 """
 
+import hashlib
 import os
 import re
 import sys
 import json
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
 # ── Configuration ────────────────────────────────────────────────────────────
 
 BASE = Path(__file__).resolve().parent.parent
+if str(BASE) not in sys.path:
+    sys.path.insert(0, str(BASE))
+
+from tools.scripture import find_refs
+from tools.term_index import TermIndex
+
 CHAPTERS_DIR = BASE / "output" / "chapters"
 TOOLGUIDES_DIR = BASE / "output" / "tool-guides"
-
-BIBLE_BOOKS = [
-    "Genesis", "Exodus", "Leviticus", "Numbers", "Deuteronomy",
-    "Joshua", "Judges", "Ruth", "1 Samuel", "2 Samuel",
-    "1 Kings", "2 Kings", "1 Chronicles", "2 Chronicles",
-    "Ezra", "Nehemiah", "Esther", "Job", "Psalm", "Psalms",
-    "Proverbs", "Ecclesiastes", "Song of Solomon", "Isaiah",
-    "Jeremiah", "Lamentations", "Ezekiel", "Daniel", "Hosea",
-    "Joel", "Amos", "Obadiah", "Jonah", "Micah", "Nahum",
-    "Habakkuk", "Zephaniah", "Haggai", "Zechariah", "Malachi",
-    "Matthew", "Mark", "Luke", "John", "Acts", "Romans",
-    "1 Corinthians", "2 Corinthians", "Galatians", "Ephesians",
-    "Philippians", "Colossians", "1 Thessalonians", "2 Thessalonians",
-    "1 Timothy", "2 Timothy", "Titus", "Philemon", "Hebrews",
-    "James", "1 Peter", "2 Peter", "1 John", "2 John", "3 John",
-    "Jude", "Revelation",
-]
+AUDIT_CACHE = BASE / "output" / "qr-grades" / ".audit-cache.json"
 
 # Words that should NOT be title-cased in headings (APA/standard style)
 TITLE_CASE_SMALL = {
@@ -60,70 +59,115 @@ def get_sections(text):
     return parts
 
 
-def get_body_text(text):
-    """Return text excluding Key Terms, Knowledge Check, References sections."""
+# ── Content model ────────────────────────────────────────────────────────────
+# Each file is parsed once by parse_content(); every check reads the result
+# instead of re-splitting and re-searching the raw text.
+
+# Sections left out of body text: the back matter checked on its own
+BODY_EXCLUDED_RE = re.compile(r"^##\s+(Key Terms|Knowledge Check|References)")
+H2_RE = re.compile(r"^##\s+")
+HEADING_RE = re.compile(r"^(#{1,6})\s+(.+)$")
+BOLD_RE = re.compile(r"\*\*(.+?)\*\*")
+# Per-word clean-up in the heading and ALL-CAPS checks
+WORD_MARKUP_RE = re.compile(r"[*_`\[\](){}]")
+NON_ALPHA_RE = re.compile(r"[^A-Za-z]")
+
+# Sections whose content the checks read, keyed by heading text
+MODEL_SECTIONS = {
+    "Key Terms": re.compile(r"^##\s+Key Terms\s*$"),
+    "References": re.compile(r"^##\s+References\s*$"),
+}
+
+# One parsed content file, shared by every check:
+#   text            full file text
+#   lines           text.split("\n")
+#   headings        [(line_number, level, heading_text)]
+#   body_lines      lines outside Key Terms / Knowledge Check / References
+#   body            "\n".join(body_lines)
+#   body_code_mask  per body line: inside (or opening/closing) a ``` block
+#   body_bolds      **bold** spans in body text, in order
+#   sections        {"Key Terms"/"References": content below the heading, or None}
+#   has_references  some ## heading starts with "References"
+#   key_terms       **bold** spans in the Key Terms section
+#   scripture_refs  [(line_number, ScriptureRef)] (see tools/scripture.py)
+ContentModel = namedtuple("ContentModel", [
+    "text", "lines", "headings", "body_lines", "body", "body_code_mask",
+    "body_bolds", "sections", "has_references", "key_terms", "scripture_refs",
+])
+
+
+def parse_content(text):
+    """Parse a content file into the ContentModel every check reads, in one pass over its lines."""
     lines = text.split("\n")
+    headings = []
     body_lines = []
+    body_code_mask = []
+    body_bolds = []
+    section_bounds = {}
+    open_section = None
+    has_references = False
+    scripture_refs = []
+
     skip = False
-    for line in lines:
-        if re.match(r"^##\s+(Key Terms|Knowledge Check|References)", line):
-            skip = True
-        elif re.match(r"^##\s+", line) and skip:
-            skip = False
+    in_code = False
+    for i, line in enumerate(lines):
+        m = HEADING_RE.match(line)
+        if m:
+            headings.append((i + 1, len(m.group(1)), m.group(2).strip()))
+
+        if line.startswith("##") and (len(line) == 2 or line[2].isspace()):
+            # A section runs to the next "## " line
+            if open_section is not None:
+                section_bounds[open_section] = (section_bounds[open_section], i)
+                open_section = None
+            for name, pattern in MODEL_SECTIONS.items():
+                if name not in section_bounds and pattern.match(line) and i + 1 < len(lines):
+                    section_bounds[name] = i + 1
+                    open_section = name
+            if H2_RE.match(line):
+                if BODY_EXCLUDED_RE.match(line):
+                    skip = True
+                    has_references = has_references or line[2:].lstrip().startswith("References")
+                else:
+                    skip = False
+
         if not skip:
             body_lines.append(line)
-    return "\n".join(body_lines)
+            fence = line.strip().startswith("```")
+            if fence:
+                in_code = not in_code
+            body_code_mask.append(fence or in_code)
+            body_bolds.extend(BOLD_RE.findall(line))
 
+        for ref in find_refs(line):
+            scripture_refs.append((i + 1, ref))
 
-def get_headings(text):
-    """Return list of (line_number, level, heading_text) tuples."""
-    headings = []
-    for i, line in enumerate(text.split("\n"), 1):
-        m = re.match(r"^(#{1,6})\s+(.+)$", line)
-        if m:
-            headings.append((i, len(m.group(1)), m.group(2).strip()))
-    return headings
-
-
-def find_scripture_refs(text):
-    """Find scripture references and return list of (line_num, ref_text, has_translation)."""
-    refs = []
-    book_pattern = "|".join(re.escape(b) for b in BIBLE_BOOKS)
-    pattern = rf"(?:{book_pattern})\s+\d+[:\d\-,\s]*"
-    for i, line in enumerate(text.split("\n"), 1):
-        for m in re.finditer(pattern, line):
-            ref_text = m.group(0).strip()
-            # Check if translation version follows within 30 chars
-            after = line[m.end():m.end()+40]
-            has_trans = bool(re.search(
-                r"(?:NIV|ESV|KJV|NKJV|NLT|NASB|CSB|RSV|NRSV|New International Version|English Standard Version)",
-                after, re.IGNORECASE
-            ))
-            # Also check parenthetical around the ref
-            before_start = max(0, m.start() - 5)
-            context = line[before_start:m.end()+40]
-            if not has_trans:
-                has_trans = bool(re.search(
-                    r"(?:NIV|ESV|KJV|NKJV|NLT|NASB|CSB|RSV|NRSV)",
-                    context, re.IGNORECASE
-                ))
-            refs.append((i, ref_text, has_trans))
-    return refs
+    if open_section is not None:
+        section_bounds[open_section] = (section_bounds[open_section], len(lines))
+
+    sections = {name: None for name in MODEL_SECTIONS}
+    for name, (start, end) in section_bounds.items():
+        sections[name] = "\n".join(lines[start:end])
+    key_terms = BOLD_RE.findall(sections["Key Terms"]) if sections["Key Terms"] is not None else []
+
+    return ContentModel(
+        text, lines, headings, body_lines, "\n".join(body_lines), body_code_mask,
+        body_bolds, sections, has_references, key_terms, scripture_refs,
+    )
 
 
 # ── Individual Checks ────────────────────────────────────────────────────────
 
-def check_references_section(text, filename):
+def check_references_section(doc, filename):
     """Check 1: References section exists with APA entries."""
     findings = []
-    has_section = bool(re.search(r"^##\s+References\s*$", text, re.MULTILINE))
+    has_section = any(level == 2 and heading == "References" for _, level, heading in doc.headings)
     if not has_section:
         return "FAIL", ["No ## References section found"], 0
 
     # Extract references section content
-    match = re.search(r"^##\s+References\s*\n(.*?)(?=^##\s|\Z)", text, re.MULTILINE | re.DOTALL)
-    if match:
-        ref_content = match.group(1).strip()
+    if doc.sections["References"] is not None:
+        ref_content = doc.sections["References"].strip()
         if len(ref_content) < 20:
             return "FAIL", ["References section exists but appears empty"], 0
         # Check for APA-like entries (Author, Year pattern)
@@ -135,9 +179,9 @@ def check_references_section(text, filename):
     return "FAIL", ["References section header found but no content follows"], 0
 
 
-def check_apa_citations(text, filename):
+def check_apa_citations(doc, filename):
     """Check 2: In-text citations use (Author, Year) format."""
-    body = get_body_text(text)
+    body = doc.body
     findings = []
 
     # Look for APA in-text citations: (Author, Year) or (Author & Author, Year)
@@ -155,18 +199,18 @@ def check_apa_citations(text, filename):
         return "WARN", ["Only 1 APA citation found; academic content typically needs more"], 50
     else:
         # Check if there's a References section (might just be missing in-text format)
-        if re.search(r"^##\s+References", text, re.MULTILINE):
+        if doc.has_references:
             return "WARN", ["References section exists but no (Author, Year) in-text citations detected in body"], 25
         return "FAIL", ["No APA in-text citations detected"], 0
 
 
-def check_scripture_citations(text, filename):
+def check_scripture_citations(doc, filename):
     """Check 3: Scripture citations include translation version."""
-    refs = find_scripture_refs(text)
+    refs = doc.scripture_refs
     if not refs:
         return "PASS", ["No scripture references found (N/A)"], 100
 
-    missing = [(ln, ref) for ln, ref, has_t in refs if not has_t]
+    missing = [(ln, ref.text) for ln, ref in refs if ref.translation is None]
     total = len(refs)
     with_trans = total - len(missing)
 
@@ -184,63 +228,41 @@ def check_scripture_citations(text, filename):
     return status, findings, score
 
 
-def check_key_terms_section(text, filename):
+def check_key_terms_section(doc, filename):
     """Check 4: Key Terms section exists."""
-    has_section = bool(re.search(r"^##\s+Key Terms\s*$", text, re.MULTILINE))
-    if has_section:
-        match = re.search(r"^##\s+Key Terms\s*\n(.*?)(?=^##\s|\Z)", text, re.MULTILINE | re.DOTALL)
-        if match:
-            content = match.group(1).strip()
-            bold_terms = re.findall(r"\*\*(.+?)\*\*", content)
-            if len(bold_terms) >= 3:
-                return "PASS", [f"Key Terms section found with {len(bold_terms)} terms"], 100
-            elif len(bold_terms) >= 1:
-                return "WARN", [f"Key Terms section found but only {len(bold_terms)} term(s)"], 75
-            else:
-                return "WARN", ["Key Terms section exists but no bolded terms detected"], 50
+    if doc.sections["Key Terms"] is not None:
+        bold_terms = doc.key_terms
+        if len(bold_terms) >= 3:
+            return "PASS", [f"Key Terms section found with {len(bold_terms)} terms"], 100
+        elif len(bold_terms) >= 1:
+            return "WARN", [f"Key Terms section found but only {len(bold_terms)} term(s)"], 75
+        else:
+            return "WARN", ["Key Terms section exists but no bolded terms detected"], 50
     return "FAIL", ["No ## Key Terms section found"], 0
 
 
-def check_key_terms_bolded(text, filename):
+def check_key_terms_bolded(doc, filename):
     """Check 5: Key terms are bolded on first use in body."""
-    # Extract key terms from Key Terms section
-    match = re.search(r"^##\s+Key Terms\s*\n(.*?)(?=^##\s|\Z)", text, re.MULTILINE | re.DOTALL)
-    if not match:
+    if doc.sections["Key Terms"] is None:
         return "PASS", ["No Key Terms section to validate against (N/A)"], 100
 
-    content = match.group(1)
-    # Find terms defined in Key Terms: look for **Term**: or - **Term**:
-    terms = re.findall(r"\*\*(.+?)\*\*", content)
+    # Terms defined in Key Terms: **Term**: or - **Term**:
+    terms = doc.key_terms
     if not terms:
         return "PASS", ["No key terms defined to check (N/A)"], 100
 
-    body = get_body_text(text)
+    index = TermIndex(terms, doc.body, doc.body_bolds)
     not_bolded = []
     for term in terms:
-        escaped = re.escape(term)
-        # Check if term appears bolded at least once in body (exact case)
-        if re.search(rf"\*\*{escaped}\*\*", body):
+        # Term appears bolded at least once in body (any case)
+        if index.bolded(term):
             continue
-        # Check case-insensitive bolded match
-        if re.search(rf"\*\*{escaped}\*\*", body, re.IGNORECASE):
-            continue
-        # Check if the term (or close variant) appears bolded as part of a larger phrase
+        # The term (or close variant) appears bolded as part of a larger phrase
         # e.g., Key Term "Weighted Score" might appear in bold as "total weighted score"
-        term_words = term.lower().split()
-        if len(term_words) >= 2:
-            # Check if all words of the term appear in any bolded phrase in body
-            body_bolds = re.findall(r"\*\*(.+?)\*\*", body)
-            found_in_phrase = False
-            for bb in body_bolds:
-                bb_lower = bb.lower()
-                if all(w in bb_lower for w in term_words):
-                    found_in_phrase = True
-                    break
-            if found_in_phrase:
-                continue
-
-        # Check if the term appears anywhere in body (unbolded)
-        if re.search(re.escape(term), body, re.IGNORECASE):
+        if len(term.split()) >= 2 and index.in_bold_phrase(term):
+            continue
+        # The term appears somewhere in body, unbolded
+        if index.mentioned(term):
             not_bolded.append(term)
 
     if not not_bolded:
@@ -254,9 +276,9 @@ def check_key_terms_bolded(text, filename):
     return status, findings, score
 
 
-def check_headings_no_colons(text, filename):
+def check_headings_no_colons(doc, filename):
     """Check 6: Headings don't end with colons or periods."""
-    headings = get_headings(text)
+    headings = doc.headings
     violations = []
     for ln, level, heading in headings:
         clean = heading.rstrip()
@@ -275,9 +297,9 @@ def check_headings_no_colons(text, filename):
     return "FAIL", findings, score
 
 
-def check_headings_title_case(text, filename):
+def check_headings_title_case(doc, filename):
     """Check 7: Headings use title case."""
-    headings = get_headings(text)
+    headings = doc.headings
     violations = []
     for ln, level, heading in headings:
         # Skip HTML comments, code-like headings
@@ -286,7 +308,7 @@ def check_headings_title_case(text, filename):
         words = heading.split()
         for i, word in enumerate(words):
             # Strip markdown formatting
-            clean = re.sub(r"[*_`\[\](){}]", "", word).strip("—-:,;")
+            clean = WORD_MARKUP_RE.sub("", word).strip("—-:,;")
             if not clean or clean.isdigit():
                 continue
             if i == 0:
@@ -313,16 +335,12 @@ def check_headings_title_case(text, filename):
     return status, findings, score
 
 
-def check_emphasis_abuse(text, filename):
+def check_emphasis_abuse(doc, filename):
     """Check 8: No bold/italic/caps used for emphasis in body (bold only for key terms)."""
-    body = get_body_text(text)
     findings = []
 
-    # Extract key terms for cross-reference
-    key_terms = []
-    kt_match = re.search(r"^##\s+Key Terms\s*\n(.*?)(?=^##\s|\Z)", text, re.MULTILINE | re.DOTALL)
-    if kt_match:
-        key_terms = re.findall(r"\*\*(.+?)\*\*", kt_match.group(1))
+    # Key terms for cross-reference
+    key_terms = doc.key_terms
     key_terms_lower = {t.lower() for t in key_terms}
 
     # Known legitimate acronyms that appear as ALL-CAPS
@@ -332,7 +350,7 @@ def check_emphasis_abuse(text, filename):
     }
 
     # Find bold text in body that isn't in a heading, table header, or key term definition context
-    lines = body.split("\n")
+    lines = doc.body_lines
     suspicious_bold = []
     for i, line in enumerate(lines, 1):
         # Skip headings, table rows, code blocks
@@ -349,7 +367,7 @@ def check_emphasis_abuse(text, filename):
             continue
 
         # Find bold words/phrases that look like emphasis
-        bolds = re.findall(r"\*\*(.+?)\*\*", line)
+        bolds = BOLD_RE.findall(line)
         for b in bolds:
             # Allow: single-word bold (key terms, proper nouns)
             if len(b.split()) <= 1:
@@ -401,7 +419,7 @@ def check_emphasis_abuse(text, filename):
             continue
         words = line.split()
         for w in words:
-            clean = re.sub(r"[^A-Za-z]", "", w)
+            clean = NON_ALPHA_RE.sub("", w)
             if clean.isupper() and len(clean) > 6 and clean not in KNOWN_ACRONYMS:
                 caps_abuse.append((i, clean))
 
@@ -423,13 +441,13 @@ def check_emphasis_abuse(text, filename):
     return status, findings, score
 
 
-def check_table_figure_numbering(text, filename):
+def check_table_figure_numbering(doc, filename):
     """Check 9: Tables/figures use GCU format (bold number + italic title, no periods)."""
     findings = []
     violations = []
 
     # Find table/figure references
-    lines = text.split("\n")
+    lines = doc.lines
     i = 0
     while i < len(lines):
         line = lines[i].strip()
@@ -463,7 +481,7 @@ def check_table_figure_numbering(text, filename):
         i += 1
 
     # Count total tables/figures
-    total = len(re.findall(r"(?:Table|Figure)\s+\d+", text))
+    total = len(re.findall(r"(?:Table|Figure)\s+\d+", doc.text))
     if total == 0:
         return "PASS", ["No tables or figures found (N/A)"], 100
 
@@ -478,21 +496,13 @@ def check_table_figure_numbering(text, filename):
     return status, findings, score
 
 
-def check_no_external_links(text, filename):
+def check_no_external_links(doc, filename):
     """Check 10 & 12: No external hyperlinks in body text."""
-    body = get_body_text(text)
     findings = []
 
-    # Find URLs
-    urls = re.findall(r"https?://[^\s\)]+", body)
-    # Filter out markdown reference-style links that might be in footnotes
-    # Also allow URLs inside code blocks
-    in_code = False
+    # Find URLs, allowing those inside code blocks
     real_urls = []
-    for line in body.split("\n"):
-        if line.strip().startswith("```"):
-            in_code = not in_code
-            continue
+    for line, in_code in zip(doc.body_lines, doc.body_code_mask):
         if in_code:
             continue
         for url in re.findall(r"https?://[^\s\)]+", line):
@@ -507,12 +517,12 @@ def check_no_external_links(text, filename):
     return "FAIL", findings, 0
 
 
-def check_block_quotes(text, filename):
+def check_block_quotes(doc, filename):
     """Check 11: Any 40+ word direct quotes use block format."""
     # Look for quoted text over 40 words
     # Pattern: text within quotation marks
     long_quotes = []
-    for i, line in enumerate(text.split("\n"), 1):
+    for i, line in enumerate(doc.lines, 1):
         # Find text in double quotes
         for m in re.finditer(r'"([^"]{200,})"', line):
             word_count = len(m.group(1).split())
@@ -545,9 +555,9 @@ ALL_CHECKS = [
 ]
 
 
-def audit_file(filepath):
-    """Run all checks on a single file. Returns dict of results."""
-    text = read_file(filepath)
+def audit_file(filepath, text=None):
+    """Run all checks on a single file (text: its contents, if already read). Returns dict of results."""
+    doc = parse_content(read_file(filepath) if text is None else text)
     name = Path(filepath).stem
     content_type = "Chapter" if "chapter" in str(filepath).lower() or "topic" in name.lower() else "Tool Guide"
 
@@ -565,7 +575,7 @@ def audit_file(filepath):
     statuses = []
 
     for check_name, check_fn in ALL_CHECKS:
-        status, findings, score = check_fn(text, name)
+        status, findings, score = check_fn(doc, name)
         results["checks"].append({
             "name": check_name,
             "status": status,
@@ -588,6 +598,96 @@ def audit_file(filepath):
     return results
 
 
+# ── Results Cache ────────────────────────────────────────────────────────────
+
+# Modules whose source decides check results; any edit invalidates the cache
+AUDIT_SOURCES = [
+    Path(__file__).resolve(),
+    BASE / "tools" / "scripture.py",
+    BASE / "tools" / "term_index.py",
+]
+
+
+def checks_version():
+    """Hash of the check list and the code behind it."""
+    h = hashlib.sha256()
+    for check_name, check_fn in ALL_CHECKS:
+        h.update(f"{check_name}\0{check_fn.__name__}\0".encode("utf-8"))
+    for path in AUDIT_SOURCES:
+        h.update(hashlib.sha256(path.read_bytes()).digest())
+    return h.hexdigest()
+
+
+def content_hash(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def load_cache(path=AUDIT_CACHE):
+    """Stored results for the current checks: {"version", "files": {path: {"hash", "result"}}}."""
+    version = checks_version()
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+        if cache.get("version") == version and isinstance(cache.get("files"), dict):
+            return cache
+    except (OSError, ValueError):
+        pass
+    return {"version": version, "files": {}}
+
+
+def save_cache(cache, path=AUDIT_CACHE):
+    """Write the cache atomically, dropping entries for files that no longer exist."""
+    cache["files"] = {p: entry for p, entry in cache["files"].items() if Path(p).exists()}
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(cache, f)
+    os.replace(tmp_path, path)
+
+
+def _audit_task(task):
+    filepath, text = task
+    return audit_file(filepath, text)
+
+
+def audit_files(files, jobs=1, cache=None, force=False):
+    """
+    Audit files, in up to jobs worker processes.
+
+    With a cache (from load_cache), a file whose content hash matches its
+    entry reuses the stored result unless force is set; every other file
+    is audited and its entry replaced. Each result carries "cached".
+
+    Results come back in the order of files, however the work was split.
+    """
+    texts = [read_file(f) for f in files]
+    hashes = [content_hash(text) for text in texts]
+    results = [None] * len(files)
+    stale = []
+    for i, filepath in enumerate(files):
+        entry = None if cache is None or force else cache["files"].get(str(Path(filepath).resolve()))
+        if entry is not None and entry["hash"] == hashes[i]:
+            results[i] = dict(entry["result"], filepath=str(filepath), cached=True)
+        else:
+            stale.append(i)
+
+    tasks = [(files[i], texts[i]) for i in stale]
+    if jobs > 1 and len(tasks) > 1:
+        workers = min(jobs, len(tasks))
+        # Several files per task once there are many more files than workers
+        chunksize = max(1, len(tasks) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            audited = list(pool.map(_audit_task, tasks, chunksize=chunksize))
+    else:
+        audited = [_audit_task(task) for task in tasks]
+
+    for i, result in zip(stale, audited):
+        if cache is not None:
+            cache["files"][str(Path(files[i]).resolve())] = {"hash": hashes[i], "result": result}
+        results[i] = dict(result, cached=False)
+    return results
+
+
 def collect_files():
     """Gather all .md files from output directories."""
     files = []
@@ -631,10 +731,14 @@ def main():
         print("No .md files found in output directories.")
         sys.exit(1)
 
-    all_results = []
-    for f in files:
-        result = audit_file(f)
-        all_results.append(result)
+    jobs = 1
+    if "--jobs" in args:
+        idx = args.index("--jobs")
+        jobs = int(args[idx + 1]) or os.cpu_count() or 1
+
+    cache = load_cache()
+    all_results = audit_files(files, jobs, cache, force="--force" in args)
+    save_cache(cache)
 
     if output_json:
         print(json.dumps(all_results, indent=2))
@@ -657,7 +761,9 @@ def main():
     with open(json_path, "w", encoding="utf-8") as jf:
         json.dump(all_results, jf, indent=2)
     if not output_json:
-        print(f"\nAudit results saved to: {json_path}")
+        cached = sum(1 for r in all_results if r["cached"])
+        print(f"\n{len(all_results) - cached} file(s) audited, {cached} unchanged (cached)")
+        print(f"Audit results saved to: {json_path}")
 
     return all_results
 
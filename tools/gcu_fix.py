@@ -21,29 +21,14 @@ from pathlib import Path
 from copy import deepcopy
 
 BASE = Path(__file__).resolve().parent.parent
+if str(BASE) not in sys.path:
+    sys.path.insert(0, str(BASE))
+
+from tools.scripture import find_refs
+
 CHAPTERS_DIR = BASE / "output" / "chapters"
 TOOLGUIDES_DIR = BASE / "output" / "tool-guides"
 
-BIBLE_BOOKS = [
-    "Genesis", "Exodus", "Leviticus", "Numbers", "Deuteronomy",
-    "Joshua", "Judges", "Ruth", "1 Samuel", "2 Samuel",
-    "1 Kings", "2 Kings", "1 Chronicles", "2 Chronicles",
-    "Ezra", "Nehemiah", "Esther", "Job", "Psalm", "Psalms",
-    "Proverbs", "Ecclesiastes", "Song of Solomon", "Isaiah",
-    "Jeremiah", "Lamentations", "Ezekiel", "Daniel", "Hosea",
-    "Joel", "Amos", "Obadiah", "Jonah", "Micah", "Nahum",
-    "Habakkuk", "Zephaniah", "Haggai", "Zechariah", "Malachi",
-    "Matthew", "Mark", "Luke", "John", "Acts", "Romans",
-    "1 Corinthians", "2 Corinthians", "Galatians", "Ephesians",
-    "Philippians", "Colossians", "1 Thessalonians", "2 Thessalonians",
-    "1 Timothy", "2 Timothy", "Titus", "Philemon", "Hebrews",
-    "James", "1 Peter", "2 Peter", "1 John", "2 John", "3 John",
-    "Jude", "Revelation",
-]
-
-TRANSLATIONS = {"NIV", "ESV", "KJV", "NKJV", "NLT", "NASB", "CSB", "RSV", "NRSV",
-                "New International Version", "English Standard Version"}
-
 NIV_REF = '\n\nNew International Version Bible. (2011). Zondervan. (Original work published 1978)\n'
 
 
@@ -62,10 +47,6 @@ def write_file(path, content):
 def fix_scripture_citations(text):
     """Add NIV translation to scripture references that don't have one."""
     changes = 0
-    book_pattern = "|".join(re.escape(b) for b in BIBLE_BOOKS)
-    # Match scripture references like "Proverbs 28:13" or "1 Peter 4:10"
-    pattern = rf"(?<!\w)({book_pattern})\s+(\d+[:\d\-,\s]*\d+)"
-
     lines = text.split("\n")
     new_lines = []
     niv_added_to_refs = False
@@ -76,41 +57,27 @@ def fix_scripture_citations(text):
             new_lines.append(line)
             continue
 
-        # Check if line already has a translation marker near any scripture ref
-        new_line = line
-        for m in re.finditer(pattern, line):
-            ref_text = m.group(0)
-            # Check if translation already follows within 30 chars
-            after = line[m.end():m.end() + 40]
-            before_context = line[max(0, m.start() - 15):m.end() + 40]
-            has_trans = any(t in before_context for t in TRANSLATIONS)
-
-            if not has_trans:
-                # Add (NIV) after the reference
-                # Check what follows: if it's a quote or teaches/says, insert before that
-                insert_pos = m.end()
-
-                # Handle common patterns:
-                # "Proverbs 28:13 teaches" -> "Proverbs 28:13 (NIV) teaches"
-                # "Proverbs 28:13:" -> "Proverbs 28:13 (NIV):"
-                # "(Proverbs 28:13)" -> "(Proverbs 28:13, NIV)"
-
-                # Check if ref is inside parentheses
-                paren_before = line[max(0, m.start()-2):m.start()]
-                paren_after = line[m.end():m.end()+2].strip()
-
-                if "(" in paren_before and paren_after.startswith(")"):
-                    # Inside parentheses: add ", NIV" before closing paren
-                    new_line = new_line.replace(ref_text + ")", ref_text + ", NIV)", 1)
-                    changes += 1
-                else:
-                    # Not in parens: add (NIV) after reference
-                    # But be careful not to double-add
-                    if " (NIV)" not in new_line[m.start():m.end()+10]:
-                        new_line = new_line[:insert_pos] + " (NIV)" + new_line[insert_pos:]
-                        changes += 1
-
-        new_lines.append(new_line)
+        # Rebuild the line around references with no translation nearby
+        parts = []
+        last_end = 0
+        for ref in find_refs(line):
+            if ref.translation is not None:
+                continue
+            parts.append(line[last_end:ref.end])
+            last_end = ref.end
+
+            # "Proverbs 28:13 teaches" -> "Proverbs 28:13 (NIV) teaches"
+            # "Proverbs 28:13:" -> "Proverbs 28:13 (NIV):"
+            # "(Proverbs 28:13)" -> "(Proverbs 28:13, NIV)"
+            paren_before = line[max(0, ref.start - 2):ref.start]
+            paren_after = line[ref.end:ref.end + 2].strip()
+            if "(" in paren_before and paren_after.startswith(")"):
+                parts.append(", NIV")
+            else:
+                parts.append(" (NIV)")
+            changes += 1
+        parts.append(line[last_end:])
+        new_lines.append("".join(parts))
 
     result = "\n".join(new_lines)
 
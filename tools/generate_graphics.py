@@ -9,13 +9,27 @@ Usage:
     python tools/generate_graphics.py --id vrio_tree  # Generate one figure
     python tools/generate_graphics.py --verify     # Verify all outputs exist
     python tools/generate_graphics.py --list       # List all registered figures
+    python tools/generate_graphics.py --jobs 4     # Render with 4 worker processes
+    python tools/generate_graphics.py --force      # Re-render even unchanged figures
+    python tools/generate_graphics.py --profile    # Per-figure timing/memory report
+    python tools/generate_graphics.py --formats png,svg,pdf  # Vector copies too
+    python tools/generate_graphics.py --optimize-png  # Lossless PNG recompression
+    python tools/generate_graphics.py --serve      # Warm render server (IDs on stdin)
+    python tools/generate_graphics.py --serve --watch  # ...and re-render on YAML edits
 """
 
 import argparse
+import contextlib
+import glob
 import importlib
+import importlib.metadata
+import io
 import os
+import socketserver
 import sys
+import threading
 import time
+from concurrent.futures import ProcessPoolExecutor
 
 # Ensure project root is on the path
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -23,9 +37,14 @@ if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
 from tools.graphics.manifest import (
-    load_manifest, load_data_file, filter_figures,
-    get_output_path, validate_manifest, generate_manifest_md
+    load_manifest, load_data_file, get_figure_data, filter_figures,
+    get_output_path, get_output_paths, validate_manifest, generate_manifest_md
 )
+from tools.graphics.build_cache import (
+    CACHE_FILENAME, figure_hash, load_build_cache, save_build_cache
+)
+from tools.graphics import profiling
+from tools.graphics.optimize import DEFAULT_LEVEL as DEFAULT_PNG_LEVEL
 
 
 # ── Renderer Registry ──────────────────────────────────────────────────
@@ -61,6 +80,19 @@ MANIFEST_PATH = os.path.join(PROJECT_ROOT, 'tools', 'graphics', 'data', 'manifes
 DATA_DIR = os.path.join(PROJECT_ROOT, 'tools', 'graphics', 'data')
 OUTPUT_DIR = os.path.join(PROJECT_ROOT, 'output', 'graphics')
 MANIFEST_MD_PATH = os.path.join(OUTPUT_DIR, 'MANIFEST.md')
+BUILD_CACHE_PATH = os.path.join(OUTPUT_DIR, CACHE_FILENAME)
+PROFILE_JSON_PATH = os.path.join(OUTPUT_DIR, 'render-profile.json')
+PROFILE_CSV_PATH = os.path.join(OUTPUT_DIR, 'render-profile.csv')
+GRAPHICS_DIR = os.path.join(PROJECT_ROOT, 'tools', 'graphics')
+
+# Modules whose source affects every figure's output
+SHARED_SOURCES = [
+    os.path.join(GRAPHICS_DIR, 'config.py'),
+    os.path.join(GRAPHICS_DIR, 'base.py'),
+]
+
+# Text metrics (and so cached layouts) can change between matplotlib releases
+MATPLOTLIB_VERSION = importlib.metadata.version('matplotlib')
 
 
 # ── Core Functions ──────────────────────────────────────────────────────
@@ -77,8 +109,8 @@ def generate_figure(figure_entry):
         print(f"  ERROR: Data file not found: {data_file}")
         return False
 
-    all_data = load_data_file(data_path)
-    figure_data = all_data.get(fid, {})
+    with profiling.phase('load'):
+        figure_data = get_figure_data(data_path, fid)
 
     if not figure_data:
         print(f"  ERROR: No data for figure '{fid}' in {data_file}")
@@ -91,7 +123,14 @@ def generate_figure(figure_entry):
     # Get renderer and generate
     try:
         renderer = get_renderer(renderer_name)
+        before = profiling.get_timings()
+        start = time.perf_counter()
         renderer.render(figure_entry, figure_data, output_path)
+        elapsed = time.perf_counter() - start
+        # Renderer body = render() minus the phases save_figure() ran inside
+        after = profiling.get_timings()
+        nested = sum(after[p] - before[p] for p in ('layout', 'save', 'optimize'))
+        profiling.record('render', elapsed - nested)
         return True
     except Exception as e:
         print(f"  ERROR generating '{fid}': {e}")
@@ -100,19 +139,164 @@ def generate_figure(figure_entry):
         return False
 
 
-def generate_all(figures):
-    """Generate all figures in the list."""
+def compute_figure_hash(figure_entry):
+    """Content hash for a figure, or None if its inputs can't be resolved."""
+    module = RENDERERS.get(figure_entry.get('renderer'))
+    data_path = os.path.join(DATA_DIR, figure_entry.get('data_file', ''))
+    if module is None or not os.path.isfile(data_path):
+        return None
+
+    renderer_path = os.path.join(PROJECT_ROOT, *module.split('.')) + '.py'
+    figure_data = get_figure_data(data_path, figure_entry['id'])
+    return figure_hash(dict(figure_entry, _matplotlib=MATPLOTLIB_VERSION),
+                       figure_data, SHARED_SOURCES + [renderer_path])
+
+
+def cached_layout(figure_entry, fig_hash, cache):
+    """Tight bbox measured on the last render of identical content, if any."""
+    record = cache.get(figure_entry['id'])
+    if fig_hash is None or not record or record.get('hash') != fig_hash:
+        return None
+    return record.get('layout')
+
+
+def update_cache_record(cache, figure_entry, fig_hash, ok, result):
+    """Record a render's outcome (layout, PNG sizes) in the build cache."""
+    if ok and fig_hash is not None:
+        cache[figure_entry['id']] = {'hash': fig_hash, **result}
+    else:
+        cache.pop(figure_entry['id'], None)
+
+
+def is_up_to_date(figure_entry, fig_hash, cache, formats=('png',), png_level=None):
+    """
+    True if the figure's hash matches the last build, its PNG was written
+    with the same optimisation level, and all requested outputs exist.
+    """
+    if fig_hash is None:
+        return False
+    record = cache.get(figure_entry['id'])
+    if not record or record.get('hash') != fig_hash:
+        return False
+    if record.get('png_level') != png_level:
+        return False
+    paths = get_output_paths(figure_entry, OUTPUT_DIR, formats)
+    return all(os.path.exists(p) for p in paths.values())
+
+
+# ── Worker Pool ─────────────────────────────────────────────────────────
+
+def _init_worker(profile=False, formats=('png',), png_level=None):
+    """Pool initializer: configure output and import every renderer once."""
+    from tools.graphics import base
+
+    profiling.enable(profile)
+    base.set_output_formats(formats)
+    base.set_png_optimization(png_level)
+    for name in RENDERERS:
+        get_renderer(name)
+
+
+def _run_figure(figure_entry, layout_hint=None):
+    """
+    Generate one figure.
+
+    Returns (ok, stats, result): stats is None unless profiling; result
+    holds what the build cache keeps about the render (the tight bbox
+    save_figure() applied, and PNG sizes if optimisation is on).
+    """
+    from tools.graphics import base
+
+    base.set_layout_hint(layout_hint)
+    stats = None
+    if not profiling.is_enabled():
+        ok = generate_figure(figure_entry)
+    else:
+        profiling.reset()
+        start = time.perf_counter()
+        ok = generate_figure(figure_entry)
+        stats = profiling.get_timings()
+        stats['total'] = time.perf_counter() - start
+        stats['peak_rss_mb'] = profiling.peak_rss_mb()
+
+    result = {'layout': base.last_layout()}
+    if base.get_png_optimization() is not None:
+        result['png_level'] = base.get_png_optimization()
+        result['png_bytes'] = base.last_png_bytes()
+    return ok, stats, result
+
+
+def _generate_in_worker(figure_entry, layout_hint=None):
+    """Run a figure in a worker, capturing its console output.
+
+    Output is returned to the parent so it can be printed under the right
+    progress line instead of interleaving with other workers.
+    """
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf), contextlib.redirect_stderr(buf):
+        ok, stats, result = _run_figure(figure_entry, layout_hint)
+    return ok, buf.getvalue(), stats, result
+
+
+def _iter_results(figures, jobs, layout_hints, formats, png_level):
+    """Yield (ok, captured_output, stats, result) per figure, in manifest order."""
+    if jobs <= 1 or len(figures) <= 1:
+        if figures:
+            _init_worker(profiling.is_enabled(), formats, png_level)
+        for fig, hint in zip(figures, layout_hints):
+            ok, stats, result = _run_figure(fig, hint)
+            yield ok, '', stats, result
+        return
+
+    workers = min(jobs, len(figures))
+    with ProcessPoolExecutor(max_workers=workers,
+                             initializer=_init_worker,
+                             initargs=(profiling.is_enabled(), formats,
+                                       png_level)) as pool:
+        # map() yields in submission order, so progress stays ordered
+        # even though figures finish out of order across workers.
+        yield from pool.map(_generate_in_worker, figures, layout_hints)
+
+
+def generate_all(figures, jobs=1, force=False, profile=False, formats=('png',),
+                 png_level=None):
+    """
+    Generate all figures in the list, optionally across worker processes.
+
+    Figures whose content hash matches the build cache and whose output
+    files (one per requested format) all exist are skipped unless force is
+    True. With profile=True every figure is rendered and per-phase timings
+    are written next to MANIFEST.md. png_level (0-9) losslessly recompresses
+    each PNG in the worker that rendered it.
+    """
     total = len(figures)
     success = 0
+    skipped = 0
     failed = []
+    profile_records = []
+
+    profiling.enable(profile)
+    force = force or profile
+
+    cache = load_build_cache(BUILD_CACHE_PATH)
+    hashes = {fig['id']: compute_figure_hash(fig) for fig in figures}
+    stale = [fig for fig in figures
+             if force or not is_up_to_date(fig, hashes[fig['id']], cache, formats, png_level)]
+    stale_ids = {fig['id'] for fig in stale}
+    # Forced re-renders of unchanged content reuse the measured layout
+    layout_hints = [cached_layout(fig, hashes[fig['id']], cache) for fig in stale]
 
     print(f"\n{'='*60}")
     print(f"  COURSE GRAPHICS GENERATOR")
-    print(f"  Generating {total} figures...")
+    if jobs > 1:
+        print(f"  Generating {total} figures ({jobs} workers)...")
+    else:
+        print(f"  Generating {total} figures...")
     print(f"{'='*60}\n")
 
     start_time = time.time()
 
+    results = _iter_results(stale, jobs, layout_hints, formats, png_level)
     for i, fig in enumerate(figures, 1):
         fid = fig['id']
         fnum = fig['figure_number']
@@ -120,7 +304,21 @@ def generate_all(figures):
 
         print(f"  [{i:2d}/{total}]  Fig {fnum:6s}  {fid:30s}  ", end='', flush=True)
 
-        if generate_figure(fig):
+        if fid not in stale_ids:
+            print("UNCHANGED")
+            success += 1
+            skipped += 1
+            continue
+
+        ok, output, stats, result = next(results)
+        if output:
+            print()
+            print(output, end='')
+        if stats is not None:
+            profile_records.append(_profile_record(fig, ok, stats))
+
+        update_cache_record(cache, fig, hashes[fid], ok, result)
+        if ok:
             print("OK")
             success += 1
         else:
@@ -128,18 +326,67 @@ def generate_all(figures):
             failed.append(fid)
 
     elapsed = time.time() - start_time
+    if stale:
+        save_build_cache(BUILD_CACHE_PATH, cache)
 
     print(f"\n{'='*60}")
     print(f"  RESULTS: {success}/{total} generated successfully ({elapsed:.1f}s)")
+    if skipped:
+        print(f"  UNCHANGED: {skipped} skipped (use --force to re-render)")
     if failed:
         print(f"  FAILED ({len(failed)}): {', '.join(failed)}")
     print(f"{'='*60}\n")
 
+    if profile_records:
+        summary = profiling.write_profile(profile_records,
+                                          PROFILE_JSON_PATH, PROFILE_CSV_PATH)
+        print_profile_summary(summary)
+
     return success, failed
 
 
-def verify_outputs(figures):
-    """Verify all expected output files exist and have non-zero size."""
+def _profile_record(figure_entry, ok, stats):
+    """Flatten one figure's profiling stats into a report row."""
+    data_path = os.path.join(DATA_DIR, figure_entry.get('data_file', ''))
+    style = ''
+    if os.path.isfile(data_path):
+        style = get_figure_data(data_path, figure_entry['id']).get('style', '')
+    record = {
+        'id': figure_entry['id'],
+        'figure_number': figure_entry['figure_number'],
+        'renderer': figure_entry['renderer'],
+        'style': style,
+        'ok': ok,
+    }
+    for key, value in stats.items():
+        record[key] = round(value, 5) if isinstance(value, float) else value
+    return record
+
+
+def print_profile_summary(summary):
+    """Print per-renderer profiling rollups, slowest first."""
+    print(f"{'='*85}")
+    print(f"  RENDER PROFILE BY RENDERER (seconds)")
+    print(f"{'='*85}")
+    print(f"  {'Renderer':15s} {'Figs':>4s} {'Total':>7s} {'Mean':>6s} "
+          f"{'Load':>6s} {'Render':>7s} {'Layout':>7s} {'Save':>6s} {'Opt':>6s} {'RSS MB':>7s}")
+    print(f"  {'-'*15} {'-'*4} {'-'*7} {'-'*6} {'-'*6} {'-'*7} {'-'*7} {'-'*6} {'-'*6} {'-'*7}")
+    for row in summary:
+        rss = f"{row['peak_rss_mb']:7.1f}" if row['peak_rss_mb'] is not None else f"{'n/a':>7s}"
+        print(f"  {row['renderer']:15s} {row['figures']:4d} {row['total']:7.2f} "
+              f"{row['mean']:6.2f} {row['load']:6.3f} {row['render']:7.2f} "
+              f"{row['layout']:7.2f} {row['save']:6.2f} {row['optimize']:6.2f} {rss}")
+    print(f"{'='*85}")
+    print(f"  Profile written to {os.path.relpath(PROFILE_JSON_PATH, PROJECT_ROOT)} "
+          f"and {os.path.basename(PROFILE_CSV_PATH)}\n")
+
+
+def verify_outputs(figures, formats=('png',)):
+    """
+    Verify all expected output files exist and have non-zero size.
+
+    PNGs recompressed by --optimize-png show their size before -> after.
+    """
     print(f"\n{'='*60}")
     print(f"  VERIFICATION: Checking {len(figures)} figures...")
     print(f"{'='*60}\n")
@@ -147,25 +394,39 @@ def verify_outputs(figures):
     missing = []
     empty = []
     ok = 0
+    png_before = png_after = 0
+    cache = load_build_cache(BUILD_CACHE_PATH)
 
     for fig in figures:
-        output_path = get_output_path(fig, OUTPUT_DIR)
-        if not os.path.exists(output_path):
-            missing.append(fig['id'])
-            print(f"  MISSING: {fig['figure_number']} — {output_path}")
-        elif os.path.getsize(output_path) == 0:
-            empty.append(fig['id'])
-            print(f"  EMPTY:   {fig['figure_number']} — {output_path}")
-        else:
-            size_kb = os.path.getsize(output_path) / 1024
-            print(f"  OK:      {fig['figure_number']:6s}  {fig['id']:30s}  {size_kb:6.1f} KB")
-            ok += 1
+        for fmt, output_path in get_output_paths(fig, OUTPUT_DIR, formats).items():
+            label = fig['id'] if fmt == 'png' else f"{fig['id']} ({fmt})"
+            if not os.path.exists(output_path):
+                missing.append(label)
+                print(f"  MISSING: {fig['figure_number']} — {output_path}")
+            elif os.path.getsize(output_path) == 0:
+                empty.append(label)
+                print(f"  EMPTY:   {fig['figure_number']} — {output_path}")
+            else:
+                size = os.path.getsize(output_path)
+                sizes = f"{size / 1024:6.1f} KB"
+                png_bytes = cache.get(fig['id'], {}).get('png_bytes')
+                # Only trust the record if the file is still the one it describes
+                if fmt == 'png' and png_bytes and png_bytes[1] == size:
+                    sizes = f"{png_bytes[0] / 1024:6.1f} KB -> {sizes}"
+                    png_before += png_bytes[0]
+                    png_after += size
+                print(f"  OK:      {fig['figure_number']:6s}  {label:30s}  {sizes}")
+                ok += 1
 
     print(f"\n{'='*60}")
     print(f"  VERIFICATION RESULTS:")
     print(f"    OK:      {ok}")
     print(f"    Missing: {len(missing)}")
     print(f"    Empty:   {len(empty)}")
+    if png_before:
+        saved = 100 * (png_before - png_after) / png_before
+        print(f"    PNG optimisation: {png_before / 1048576:.2f} MB -> "
+              f"{png_after / 1048576:.2f} MB ({saved:.1f}% smaller)")
     if missing:
         print(f"    Missing IDs: {', '.join(missing)}")
     if empty:
@@ -188,8 +449,185 @@ def list_figures(figures):
     print(f"{'='*70}\n")
 
 
+# ── Render Server ───────────────────────────────────────────────────────
+#
+# A long-lived process that keeps pyplot, the font cache, renderers and
+# parsed YAML warm, so re-rendering one figure skips the cold-start cost.
+# Requests are one per line:
+#   <figure_id>   re-render one figure
+#   topic <N>     re-render a topic (1-7 or TG)
+#   all           re-render every figure
+#   quit          stop the server
+
+SERVER_POLL_SECONDS = 0.5
+
+# Matplotlib is not thread-safe; stdin/socket requests and the file
+# watcher take turns through this lock.
+_render_lock = threading.Lock()
+
+
+def warm_up(formats=('png',), png_level=None):
+    """Import renderers, resolve fonts and parse every data file up front."""
+    from matplotlib import font_manager
+    from tools.graphics.config import FONTS
+
+    _init_worker(formats=formats, png_level=png_level)
+    font_manager.findfont(font_manager.FontProperties(family=FONTS['family']))
+    for data_path in glob.glob(os.path.join(DATA_DIR, '*.yaml')):
+        load_data_file(data_path)
+
+
+def render_for_server(figures, force=True):
+    """Render figures under the server lock. Returns one status line each."""
+    from tools.graphics.base import get_output_formats, get_png_optimization
+
+    formats = get_output_formats()
+    png_level = get_png_optimization()
+    lines = []
+    with _render_lock:
+        cache = load_build_cache(BUILD_CACHE_PATH)
+        for fig in figures:
+            fid = fig['id']
+            fig_hash = compute_figure_hash(fig)
+            if not force and is_up_to_date(fig, fig_hash, cache, formats, png_level):
+                continue
+            start = time.perf_counter()
+            ok, _, result = _run_figure(fig, cached_layout(fig, fig_hash, cache))
+            update_cache_record(cache, fig, fig_hash, ok, result)
+            if ok:
+                lines.append(f"OK {fid} ({time.perf_counter() - start:.2f}s) "
+                             f"{get_output_path(fig, OUTPUT_DIR)}")
+            else:
+                lines.append(f"FAILED {fid}")
+        save_build_cache(BUILD_CACHE_PATH, cache)
+    return lines
+
+
+def handle_request(line):
+    """Dispatch one request line. Returns response lines, or None to quit."""
+    request = line.strip()
+    if not request:
+        return []
+    if request == 'quit':
+        return None
+
+    figures = load_manifest(MANIFEST_PATH)
+    if request == 'all':
+        selected = figures
+    elif request.startswith('topic '):
+        topic = _parse_topic(request.split(None, 1)[1])
+        selected = filter_figures(figures, topic=topic)
+    else:
+        selected = filter_figures(figures, figure_id=request)
+
+    if not selected:
+        return [f"ERROR no figures match '{request}'"]
+    return render_for_server(selected)
+
+
+def _watch_data_files(stop_event):
+    """Re-render figures whose data YAML (or the manifest) changes on disk."""
+    def snapshot():
+        return {path: os.stat(path).st_mtime_ns
+                for path in glob.glob(os.path.join(DATA_DIR, '*.yaml'))}
+
+    seen = snapshot()
+    while not stop_event.wait(SERVER_POLL_SECONDS):
+        current = snapshot()
+        changed = {os.path.basename(path) for path, mtime in current.items()
+                   if seen.get(path) != mtime}
+        seen = current
+        if not changed:
+            continue
+
+        figures = load_manifest(MANIFEST_PATH)
+        if os.path.basename(MANIFEST_PATH) not in changed:
+            figures = [f for f in figures if f.get('data_file') in changed]
+        # The build cache limits this to figures whose content really changed
+        for status in render_for_server(figures, force=False):
+            print(f"  [watch] {status}", flush=True)
+
+
+class _RenderRequestHandler(socketserver.StreamRequestHandler):
+    """Serve newline-delimited requests; each response ends with 'DONE'."""
+
+    def handle(self):
+        for raw in self.rfile:
+            lines = handle_request(raw.decode('utf-8', 'replace'))
+            if lines is None:
+                self.wfile.write(b'BYE\n')
+                threading.Thread(target=self.server.shutdown).start()
+                return
+            for status in lines + ['DONE']:
+                self.wfile.write(status.encode('utf-8') + b'\n')
+
+
+def serve(socket_path=None, watch=False, formats=('png',), png_level=None):
+    """Run the render server on stdin or a Unix socket until 'quit'."""
+    start = time.perf_counter()
+    warm_up(formats, png_level)
+    print(f"  Render server warm ({time.perf_counter() - start:.1f}s).", flush=True)
+
+    stop_event = threading.Event()
+    if watch:
+        watcher = threading.Thread(target=_watch_data_files,
+                                   args=(stop_event,), daemon=True)
+        watcher.start()
+        print(f"  Watching {DATA_DIR}/*.yaml for changes.", flush=True)
+
+    try:
+        if socket_path:
+            if not hasattr(socketserver, 'UnixStreamServer'):
+                print("ERROR: Unix sockets are not available on this platform; "
+                      "omit --socket to read requests from stdin.")
+                sys.exit(1)
+            if os.path.exists(socket_path):
+                os.remove(socket_path)
+            with socketserver.UnixStreamServer(socket_path,
+                                               _RenderRequestHandler) as server:
+                print(f"  Listening on {socket_path}", flush=True)
+                server.serve_forever()
+            os.remove(socket_path)
+        else:
+            print("  READY: enter a figure ID, 'topic N', 'all' or 'quit'.",
+                  flush=True)
+            for raw in sys.stdin:
+                lines = handle_request(raw)
+                if lines is None:
+                    break
+                for status in lines:
+                    print(f"  {status}", flush=True)
+            else:
+                # stdin closed: keep watching until interrupted
+                if watch:
+                    while True:
+                        time.sleep(SERVER_POLL_SECONDS)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stop_event.set()
+
+
 # ── CLI ─────────────────────────────────────────────────────────────────
 
+def _parse_formats(value):
+    """Parse --formats: comma-separated, PNG always included and first."""
+    formats = ['png']
+    for fmt in value.lower().split(','):
+        fmt = fmt.strip().lstrip('.')
+        if fmt and fmt not in formats:
+            formats.append(fmt)
+    return formats
+
+
+def _parse_topic(value):
+    """Topic selector: an int topic number, or a string like 'TG'."""
+    try:
+        return int(value)
+    except ValueError:
+        return value
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Generate course graphics from YAML data files.')
@@ -205,6 +643,29 @@ def main():
                         help='Regenerate MANIFEST.md')
     parser.add_argument('--validate', action='store_true',
                         help='Validate manifest for errors')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help='Worker processes for rendering (0 = one per CPU core)')
+    parser.add_argument('--force', action='store_true',
+                        help='Re-render figures even if unchanged since last build')
+    parser.add_argument('--profile', action='store_true',
+                        help='Record per-figure phase timings and peak RSS '
+                             '(implies --force)')
+    parser.add_argument('--formats', type=str, default='png',
+                        help='Output formats, comma-separated: png,svg,pdf '
+                             '(PNG is always written)')
+    parser.add_argument('--optimize-png', action='store_true',
+                        help='Losslessly recompress PNGs after rendering '
+                             '(drop opaque alpha, palette when <=256 colours, '
+                             'strip metadata)')
+    parser.add_argument('--png-level', type=int, default=DEFAULT_PNG_LEVEL,
+                        help=f'zlib level for --optimize-png, 0-9 '
+                             f'(default: {DEFAULT_PNG_LEVEL})')
+    parser.add_argument('--serve', action='store_true',
+                        help='Run a warm render server reading figure IDs from stdin')
+    parser.add_argument('--socket', type=str, default=None,
+                        help='With --serve, listen on this Unix socket instead of stdin')
+    parser.add_argument('--watch', action='store_true',
+                        help='With --serve, re-render figures when data YAML changes')
 
     args = parser.parse_args()
 
@@ -213,6 +674,26 @@ def main():
         print(f"ERROR: Manifest not found at {MANIFEST_PATH}")
         sys.exit(1)
 
+    from tools.graphics.base import OUTPUT_FORMATS
+
+    formats = _parse_formats(args.formats)
+    unknown = [f for f in formats if f not in OUTPUT_FORMATS]
+    if unknown:
+        print(f"ERROR: Unsupported format(s): {', '.join(unknown)} "
+              f"(choose from {', '.join(OUTPUT_FORMATS)})")
+        sys.exit(1)
+
+    png_level = args.png_level if args.optimize_png else None
+    if not 0 <= args.png_level <= 9:
+        print(f"ERROR: --png-level must be 0-9, got {args.png_level}")
+        sys.exit(1)
+
+    # Server mode
+    if args.serve:
+        serve(socket_path=args.socket, watch=args.watch, formats=formats,
+              png_level=png_level)
+        return
+
     figures = load_manifest(MANIFEST_PATH)
     print(f"  Loaded {len(figures)} figures from manifest.")
 
@@ -240,22 +721,21 @@ def main():
             sys.exit(1)
     elif args.topic:
         # Parse topic: could be int or 'TG'
-        try:
-            topic_val = int(args.topic)
-        except ValueError:
-            topic_val = args.topic
-        figures = filter_figures(figures, topic=topic_val)
+        figures = filter_figures(figures, topic=_parse_topic(args.topic))
         if not figures:
             print(f"ERROR: No figures found for topic '{args.topic}'")
             sys.exit(1)
 
     # Verify mode
     if args.verify:
-        all_ok = verify_outputs(figures)
+        all_ok = verify_outputs(figures, formats)
         sys.exit(0 if all_ok else 1)
 
     # Generate
-    success, failed = generate_all(figures)
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    success, failed = generate_all(figures, jobs=jobs, force=args.force,
+                                   profile=args.profile, formats=formats,
+                                   png_level=png_level)
 
     # Auto-generate MANIFEST.md
     if args.manifest_md or (not args.id and not failed):
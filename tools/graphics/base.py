@@ -3,20 +3,104 @@ Base Figure Utilities
 ======================
 Creates figures with GCU-compliant labeling, provides save and text utilities.
 All renderers use these functions.
+
+Figures are pooled: one template (figure, canvas, title texts, content
+axes) is kept per page shape and reset between renders in the same
+process, instead of building a new pyplot figure for every graphic.
 """
 
+import os
 import textwrap
 import matplotlib
 matplotlib.use('Agg')  # Non-interactive backend for PNG generation
-import matplotlib.pyplot as plt
 import matplotlib.patches as patches
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.transforms import Bbox
 from tools.graphics.config import COLORS, FONTS, FIGURE
+from tools.graphics import profiling
+from tools.graphics.optimize import optimize_png
+
+SAVE_PAD_INCHES = 0.3
+OUTPUT_FORMATS = ('png', 'svg', 'pdf')
+
+# Formats written by save_figure(); the renderer's path names the PNG
+_output_formats = ['png']
+
+# Pooled figure templates: (width, height) -> _FigureTemplate
+_figure_pool = {}
+
+# Tight bbox for the figure being rendered: 'hint' is a previously measured
+# value supplied by the generator, 'used' is what save_figure() applied.
+_layout = {'hint': None, 'used': None}
+
+# Lossless PNG recompression: zlib 'level' (None = off) and the
+# (before, after) byte counts from the last save_figure()
+_png_optimization = {'level': None, 'bytes': None}
+
+
+class _FigureTemplate:
+    """A reusable figure with its title artists and content axes."""
+
+    def __init__(self, width, height):
+        self.fig = Figure(figsize=(width, height), dpi=FIGURE['dpi'],
+                          facecolor=FIGURE['bg_color'])
+        FigureCanvasAgg(self.fig)
+
+        # Title area at top
+        title_h = FIGURE['title_height']
+        self.number_text = self.fig.text(
+            0.5, 1 - title_h * 0.35, '',
+            ha='center', va='center',
+            fontsize=FONTS['figure_num_size'],
+            fontweight='bold',
+            fontfamily=FONTS['family'],
+            color=COLORS['text'])
+        self.title_text = self.fig.text(
+            0.5, 1 - title_h * 0.70, '',
+            ha='center', va='center',
+            fontsize=FONTS['title_size'],
+            fontstyle='italic',
+            fontfamily=FONTS['family'],
+            color=COLORS['text_secondary'])
+
+        # Content axes below title
+        self.ax_rect = [0.08, 0.06, 0.84, 1 - title_h - 0.08]
+        self.ax = self.fig.add_axes(self.ax_rect)
+
+    def reset(self):
+        """Return the figure to its freshly-created state."""
+        fig = self.fig
+        # Drop anything a renderer attached at figure level
+        for ax in list(fig.axes):
+            if ax is not self.ax:
+                fig.delaxes(ax)
+        for artist in (list(fig.texts) + list(fig.lines) + list(fig.patches)
+                       + list(fig.images) + list(fig.legends)):
+            if artist is not self.number_text and artist is not self.title_text:
+                artist.remove()
+        fig.set_facecolor(FIGURE['bg_color'])
+
+        # cla() leaves aspect, position and spine styling as the last
+        # renderer set them, so restore those explicitly.
+        ax = self.ax
+        ax.clear()
+        ax.set_position(self.ax_rect)
+        ax.set_aspect('auto')
+        ax.set_axis_on()
+        for spine in ax.spines.values():
+            spine.set_visible(True)
+            spine.set_edgecolor(matplotlib.rcParams['axes.edgecolor'])
+            spine.set_linewidth(matplotlib.rcParams['axes.linewidth'])
 
 
 def create_figure(figure_number, title, tall=False):
     """
     Create a matplotlib figure with GCU-compliant title area.
 
+    The figure is taken from the per-shape pool and reset, so callers must
+    finish with save_figure() before creating the next figure.
+
     Args:
         figure_number: str like "3.1" or "TG.5"
         title: str, the figure title (italic)
@@ -28,38 +112,111 @@ def create_figure(figure_number, title, tall=False):
     w = FIGURE['tall_width'] if tall else FIGURE['width']
     h = FIGURE['tall_height'] if tall else FIGURE['height']
 
-    fig = plt.figure(figsize=(w, h), dpi=FIGURE['dpi'],
-                     facecolor=FIGURE['bg_color'])
+    template = _figure_pool.get((w, h))
+    if template is None:
+        template = _FigureTemplate(w, h)
+        _figure_pool[(w, h)] = template
+    else:
+        template.reset()
+
+    template.number_text.set_text(f'Figure {figure_number}')
+    template.title_text.set_text(title)
+    template.ax.set_facecolor(FIGURE['bg_color'])
+
+    return template.fig, template.ax
+
+
+def measure_figure(fig):
+    """
+    Compute the padded tight bounding box (inches) of a finished figure.
+
+    This is the same measurement savefig(bbox_inches='tight') performs;
+    doing it explicitly lets the layout cost be timed separately from the
+    PNG encode.
+    """
+    renderer = fig.canvas.get_renderer()
+    return fig.get_tightbbox(renderer).padded(SAVE_PAD_INCHES)
+
+
+def set_output_formats(formats):
+    """Choose which formats save_figure() writes (subset of OUTPUT_FORMATS)."""
+    unknown = [f for f in formats if f not in OUTPUT_FORMATS]
+    if unknown:
+        raise ValueError(f"Unsupported output format(s): {unknown}. "
+                         f"Available: {list(OUTPUT_FORMATS)}")
+    _output_formats[:] = formats
+
+
+def get_output_formats():
+    """Formats save_figure() currently writes."""
+    return tuple(_output_formats)
 
-    # Title area at top
-    title_h = FIGURE['title_height']
-    fig.text(0.5, 1 - title_h * 0.35, f'Figure {figure_number}',
-             ha='center', va='center',
-             fontsize=FONTS['figure_num_size'],
-             fontweight='bold',
-             fontfamily=FONTS['family'],
-             color=COLORS['text'])
-    fig.text(0.5, 1 - title_h * 0.70, title,
-             ha='center', va='center',
-             fontsize=FONTS['title_size'],
-             fontstyle='italic',
-             fontfamily=FONTS['family'],
-             color=COLORS['text_secondary'])
 
-    # Content axes below title
-    ax = fig.add_axes([0.08, 0.06, 0.84, 1 - title_h - 0.08])
-    ax.set_facecolor(FIGURE['bg_color'])
+def set_png_optimization(level):
+    """Recompress saved PNGs at this zlib level (0-9), or None to disable."""
+    if level is not None and not 0 <= level <= 9:
+        raise ValueError(f"PNG compression level must be 0-9, got {level}")
+    _png_optimization['level'] = level
 
-    return fig, ax
+
+def get_png_optimization():
+    """Current PNG optimisation level, or None if disabled."""
+    return _png_optimization['level']
+
+
+def last_png_bytes():
+    """(before, after) PNG sizes from the last save_figure(), or None."""
+    return _png_optimization['bytes']
+
+
+def set_layout_hint(extents):
+    """
+    Supply the padded tight bbox measured on a previous render of the same
+    figure content, as [x0, y0, x1, y1] in inches (or None to measure).
+
+    Applies to the next save_figure() call only. With a hint the layout
+    measurement is skipped and the PNG is produced in a single draw pass.
+    """
+    _layout['hint'] = extents
+    _layout['used'] = None
+
+
+def last_layout():
+    """Bbox extents [x0, y0, x1, y1] (inches) applied by the last save_figure()."""
+    return _layout['used']
 
 
 def save_figure(fig, filepath):
-    """Save figure to PNG with design system settings."""
-    fig.savefig(filepath, dpi=FIGURE['dpi'],
-                facecolor=fig.get_facecolor(),
-                bbox_inches='tight',
-                pad_inches=0.3)
-    plt.close(fig)
+    """
+    Save figure with design system settings.
+
+    filepath names the PNG; other formats chosen with set_output_formats()
+    are written alongside it (same stem, .svg / .pdf) from the same figure
+    and the same measured bounding box. If set_png_optimization() is on,
+    the PNG is then losslessly recompressed.
+    """
+    hint, _layout['hint'] = _layout['hint'], None
+    if hint is not None:
+        bbox = Bbox.from_extents(*hint)
+    else:
+        with profiling.phase('layout'):
+            bbox = measure_figure(fig)
+    _layout['used'] = [float(v) for v in bbox.extents]
+
+    _png_optimization['bytes'] = None
+    stem = os.path.splitext(filepath)[0]
+    with profiling.phase('save'):
+        for fmt in _output_formats:
+            path = filepath if fmt == 'png' else f'{stem}.{fmt}'
+            fig.savefig(path, format=fmt, dpi=FIGURE['dpi'],
+                        facecolor=fig.get_facecolor(),
+                        bbox_inches=bbox)
+
+    level = _png_optimization['level']
+    if level is not None:
+        with profiling.phase('optimize'):
+            _png_optimization['bytes'] = optimize_png(filepath, level)
+    # Pooled figures stay open; create_figure() resets them for reuse
 
 
 def wrap_text(text, width=20):
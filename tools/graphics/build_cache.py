@@ -0,0 +1,83 @@
+"""
+Build Cache
+============
+Content hashes for incremental figure rebuilds.
+
+Each figure's hash covers its manifest entry, its data-file sub-dict and the
+source of every module that shapes its pixels (design constants, base
+utilities, renderer). A figure whose hash matches the last successful build
+and whose output file still exists does not need to be re-rendered.
+"""
+
+import hashlib
+import json
+import os
+
+CACHE_FILENAME = '.build-cache.json'
+CACHE_VERSION = 1
+
+# Manifest fields that only steer document export, never the rendered pixels
+EXPORT_ONLY_FIELDS = frozenset(['placement'])
+
+# Source file digests: abs path -> (mtime_ns, digest bytes)
+_source_digests = {}
+
+
+def _source_digest(path):
+    """Digest a source file, cached per process until its mtime changes."""
+    key = os.path.abspath(path)
+    mtime = os.stat(key).st_mtime_ns
+    cached = _source_digests.get(key)
+    if cached is None or cached[0] != mtime:
+        with open(key, 'rb') as f:
+            cached = (mtime, hashlib.sha256(f.read()).digest())
+        _source_digests[key] = cached
+    return cached[1]
+
+
+def _canonical(obj):
+    """Serialize YAML-loaded data deterministically for hashing."""
+    return json.dumps(obj, sort_keys=True, default=str,
+                      ensure_ascii=False).encode('utf-8')
+
+
+def figure_hash(figure_entry, figure_data, source_paths):
+    """
+    Hash everything that determines a figure's output.
+
+    Args:
+        figure_entry: manifest dict for the figure
+        figure_data: the figure's sub-dict from its data file
+        source_paths: module files whose source affects rendering
+
+    Returns:
+        hex digest string
+    """
+    h = hashlib.sha256()
+    h.update(_canonical({k: v for k, v in figure_entry.items()
+                         if k not in EXPORT_ONLY_FIELDS}))
+    h.update(_canonical(figure_data))
+    for path in source_paths:
+        h.update(_source_digest(path))
+    return h.hexdigest()
+
+
+def load_build_cache(cache_path):
+    """Load cached figure records ({figure_id: record}). Missing or stale → {}."""
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if data.get('version') != CACHE_VERSION:
+        return {}
+    return data.get('figures', {})
+
+
+def save_build_cache(cache_path, records):
+    """Write figure records atomically so an interrupted run can't corrupt them."""
+    tmp_path = cache_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'version': CACHE_VERSION, 'figures': records},
+                  f, indent=1, sort_keys=True)
+    os.replace(tmp_path, cache_path)
@@ -2,23 +2,58 @@
 Manifest Manager
 =================
 Reads the YAML manifest and provides lookup/validation utilities.
+Per-topic data files are parsed once per process and cached.
 """
 
 import os
 import yaml
 
+# Use the libyaml C loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+
+# Parsed data files: abs path -> (mtime_ns, parsed dict)
+_data_cache = {}
+
+
+def _parse_yaml(path):
+    """Parse a YAML file with the fastest available safe loader."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return yaml.load(f, Loader=_SafeLoader)
+
+
+def load_manifest_document(manifest_path):
+    """Load every section of the master manifest (figures, chapters, tool_guides)."""
+    return _parse_yaml(manifest_path) or {}
+
 
 def load_manifest(manifest_path):
     """Load the master manifest YAML file."""
-    with open(manifest_path, 'r', encoding='utf-8') as f:
-        data = yaml.safe_load(f)
-    return data.get('figures', [])
+    return load_manifest_document(manifest_path).get('figures', [])
 
 
 def load_data_file(data_path):
-    """Load a per-topic YAML data file."""
-    with open(data_path, 'r', encoding='utf-8') as f:
-        return yaml.safe_load(f) or {}
+    """
+    Load a per-topic YAML data file.
+
+    The parsed result is cached per process and only re-read when the file's
+    modification time changes. Callers must treat it as read-only.
+    """
+    key = os.path.abspath(data_path)
+    mtime = os.stat(key).st_mtime_ns
+    cached = _data_cache.get(key)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, _parse_yaml(key) or {})
+        _data_cache[key] = cached
+    return cached[1]
+
+
+def get_figure_data(data_path, figure_id):
+    """Return one figure's sub-dict from a (cached) per-topic data file."""
+    return load_data_file(data_path).get(figure_id, {})
 
 
 def filter_figures(figures, topic=None, figure_id=None):
@@ -30,14 +65,23 @@ def filter_figures(figures, topic=None, figure_id=None):
     return figures
 
 
-def get_output_path(figure_entry, base_output_dir):
-    """Build the full output file path for a figure."""
+def get_output_path(figure_entry, base_output_dir, fmt='png'):
+    """Build the full output file path for a figure in one format."""
     topic = figure_entry.get('topic')
     if topic == 'TG':
         subdir = 'tool-guides'
     else:
         subdir = f'topic-{topic}'
-    return os.path.join(base_output_dir, subdir, figure_entry['filename'])
+    filename = figure_entry['filename']
+    if fmt != 'png':
+        filename = f'{os.path.splitext(filename)[0]}.{fmt}'
+    return os.path.join(base_output_dir, subdir, filename)
+
+
+def get_output_paths(figure_entry, base_output_dir, formats=('png',)):
+    """Build {format: path} for every requested output format of a figure."""
+    return {fmt: get_output_path(figure_entry, base_output_dir, fmt)
+            for fmt in formats}
 
 
 def validate_manifest(figures):
@@ -0,0 +1,134 @@
+"""
+Render Profiling
+=================
+Per-figure phase timers and peak-memory readings for
+generate_graphics.py --profile.
+
+Phases:
+    load    – reading the figure's block from its YAML data file
+    render  – the renderer body (building artists)
+    layout  – measuring text extents / the tight bounding box
+    save    – drawing and encoding the output file(s)
+    optimize – lossless PNG recompression (only with --optimize-png)
+
+Timers are no-ops unless enable() has been called in the current process.
+"""
+
+import sys
+import time
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+PHASES = ('load', 'render', 'layout', 'save', 'optimize')
+
+_enabled = False
+_timings = {}
+
+
+def enable(flag=True):
+    """Turn phase timing on or off for this process."""
+    global _enabled
+    _enabled = flag
+
+
+def is_enabled():
+    return _enabled
+
+
+def reset():
+    """Clear timings before profiling the next figure."""
+    _timings.clear()
+
+
+def record(name, seconds):
+    """Add elapsed seconds to a phase."""
+    if _enabled:
+        _timings[name] = _timings.get(name, 0.0) + seconds
+
+
+@contextmanager
+def phase(name):
+    """Time the enclosed block as part of the named phase."""
+    if not _enabled:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(name, time.perf_counter() - start)
+
+
+def get_timings():
+    """Return a copy of the current figure's phase timings (seconds)."""
+    return {p: _timings.get(p, 0.0) for p in PHASES}
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB, or None if unavailable."""
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports kilobytes, macOS reports bytes
+        divisor = 1024 * 1024 if sys.platform == 'darwin' else 1024
+        return round(peak / divisor, 1)
+    try:
+        import psutil
+    except ImportError:
+        return None
+    info = psutil.Process().memory_info()
+    return round(getattr(info, 'peak_wset', info.rss) / (1024 * 1024), 1)
+
+
+# ── Reports ──────────────────────────────────────────────────────────────
+
+def summarize_by_renderer(records):
+    """Roll per-figure records up into per-renderer totals and means."""
+    groups = {}
+    for rec in records:
+        groups.setdefault(rec['renderer'], []).append(rec)
+
+    summary = []
+    for name, recs in groups.items():
+        total = sum(r['total'] for r in recs)
+        row = {
+            'renderer': name,
+            'figures': len(recs),
+            'total': round(total, 4),
+            'mean': round(total / len(recs), 4),
+        }
+        for p in PHASES:
+            row[p] = round(sum(r[p] for r in recs), 4)
+        rss = [r['peak_rss_mb'] for r in recs if r['peak_rss_mb'] is not None]
+        row['peak_rss_mb'] = max(rss) if rss else None
+        summary.append(row)
+
+    summary.sort(key=lambda row: row['total'], reverse=True)
+    return summary
+
+
+def write_profile(records, json_path, csv_path):
+    """Write per-figure records (CSV) and records plus rollups (JSON)."""
+    import csv
+    import json
+    from datetime import datetime
+
+    summary = summarize_by_renderer(records)
+    with open(json_path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'generated': datetime.now().isoformat(timespec='seconds'),
+            'figures': records,
+            'renderers': summary,
+        }, f, indent=2)
+
+    fields = ['id', 'figure_number', 'renderer', 'style', 'ok',
+              *PHASES, 'total', 'peak_rss_mb']
+    with open(csv_path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(records)
+
+    return summary
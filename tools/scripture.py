@@ -0,0 +1,132 @@
+"""
+Scripture Reference Matcher
+============================
+One definition of what a scripture reference is, shared by gcu_audit.py,
+gcu_fix.py and content_scorecard.py.
+
+A reference is a canonical book name (or an alias such as "Psalm"), then
+chapter:verse with optional ranges and lists:
+
+    John 3:16    1 Peter 4:10    Proverbs 3:5-6    Psalm 23:1, 4
+
+Book names are matched case-sensitively and must not follow a letter or
+digit. Chapter-only mentions ("Job 3", "Mark 2") are not references: in
+this content they are far more often ordinary words than citations.
+
+The 67 names are compiled once into a single trie-ordered alternation.
+Names that share a prefix share one branch (1 C(?:hronicles|orinthians)),
+so a failed match is rejected after a character or two instead of after
+trying every name in turn.
+"""
+
+import re
+from collections import namedtuple
+
+BIBLE_BOOKS = [
+    "Genesis", "Exodus", "Leviticus", "Numbers", "Deuteronomy",
+    "Joshua", "Judges", "Ruth", "1 Samuel", "2 Samuel",
+    "1 Kings", "2 Kings", "1 Chronicles", "2 Chronicles",
+    "Ezra", "Nehemiah", "Esther", "Job", "Psalms",
+    "Proverbs", "Ecclesiastes", "Song of Solomon", "Isaiah",
+    "Jeremiah", "Lamentations", "Ezekiel", "Daniel", "Hosea",
+    "Joel", "Amos", "Obadiah", "Jonah", "Micah", "Nahum",
+    "Habakkuk", "Zephaniah", "Haggai", "Zechariah", "Malachi",
+    "Matthew", "Mark", "Luke", "John", "Acts", "Romans",
+    "1 Corinthians", "2 Corinthians", "Galatians", "Ephesians",
+    "Philippians", "Colossians", "1 Thessalonians", "2 Thessalonians",
+    "1 Timothy", "2 Timothy", "Titus", "Philemon", "Hebrews",
+    "James", "1 Peter", "2 Peter", "1 John", "2 John", "3 John",
+    "Jude", "Revelation",
+]
+
+# Other spellings, mapped to the canonical name
+BOOK_ALIASES = {
+    "Psalm": "Psalms",
+}
+
+TRANSLATIONS = [
+    "NIV", "ESV", "KJV", "NKJV", "NLT", "NASB", "CSB", "RSV", "NRSV",
+    "New International Version", "English Standard Version",
+]
+
+# How far around a reference a translation may appear and still apply to it
+TRANSLATION_BEFORE = 5
+TRANSLATION_AFTER = 40
+
+# book: canonical name; chapter: int; verses: normalized verse list
+# ("5-6", "1,4"); text/start/end: the matched source; translation: the
+# translation named next to the reference, or None
+ScriptureRef = namedtuple("ScriptureRef", [
+    "book", "chapter", "verses", "text", "start", "end", "translation",
+])
+
+
+def _trie_pattern(words):
+    """Regex alternation for words, with shared prefixes factored out."""
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node):
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        # A word ends here: the rest is optional (greedy, so longest first)
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+# No lookbehind for the "not after a letter or digit" rule: it would stop
+# re from skipping ahead to the possible first characters. find_refs()
+# checks the preceding character instead.
+SCRIPTURE_RE = re.compile(
+    rf"(?P<book>{_trie_pattern(BIBLE_BOOKS + list(BOOK_ALIASES))})"
+    r"\s+(?P<chapter>\d+)"
+    r":(?P<verses>\d+(?:\s*[-–]\s*\d+)?(?:\s*,\s*\d+(?:\s*[-–]\s*\d+)?)*)"
+)
+
+# Any case: "(niv)" names a translation as much as "(NIV)" does
+TRANSLATION_RE = re.compile(rf"\b(?:{'|'.join(re.escape(t) for t in TRANSLATIONS)})\b",
+                            re.IGNORECASE)
+
+_VERSE_SPACE_RE = re.compile(r"\s+")
+
+
+def label(ref):
+    """Normalized citation text, e.g. 'Psalms 23:1,4'."""
+    return f"{ref.book} {ref.chapter}:{ref.verses}"
+
+
+def find_refs(text):
+    """
+    Scripture references in text, in order.
+
+    Positions are offsets into text. Pass one line at a time to keep the
+    translation lookup from reaching into neighbouring lines.
+    """
+    refs = []
+    pos = 0
+    while True:
+        m = SCRIPTURE_RE.search(text, pos)
+        if m is None:
+            break
+        if m.start() and text[m.start() - 1].isalnum():
+            # "X1 John 3:16" is no reference, but "John 3:16" inside it is
+            pos = m.start() + 1
+            continue
+        pos = m.end()
+        window = text[max(0, m.start() - TRANSLATION_BEFORE):m.end() + TRANSLATION_AFTER]
+        translation = TRANSLATION_RE.search(window)
+        book = m.group("book")
+        verses = _VERSE_SPACE_RE.sub("", m.group("verses")).replace("–", "-")
+        refs.append(ScriptureRef(
+            BOOK_ALIASES.get(book, book), int(m.group("chapter")), verses,
+            m.group(0), m.start(), m.end(),
+            translation.group(0) if translation else None,
+        ))
+    return refs
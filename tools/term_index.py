@@ -0,0 +1,128 @@
+"""
+Key Term Index
+===============
+Locate every key term in a chapter's body in one pass, for the audit's
+"Key Terms Bolded on First Use" check.
+
+Checking terms one at a time costs a scan of the body per term (several,
+with the bold and case-insensitive variants). TermIndex instead builds an
+Aho-Corasick automaton over all the patterns a check needs -- each term,
+plain and wrapped in ** -- and runs it over the lower-cased body once.
+Multi-word terms are resolved against the body's bold phrases through an
+inverted index from word to the phrases containing it.
+
+    index = TermIndex(terms, body, bold_phrases)
+    index.bolded(term)            **term** appears (any case)
+    index.in_bold_phrase(term)    every word of term is in one bold phrase
+    index.mentioned(term)         term appears at all (any case)
+
+The automaton runs in C when pyahocorasick is installed
+(pip install pyahocorasick), and in pure Python otherwise.
+"""
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+class Automaton:
+    """Aho-Corasick automaton reporting which of a set of strings occur in a text."""
+
+    def __init__(self, patterns):
+        self._native = None
+        if ahocorasick is not None:
+            if patterns:
+                self._native = ahocorasick.Automaton()
+                for pattern in patterns:
+                    self._native.add_word(pattern, pattern)
+                self._native.make_automaton()
+            return
+
+        # Trie: goto[state] maps a character to the next state; out[state]
+        # holds the patterns that end there (extended along fail links below)
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [set()]
+        for pattern in patterns:
+            state = 0
+            for ch in pattern:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(set())
+                state = nxt
+            self._out[state].add(pattern)
+
+        # Breadth-first: a state's fail link is the longest proper suffix of
+        # its string that is also a trie path
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                self._out[nxt] |= self._out[self._fail[nxt]]
+
+    def found(self, text):
+        """The set of patterns occurring anywhere in text."""
+        if ahocorasick is not None:
+            if self._native is None:
+                return set()
+            return {pattern for _, pattern in self._native.iter(text)}
+
+        goto, fail, out = self._goto, self._fail, self._out
+        found = set()
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                found |= out[state]
+        return found
+
+
+class TermIndex:
+    """Where a file's key terms occur in its body, found in one scan."""
+
+    def __init__(self, terms, body, bold_phrases):
+        """
+        Args:
+            terms: key terms from the Key Terms section
+            body: body text
+            bold_phrases: **bold** spans in the body
+        """
+        lowered = {term.lower() for term in terms}
+        patterns = lowered | {f"**{term}**" for term in lowered}
+        self._found = Automaton(patterns).found(body.lower())
+
+        # word -> indexes of the bold phrases it occurs in (as a substring)
+        words = {w for term in lowered for w in term.split()}
+        self._phrases_with = {w: set() for w in words}
+        if words:
+            word_automaton = Automaton(words)
+            for i, phrase in enumerate(bold_phrases):
+                for w in word_automaton.found(phrase.lower()):
+                    self._phrases_with[w].add(i)
+
+    def bolded(self, term):
+        """Whether **term** occurs in the body, ignoring case."""
+        return f"**{term.lower()}**" in self._found
+
+    def in_bold_phrase(self, term):
+        """Whether one bold phrase contains every word of term, ignoring case."""
+        words = term.lower().split()
+        phrases = set(self._phrases_with[words[0]])
+        for w in words[1:]:
+            phrases &= self._phrases_with[w]
+        return bool(phrases)
+
+    def mentioned(self, term):
+        """Whether term occurs anywhere in the body, ignoring case."""
+        return term.lower() in self._found